@@ -37,6 +37,7 @@ DEFAULT_EVICTION_POLICY = "discard"
 DEFAULT_PREEMPT_AGE = "24h"
 DEFAULT_PREEMPT_INTERVAL = "10m"
 DEFAULT_VALIDATION_TIMEOUT = "10s"
+DEFAULT_VALIDATION_MAX_CONCURRENCY = 16
 DEFAULT_SHUTDOWN_TIMEOUT = "5s"
 DEFAULT_ENABLE_SEMANTIC_SEARCH = True
 DEFAULT_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
@@ -69,6 +70,7 @@ ENV_FIELD_MAP = {
     "preempt_age": f"{ENV_PREFIX}PREEMPT_AGE",
     "preempt_interval": f"{ENV_PREFIX}PREEMPT_INTERVAL",
     "validation_request_timeout": f"{ENV_PREFIX}VALIDATION_TIMEOUT",
+    "validation_max_concurrency": f"{ENV_PREFIX}VALIDATION_MAX_CONCURRENCY",
     "shutdown_timeout": f"{ENV_PREFIX}SHUTDOWN_TIMEOUT",
     "embedding_model": f"{ENV_PREFIX}EMBEDDING_MODEL",
     "embedding_device": f"{ENV_PREFIX}EMBEDDING_DEVICE",
@@ -100,6 +102,7 @@ DEFAULT_VALUES: dict[str, Any] = {
     "preempt_age": DEFAULT_PREEMPT_AGE,
     "preempt_interval": DEFAULT_PREEMPT_INTERVAL,
     "validation_request_timeout": DEFAULT_VALIDATION_TIMEOUT,
+    "validation_max_concurrency": DEFAULT_VALIDATION_MAX_CONCURRENCY,
     "shutdown_timeout": DEFAULT_SHUTDOWN_TIMEOUT,
     "embedding_model": DEFAULT_EMBEDDING_MODEL,
     "embedding_device": DEFAULT_EMBEDDING_DEVICE,
@@ -142,6 +145,7 @@ class Config:
     embedding_model: str
     embedding_device: str
     embedding_batch_size: int
+    validation_max_concurrency: int = DEFAULT_VALIDATION_MAX_CONCURRENCY
     config_file: Path | None = None
 
 
@@ -326,6 +330,12 @@ def _build_arg_parser() -> argparse.ArgumentParser:
         metavar="DURATION",
         help="Timeout for scratch-validate requests (default: 10s).",
     )
+    parser.add_argument(
+        "--validation-max-concurrency",
+        dest="validation_max_concurrency",
+        metavar="INT",
+        help=f"Maximum cells validated in parallel per request (default: {DEFAULT_VALIDATION_MAX_CONCURRENCY}).",
+    )
     parser.add_argument("--shutdown-timeout", dest="shutdown_timeout", metavar="DURATION", help="Graceful shutdown timeout (default: 5s).")
     parser.add_argument("--embedding-model", dest="embedding_model", metavar="NAME", help=f"Embedding model identifier (default: {DEFAULT_EMBEDDING_MODEL}).")
     parser.add_argument("--embedding-device", dest="embedding_device", metavar="DEVICE", help=f"Embedding device (default: {DEFAULT_EMBEDDING_DEVICE}).")
@@ -410,6 +420,11 @@ def _normalize_values(values: Mapping[str, Any], config_path_value: str | Path |
         default_unit="s",
         field="validation_request_timeout",
     )
+    validation_max_concurrency = _parse_int(
+        values.get("validation_max_concurrency", DEFAULT_VALUES["validation_max_concurrency"]),
+        field="validation_max_concurrency",
+        minimum=1,
+    )
     shutdown_timeout = _parse_duration(values.get("shutdown_timeout", DEFAULT_VALUES["shutdown_timeout"]), default_unit="s", field="shutdown_timeout")
     embedding_model = str(values.get("embedding_model", DEFAULT_VALUES["embedding_model"]))
     embedding_device = str(values.get("embedding_device", DEFAULT_VALUES["embedding_device"]))
@@ -451,6 +466,7 @@ def _normalize_values(values: Mapping[str, Any], config_path_value: str | Path |
         preempt_age=preempt_age,
         preempt_interval=preempt_interval,
         validation_request_timeout=validation_timeout,
+        validation_max_concurrency=validation_max_concurrency,
         shutdown_timeout=shutdown_timeout,
         embedding_model=embedding_model,
         embedding_device=embedding_device,
@@ -511,6 +527,7 @@ def _serialize_config(config: Config) -> dict[str, Any]:
         "preempt_age": _format_duration(config.preempt_age, preferred_unit="h"),
         "preempt_interval": _format_duration(config.preempt_interval, preferred_unit="m"),
         "validation_request_timeout": _format_duration(config.validation_request_timeout, preferred_unit="s"),
+        "validation_max_concurrency": config.validation_max_concurrency,
         "shutdown_timeout": _format_duration(config.shutdown_timeout, preferred_unit="s"),
         "embedding_model": config.embedding_model,
         "embedding_device": config.embedding_device,
@@ -13,9 +13,12 @@ LOGGER = get_logger(__name__)
 
 
 class PreemptiveSweeper:
-    """Background worker that applies the preempt eviction policy."""
+    """Background worker that persists read access times and applies the preempt eviction policy.
 
-    def __init__(self, storage: Storage, *, age: timedelta, interval: timedelta) -> None:
+    With ``age`` set to ``None`` it only persists access times.
+    """
+
+    def __init__(self, storage: Storage, *, age: timedelta | None, interval: timedelta) -> None:
         self._storage = storage
         self._age = age
         minimum_interval = max(interval.total_seconds(), 0.1)
@@ -44,6 +47,9 @@ class PreemptiveSweeper:
     def _run(self) -> None:
         while not self._stop_event.wait(self._interval.total_seconds()):
             try:
+                self._storage.flush_access_times()
+                if self._age is None:
+                    continue
                 evicted = self._storage.evict_stale(self._age)
                 if evicted:
                     LOGGER.info(
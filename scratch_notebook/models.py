@@ -141,6 +141,17 @@ class ScratchCell:
             payload["metadata"] = dict(self.metadata)
         return payload
 
+    def equivalent_to(self, other: "ScratchCell") -> bool:
+        """Return True when ``other`` carries the same content, flags, schema, and metadata."""
+
+        return (
+            self.language == other.language
+            and self.content == other.content
+            and self.validate == other.validate
+            and self.json_schema == other.json_schema
+            and self.metadata == other.metadata
+        )
+
     @classmethod
     def from_dict(cls, payload: Mapping[str, Any]) -> "ScratchCell":
         metadata = _normalize_cell_metadata(payload.get("metadata"))
@@ -377,16 +388,28 @@ class ValidationResult:
             payload["code"] = code
         self.warnings.append(payload)
 
-    def to_dict(self) -> dict[str, Any]:
+    def to_dict(self, *, copy: bool = True) -> dict[str, Any]:
+        """Return a JSON-ready mapping.
+
+        ``copy=False`` shares the diagnostic containers instead of copying them; use it
+        only when the result is serialised immediately and not mutated afterwards.
+        """
+
         payload = {
             "cell_index": self.cell_index,
             "language": self.language,
             "valid": self.valid,
-            "errors": list(self.errors),
-            "warnings": list(self.warnings),
+            "errors": list(self.errors) if copy else self.errors,
+            "warnings": list(self.warnings) if copy else self.warnings,
         }
         if self.cell_id is not None:
             payload["cell_id"] = self.cell_id
         if self.details:
-            payload["details"] = dict(self.details)
+            payload["details"] = dict(self.details) if copy else self.details
         return payload
+
+
+def validation_payload(results: Iterable[ValidationResult]) -> list[dict[str, Any]]:
+    """Serialise validation results for a tool response without copying diagnostics."""
+
+    return [result.to_dict(copy=False) for result in results]
@@ -2,8 +2,11 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
+import math
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Sequence
+from typing import Any, Hashable, Sequence
 
 from .config import Config
 from .errors import CONFIG_ERROR, ScratchNotebookError
@@ -13,6 +16,16 @@ from .storage_lancedb import ScratchpadSnapshot, Storage
 
 LOGGER = get_logger(__name__)
 
+QUERY_CACHE_SIMILARITY_THRESHOLD = 0.92
+QUERY_CACHE_TTL_SECONDS = 600.0
+QUERY_CACHE_MAX_ENTRIES = 256
+
+
+def is_searchable(cell: ScratchCell) -> bool:
+    """Return False for cells whose metadata opts them out of semantic indexing."""
+
+    return cell.metadata.get("searchable", True) is not False
+
 
 @dataclass(slots=True)
 class EmbeddingDocument:
@@ -27,6 +40,112 @@ class EmbeddingDocument:
     summary: str | None
 
 
+@dataclass(slots=True)
+class _CachedQuery:
+    query: str
+    vector: list[float]
+    response: dict[str, Any]
+    stored_at: float
+
+
+def _unit_vector(vector: Sequence[float]) -> list[float]:
+    norm = math.sqrt(sum(value * value for value in vector))
+    if norm == 0.0:
+        return [0.0 for _ in vector]
+    return [value / norm for value in vector]
+
+
+def _copy_response(response: dict[str, Any]) -> dict[str, Any]:
+    copied = dict(response)
+    copied["hits"] = [dict(hit) for hit in response.get("hits", [])]
+    return copied
+
+
+def _empty_search_response(embedder: str) -> dict[str, Any]:
+    return {"ok": True, "hits": [], "embedder": embedder}
+
+
+class SemanticQueryCache:
+    """Reuse recent search responses for identical or paraphrased queries.
+
+    Entries are grouped by a bucket key describing the search scope (tenant, filters,
+    limit) so that differently filtered searches never share results. The whole cache
+    is dropped whenever the storage embeddings generation changes.
+    """
+
+    def __init__(
+        self,
+        *,
+        threshold: float = QUERY_CACHE_SIMILARITY_THRESHOLD,
+        ttl_seconds: float = QUERY_CACHE_TTL_SECONDS,
+        max_entries: int = QUERY_CACHE_MAX_ENTRIES,
+    ) -> None:
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._generation: int | None = None
+        self._entries: OrderedDict[tuple[Hashable, str], _CachedQuery] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def sync_generation(self, generation: int) -> None:
+        if generation != self._generation:
+            self._entries.clear()
+            self._generation = generation
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def lookup_exact(self, bucket: Hashable, query: str) -> dict[str, Any] | None:
+        key = (bucket, query)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if self._is_expired(entry, time.monotonic()):
+            self._entries.pop(key, None)
+            return None
+        self._entries.move_to_end(key)
+        return _copy_response(entry.response)
+
+    def lookup_similar(self, bucket: Hashable, vector: Sequence[float]) -> dict[str, Any] | None:
+        unit = _unit_vector(vector)
+        now = time.monotonic()
+        best_key: tuple[Hashable, str] | None = None
+        best_score = self.threshold
+        for key, entry in list(self._entries.items()):
+            if self._is_expired(entry, now):
+                self._entries.pop(key, None)
+                continue
+            if key[0] != bucket or len(entry.vector) != len(unit):
+                continue
+            score = sum(left * right for left, right in zip(unit, entry.vector))
+            if score >= best_score:
+                best_key = key
+                best_score = score
+        if best_key is None:
+            return None
+        self._entries.move_to_end(best_key)
+        return _copy_response(self._entries[best_key].response)
+
+    def store(self, bucket: Hashable, query: str, vector: Sequence[float], response: dict[str, Any]) -> None:
+        if self.max_entries <= 0:
+            return
+        key = (bucket, query)
+        self._entries[key] = _CachedQuery(
+            query=query,
+            vector=_unit_vector(vector),
+            response=_copy_response(response),
+            stored_at=time.monotonic(),
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _is_expired(self, entry: _CachedQuery, now: float) -> bool:
+        return self.ttl_seconds > 0 and now - entry.stored_at > self.ttl_seconds
+
+
 class HashingEmbedder:
     name = "debug-hash"
     dimension = 64
@@ -92,11 +211,16 @@ class SearchService:
         self._enabled = config.enable_semantic_search
         self._backend: HashingEmbedder | SentenceTransformerBackend | None = None
         self._backend_lock = asyncio.Lock()
+        self._query_cache = SemanticQueryCache()
 
     @property
     def enabled(self) -> bool:
         return self._enabled
 
+    @property
+    def query_cache(self) -> SemanticQueryCache:
+        return self._query_cache
+
     def _select_backend(self) -> HashingEmbedder | SentenceTransformerBackend:
         model_name = self._config.embedding_model
         if model_name.strip().lower().startswith("debug"):
@@ -117,24 +241,93 @@ class SearchService:
                 self._backend = backend
         return self._backend  # type: ignore[return-value]
 
+    async def embed_batch(self, texts: Sequence[str]) -> list[list[float]]:
+        """Embed all ``texts`` with a single backend call in a worker thread."""
+
+        if not texts:
+            return []
+        backend = await self._get_backend()
+        return await asyncio.to_thread(
+            backend.embed,
+            list(texts),
+            batch_size=self._config.embedding_batch_size,
+            device=self._config.embedding_device,
+        )
+
     async def reindex_pad(self, pad: Scratchpad) -> None:
         if not self._enabled:
             return
+        await self._index_pad(pad, reusable={})
+
+    async def upsert_cell(self, pad: Scratchpad, cell: ScratchCell) -> None:
+        """Index a newly appended cell, reusing stored vectors for untouched cells."""
+
+        if not self._enabled:
+            return
+        searchable = is_searchable(cell)
+        reusable = self._reusable_vectors(
+            pad.scratch_id,
+            dirty_cells={cell.cell_id} if searchable else set(),
+            pad_dirty=searchable,
+        )
+        await self._index_pad(pad, reusable=reusable)
+
+    async def replace_cell(self, pad: Scratchpad, old_cell: ScratchCell, new_cell: ScratchCell) -> None:
+        """Re-embed only the replaced cell (and the pad document when its text changed)."""
+
+        if not self._enabled:
+            return
+        content_changed = old_cell.content.strip() != new_cell.content.strip()
+        position = next((i for i, cell in enumerate(pad.cells) if cell.cell_id == new_cell.cell_id), old_cell.index)
+        # The pad document joins cell contents in order, so a move changes its text even when no
+        # content did; so does a cell flipping its searchable flag. Vectors for cells that became
+        # unsearchable drop out in _index_pad.
+        pad_dirty = (
+            content_changed
+            or position != old_cell.index
+            or is_searchable(old_cell) != is_searchable(new_cell)
+        )
+        dirty_cells = {old_cell.cell_id, new_cell.cell_id} if content_changed else set()
+        reusable = self._reusable_vectors(pad.scratch_id, dirty_cells=dirty_cells, pad_dirty=pad_dirty)
+        await self._index_pad(pad, reusable=reusable)
+
+    def _reusable_vectors(
+        self,
+        scratch_id: str,
+        *,
+        dirty_cells: set[str],
+        pad_dirty: bool,
+    ) -> dict[str | None, list[float]]:
+        reusable: dict[str | None, list[float]] = {}
+        for row in self._storage.list_pad_embeddings(scratch_id, columns=["cell_id", "embedding"]):
+            cell_id = row.get("cell_id")
+            if cell_id is None and pad_dirty:
+                continue
+            if cell_id is not None and cell_id in dirty_cells:
+                continue
+            vector = row.get("embedding")
+            if vector:
+                reusable[cell_id] = list(vector)
+        return reusable
+
+    async def _index_pad(self, pad: Scratchpad, *, reusable: dict[str | None, list[float]]) -> None:
         backend = await self._get_backend()
         documents = self._build_documents(pad)
         if not documents:
             dimension = getattr(backend, "dimension")
             self._storage.replace_embeddings(pad.scratch_id, [], dimension=dimension)
             return
-        texts = [doc.text for doc in documents]
-        vectors = await asyncio.to_thread(
-            backend.embed,
-            texts,
-            batch_size=self._config.embedding_batch_size,
-            device=self._config.embedding_device,
-        )
+        dimension = backend.dimension
+        vectors_by_id: dict[str | None, list[float]] = {
+            key: vector for key, vector in reusable.items() if len(vector) == dimension
+        }
+        pending = [doc for doc in documents if doc.cell_id not in vectors_by_id]
+        if pending:
+            vectors = await self.embed_batch([doc.text for doc in pending])
+            for doc, vector in zip(pending, vectors):
+                vectors_by_id[doc.cell_id] = vector
         records: list[dict[str, Any]] = []
-        for doc, vector in zip(documents, vectors):
+        for doc in documents:
             records.append(
                 {
                     "cell_id": doc.cell_id,
@@ -145,10 +338,10 @@ class SearchService:
                     "description": doc.description,
                     "summary": doc.summary,
                     "snippet": doc.snippet,
-                    "embedding": vector,
+                    "embedding": vectors_by_id[doc.cell_id],
                 }
             )
-        self._storage.replace_embeddings(pad.scratch_id, records, dimension=len(vectors[0]))
+        self._storage.replace_embeddings(pad.scratch_id, records, dimension=len(records[0]["embedding"]))
 
     async def delete_pad_embeddings(self, scratch_id: str) -> None:
         if not self._enabled:
@@ -171,20 +364,43 @@ class SearchService:
             raise ScratchNotebookError(CONFIG_ERROR, "Semantic search is disabled")
         backend = await self._get_backend()
         safe_limit = max(1, min(limit, 50))
-        [query_vector] = await asyncio.to_thread(
-            backend.embed,
-            [query],
-            batch_size=self._config.embedding_batch_size,
-            device=self._config.embedding_device,
-        )
         namespace_filter = {ns.strip() for ns in (namespaces or []) if ns and ns.strip()}
         tag_filter = {tag.strip() for tag in (tags or []) if tag and tag.strip()}
+
+        cache = self._query_cache
+        cache.sync_generation(self._storage.embeddings_generation())
+        bucket = (
+            self._storage.tenant_id(),
+            tuple(sorted(namespace_filter)),
+            tuple(sorted(tag_filter)),
+            safe_limit,
+        )
+        cached = cache.lookup_exact(bucket, query)
+        if cached is not None:
+            return cached
+
+        [query_vector] = await self.embed_batch([query])
+        # Embeddings may have changed while the query was embedded; drop entries from before that.
+        generation = self._storage.embeddings_generation()
+        cache.sync_generation(generation)
+        cached = cache.lookup_similar(bucket, query_vector)
+        if cached is not None:
+            return cached
+
         hits = self._storage.search_embeddings(
             query_vector,
             limit=safe_limit,
             namespaces=namespace_filter or None,
             tags=tag_filter or None,
         )
+        # Only cache results no write has overtaken since the generation was read.
+        cacheable = self._storage.embeddings_generation() == generation
+        backend_name = backend.name if isinstance(backend, SentenceTransformerBackend) else backend.name
+        if not hits:
+            response = _empty_search_response(backend_name)
+            if cacheable:
+                cache.store(bucket, query, query_vector, response)
+            return response
         formatted: list[dict[str, Any]] = []
         for row in hits:
             distance = float(row.get("_distance", 0.0))
@@ -199,8 +415,10 @@ class SearchService:
                     "snippet": row.get("snippet") or "",
                 }
             )
-        backend_name = backend.name if isinstance(backend, SentenceTransformerBackend) else backend.name
-        return {"ok": True, "hits": formatted, "embedder": backend_name}
+        response = {"ok": True, "hits": formatted, "embedder": backend_name}
+        if cacheable:
+            cache.store(bucket, query, query_vector, response)
+        return response
 
     def _build_documents(self, pad: Scratchpad) -> list[EmbeddingDocument]:
         documents: list[EmbeddingDocument] = []
@@ -216,8 +434,9 @@ class SearchService:
             description = raw_description.strip() if isinstance(raw_description, str) else None
             raw_summary = pad.metadata.get("summary")
             summary = raw_summary.strip() if isinstance(raw_summary, str) else None
+        searchable_cells = [cell for cell in pad.cells if is_searchable(cell)]
         pad_text_parts = [part for part in [title, description, summary] if part]
-        for cell in pad.cells:
+        for cell in searchable_cells:
             pad_text_parts.append(cell.content.strip())
         pad_text = "\n".join(filter(None, pad_text_parts))
         pad_snippet = self._build_snippet(pad_text, metadata_parts=[title, description, summary])
@@ -234,7 +453,7 @@ class SearchService:
                 summary=summary,
             )
         )
-        for cell in pad.cells:
+        for cell in searchable_cells:
             documents.append(self._build_cell_document(pad, cell, namespace, pad_tags, title, description, summary))
         return documents
 
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import asyncio
+from contextvars import ContextVar
 from dataclasses import dataclass
 from datetime import timedelta
 from functools import wraps
 from uuid import UUID, uuid4
-from typing import Any, Mapping, Sequence, Callable
+from typing import Any, Awaitable, Mapping, Sequence, Callable
 
 import threading
 import time
@@ -43,9 +44,10 @@ from .models import (
     ValidationResult,
     normalize_schema_registry_entries,
     normalize_tags,
+    validation_payload,
 )
 from .search import SearchService
-from .storage import DEFAULT_TENANT_ID, Storage, StorageError
+from .storage import DEFAULT_TENANT_ID, CellUndo, Storage, StorageError
 from .transports import HttpTransportConfig, run_http, run_stdio
 from .validation import validate_cells
 
@@ -62,6 +64,9 @@ class AppState:
 
 
 APP_STATE: AppState | None = None
+# Tenant resolved once at tool entry so nested get_storage/get_search_service calls skip
+# re-inspecting the MCP context and auth state.
+_REQUEST_TENANT: ContextVar[str | None] = ContextVar("scratch_notebook_request_tenant", default=None)
 _METRICS_ROUTE_NAME = "__scratch_notebook_metrics__"
 
 
@@ -223,14 +228,14 @@ def initialize_app(config: Config) -> None:
             LOGGER.warning("Auth enabled but no tokens configured; tenant migration skipped")
     storage.set_tenant(tenant_id)
     search = SearchService(storage=storage, config=config)
-    sweeper: PreemptiveSweeper | None = None
-    if config.eviction_policy.strip().lower() == "preempt":
-        sweeper = PreemptiveSweeper(
-            storage=storage,
-            age=config.preempt_age,
-            interval=config.preempt_interval,
-        )
-        sweeper.start()
+    # Every policy needs the sweeper to persist read access times; only preempt evicts with it.
+    preempt = config.eviction_policy.strip().lower() == "preempt"
+    sweeper = PreemptiveSweeper(
+        storage=storage,
+        age=config.preempt_age if preempt else None,
+        interval=config.preempt_interval,
+    )
+    sweeper.start()
     metrics.install_registry(metrics.MetricsRegistry())
     if config.enable_auth and config.auth_tokens:
         SERVER.auth = ScratchTokenAuthProvider(config.auth_tokens)
@@ -265,20 +270,31 @@ def shutdown_app() -> None:
     sweeper = APP_STATE.sweeper
     if sweeper:
         sweeper.stop()
+    try:
+        APP_STATE.storage.flush_access_times()
+    except Exception:  # pragma: no cover - best effort during shutdown
+        LOGGER.warning("Failed to persist pending access times during shutdown", exc_info=True)
+    APP_STATE.storage.finish_compaction()
     metrics.install_registry(None)
     _remove_metrics_route()
     SERVER.auth = None
     APP_STATE = None
 
 
+def _resolve_request_tenant(state: AppState, context: Context | None) -> str:
+    tenant = _resolve_tenant_from_context(context)
+    if tenant is None:
+        tenant = _resolve_active_tenant(state.config)
+    return tenant
+
+
 def get_storage(context: Context | None = None) -> Storage:
     if APP_STATE is None:
         raise ScratchNotebookError(CONFIG_ERROR, "Server is not initialised")
     storage = APP_STATE.storage
-    tenant = _resolve_tenant_from_context(context)
-    active_default = _resolve_active_tenant(APP_STATE.config)
+    tenant = _REQUEST_TENANT.get()
     if tenant is None:
-        tenant = active_default
+        tenant = _resolve_request_tenant(APP_STATE, context)
     storage.set_tenant(tenant)
     return storage
 
@@ -308,9 +324,17 @@ def _shutdown_protected(func):
             release = _SHUTDOWN_MANAGER.try_enter()
             if release is None:
                 return failure(ScratchNotebookError(CONFIG_ERROR, "Server is shutting down"))
+            state = APP_STATE
+            token = (
+                _REQUEST_TENANT.set(_resolve_request_tenant(state, kwargs.get("context")))
+                if state is not None
+                else None
+            )
             try:
                 return await func(*args, **kwargs)
             finally:
+                if token is not None:
+                    _REQUEST_TENANT.reset(token)
                 release()
 
         return async_wrapper
@@ -475,6 +499,84 @@ async def _ensure_cell_validation(
     return results
 
 
+async def _start_cell_validation(
+    cell: ScratchCell,
+    *,
+    scratch_id: str | None = None,
+    schemas: Mapping[str, Any] | None = None,
+) -> asyncio.Task[list[ValidationResult]]:
+    """Schedule validation for ``cell`` so it can overlap the storage write that follows.
+
+    Yields once before returning so the task hands its work to a validation thread before
+    the caller blocks on storage.
+    """
+
+    task = asyncio.create_task(_ensure_cell_validation(cell, scratch_id=scratch_id, schemas=schemas))
+    await asyncio.sleep(0)
+    return task
+
+
+def _cancel_cell_validation(task: asyncio.Task[list[ValidationResult]] | None) -> None:
+    if task is not None and not task.done():
+        task.cancel()
+
+
+async def _collect_cell_validation(
+    task: asyncio.Task[list[ValidationResult]] | None,
+    *,
+    storage: Storage,
+    undo: CellUndo | None,
+) -> list[ValidationResult]:
+    """Await a scheduled validation, reverting the write via ``undo`` if validation fails."""
+
+    if task is None:
+        return []
+    try:
+        return await task
+    except BaseException:
+        if undo is not None:
+            storage.apply_undo(undo)
+        raise
+
+
+def _cell_write_response(
+    pad: Scratchpad,
+    validation_results: Sequence[ValidationResult],
+    operation: str,
+) -> dict[str, Any]:
+    payload = _build_response_pad(pad, include_content=False)
+    if validation_results:
+        payload["validation"] = validation_payload(validation_results)
+    response = success(payload)
+    metrics.record_operation(operation)
+    return response
+
+
+async def _reindex_and_respond(
+    storage: Storage,
+    pad: Scratchpad,
+    undo: CellUndo,
+    index_update: Awaitable[None],
+    validation_results: Sequence[ValidationResult],
+    operation: str,
+) -> dict[str, Any]:
+    """Await the search index update for a single-cell write and build its response.
+
+    On indexing failure the write is reverted via ``undo`` and an error response returned.
+    """
+
+    try:
+        await index_update
+    except ScratchNotebookError as exc:
+        storage.apply_undo(undo)
+        return failure(exc)
+    except Exception as exc:  # pragma: no cover - defensive
+        storage.apply_undo(undo)
+        LOGGER.exception("Failed to index scratchpad %s", pad.scratch_id, exc_info=exc)
+        return failure(ScratchNotebookError(INTERNAL_ERROR, "Semantic index failed"))
+    return _cell_write_response(pad, validation_results, operation)
+
+
 def generate_unique_scratch_id(storage: Storage, *, prefix: str = "scratch") -> str:
     """Generate a unique scratchpad identifier avoiding collisions."""
 
@@ -805,7 +907,7 @@ async def _scratch_create_impl(
             return failure(ScratchNotebookError(INTERNAL_ERROR, "Semantic index failed"))
         payload = _build_response_pad(pad, include_content=False)
         if validation_results:
-            payload["validation"] = [result.to_dict() for result in validation_results]
+            payload["validation"] = validation_payload(validation_results)
         evicted_ids = storage.pop_recent_evictions()
         if evicted_ids:
             for victim in evicted_ids:
@@ -885,6 +987,7 @@ async def _scratch_list_impl(
     namespaces: Sequence[str] | None = None,
     tags: Sequence[str] | None = None,
     limit: int | None = None,
+    cursor: str | None = None,
     *,
     context: Context | None = None,
 ) -> dict[str, Any]:
@@ -894,13 +997,21 @@ async def _scratch_list_impl(
         limit_value = _normalize_limit(limit)
     except ScratchNotebookError as exc:
         return failure(exc)
+    if cursor is not None and not isinstance(cursor, str):
+        return failure(ScratchNotebookError(VALIDATION_ERROR, "cursor must be a string"))
 
     storage = get_storage(context)
+    # Fetch one extra entry so we know whether another page follows.
     listing = storage.list_scratchpads(
         namespaces=namespace_filter,
         tags=sorted(tag_filter) if tag_filter else None,
-        limit=limit_value,
+        limit=limit_value + 1 if limit_value is not None else None,
+        cursor=cursor or None,
     )
+    next_cursor: str | None = None
+    if limit_value is not None and len(listing) > limit_value:
+        del listing[limit_value:]
+        next_cursor = listing[-1].get("scratch_id") if listing else None
     sanitized = [
         {
             "scratch_id": entry.get("scratch_id"),
@@ -911,7 +1022,10 @@ async def _scratch_list_impl(
         }
         for entry in listing
     ]
-    response = success({"scratchpads": sanitized})
+    payload: dict[str, Any] = {"scratchpads": sanitized}
+    if next_cursor is not None:
+        payload["next_cursor"] = next_cursor
+    response = success(payload)
     metrics.record_operation("list")
     return response
 
@@ -942,37 +1056,33 @@ async def _scratch_append_cell_impl(
 ) -> dict[str, Any]:
     storage = get_storage(context)
     search = get_search_service(context)
-    validation_results: list[ValidationResult] = []
-    snapshot_state = storage.capture_snapshot(scratch_id)
     try:
         new_cell = _build_cell(cell)
+        validation_task: asyncio.Task[list[ValidationResult]] | None = None
         if new_cell.validate:
             existing_pad = storage.read_scratchpad(scratch_id)
             new_cell.index = len(existing_pad.cells)
             registry = _extract_schema_registry(existing_pad.metadata)
-            validation_results = await _ensure_cell_validation(
+            validation_task = await _start_cell_validation(
                 new_cell,
                 scratch_id=scratch_id,
                 schemas=registry,
             )
-        pad = storage.append_cell(scratch_id, new_cell)
         try:
-            await search.reindex_pad(pad)
-        except ScratchNotebookError as exc:
-            if snapshot_state:
-                storage.restore_snapshot(snapshot_state)
-            return failure(exc)
-        except Exception as exc:  # pragma: no cover - defensive
-            if snapshot_state:
-                storage.restore_snapshot(snapshot_state)
-            LOGGER.exception("Failed to index scratchpad %s", scratch_id, exc_info=exc)
-            return failure(ScratchNotebookError(INTERNAL_ERROR, "Semantic index failed"))
-        payload = _build_response_pad(pad, include_content=False)
-        if validation_results:
-            payload["validation"] = [result.to_dict() for result in validation_results]
-        response = success(payload)
-        metrics.record_operation("append")
-        return response
+            undo = storage.capture_cell_undo(scratch_id, "append", cell_id=new_cell.cell_id)
+            pad = storage.append_cell(scratch_id, new_cell)
+        except BaseException:
+            _cancel_cell_validation(validation_task)
+            raise
+        validation_results = await _collect_cell_validation(validation_task, storage=storage, undo=undo)
+        return await _reindex_and_respond(
+            storage,
+            pad,
+            undo,
+            search.upsert_cell(pad, new_cell),
+            validation_results,
+            "append",
+        )
     except ScratchNotebookError as exc:
         return failure(exc)
 
@@ -989,8 +1099,6 @@ async def _scratch_replace_cell_impl(
 ) -> dict[str, Any]:
     storage = get_storage(context)
     search = get_search_service(context)
-    validation_results: list[ValidationResult] = []
-    snapshot_state = storage.capture_snapshot(scratch_id)
     normalized_id = str(cell_id)
     try:
         current_pad = storage.read_scratchpad(scratch_id)
@@ -1027,36 +1135,45 @@ async def _scratch_replace_cell_impl(
         new_cell.cell_id = existing_cell.cell_id
         if not metadata_supplied:
             new_cell.metadata = dict(existing_cell.metadata)
+        validation_task: asyncio.Task[list[ValidationResult]] | None = None
         if new_cell.validate:
             registry = _extract_schema_registry(current_pad.metadata)
-            validation_results = await _ensure_cell_validation(
+            validation_task = await _start_cell_validation(
                 new_cell,
                 scratch_id=scratch_id,
                 schemas=registry,
             )
-        pad = storage.replace_cell(
-            scratch_id,
-            normalized_id,
-            new_cell,
-            new_index=new_index,
-        )
+        moving = new_index is not None and new_index != existing_cell.index
+        if not moving and new_cell.equivalent_to(existing_cell):
+            # Nothing would change; skip the write and the reindex entirely.
+            validation_results = await _collect_cell_validation(validation_task, storage=storage, undo=None)
+            return _cell_write_response(current_pad, validation_results, "replace")
         try:
-            await search.reindex_pad(pad)
-        except ScratchNotebookError as exc:
-            if snapshot_state:
-                storage.restore_snapshot(snapshot_state)
-            return failure(exc)
-        except Exception as exc:  # pragma: no cover - defensive
-            if snapshot_state:
-                storage.restore_snapshot(snapshot_state)
-            LOGGER.exception("Failed to index scratchpad %s", scratch_id, exc_info=exc)
-            return failure(ScratchNotebookError(INTERNAL_ERROR, "Semantic index failed"))
-        payload = _build_response_pad(pad, include_content=False)
-        if validation_results:
-            payload["validation"] = [result.to_dict() for result in validation_results]
-        response = success(payload)
-        metrics.record_operation("replace")
-        return response
+            undo = storage.capture_cell_undo(
+                scratch_id,
+                "replace",
+                cell_id=existing_cell.cell_id,
+                index=existing_cell.index,
+                cell=existing_cell,
+            )
+            pad = storage.replace_cell(
+                scratch_id,
+                normalized_id,
+                new_cell,
+                new_index=new_index,
+            )
+        except BaseException:
+            _cancel_cell_validation(validation_task)
+            raise
+        validation_results = await _collect_cell_validation(validation_task, storage=storage, undo=undo)
+        return await _reindex_and_respond(
+            storage,
+            pad,
+            undo,
+            search.replace_cell(pad, existing_cell, new_cell),
+            validation_results,
+            "replace",
+        )
     except ScratchNotebookError as exc:
         return failure(exc)
 
@@ -1078,18 +1195,25 @@ async def _scratch_validate_impl(
         return failure(exc)
 
     timeout_seconds: float | None = None
+    max_concurrency: int | None = None
     if APP_STATE is not None:
         timeout_seconds = APP_STATE.config.validation_request_timeout.total_seconds()
+        max_concurrency = APP_STATE.config.validation_max_concurrency
 
     try:
         registry = _extract_schema_registry(pad.metadata)
-        results = await validate_cells(target_cells, timeout=timeout_seconds, schemas=registry)
+        results = await validate_cells(
+            target_cells,
+            timeout=timeout_seconds,
+            schemas=registry,
+            max_concurrency=max_concurrency,
+        )
     except asyncio.TimeoutError:
         return failure(ScratchNotebookError(VALIDATION_TIMEOUT, "Validation timed out"))
     response = success(
         {
             "scratch_id": scratch_id,
-            "results": [result.to_dict() for result in results],
+            "results": validation_payload(results),
         }
     )
     metrics.record_operation("validate")
@@ -1114,320 +1238,6 @@ async def _scratch_search_impl(
         return failure(exc)
 
 
-scratch_create = SERVER.tool(
-    name="scratch_create",
-    description=(
-        "Create or reset a long-lived scratch notebook for your current task. "
-        "Use this as your primary working memory for multi-step work instead of ad-hoc notes: each notebook groups related "
-        "cells (markdown, code, JSON/YAML, text) plus canonical metadata (title, description, optional summary, namespace, tags). "
-        "Provide `scratch_id` only when you must reuse a deterministic identifier; otherwise omit it and the server allocates one. "
-        "Optionally seed the notebook with a `cells` array that follows the `scratch_append_cell` shape so you can atomically create an "
-        "initial plan, goals, or examples. "
-        "Follow up with `scratch_append_cell` to grow the notebook, `scratch_read` to view full content, and `scratch_list_cells` for "
-        "lightweight overviews. "
-        "Call `scratch_namespace_list` before creating a pad to discover or create project-specific namespaces and keep notebooks "
-        "partitioned by project."
-    ),
-)(_scratch_create_impl)
-
-scratch_read = SERVER.tool(
-    name="scratch_read",
-    description=(
-        "Read a scratch notebook by id as part of an ongoing task. Prefer this over generic document fetches whenever you "
-        "need structured cells plus metadata. "
-        "Use the `cell_ids` filter (preferred) when you need explicit cell UUIDs, for example those discovered via "
-        "`scratch_list_cells` or `scratch_search`; this filter applies before tags so you can combine both. Provide `tags` to "
-        "return only cells whose metadata tags intersect the supplied values, and `namespaces` to assert that the pad lives inside "
-        "one of the allowed namespaces (otherwise the call fails with `UNAUTHORIZED`). "
-        "Set `include_metadata=false` when you only need cell payloads; canonical metadata remains available via `scratch_list` or "
-        "a follow-up read. Responses always include indices for ordering context, but `cell_id` remains the sole identifier for "
-        "follow-up edits via `scratch_append_cell` and `scratch_replace_cell`."
-    ),
-)(_scratch_read_impl)
-
-scratch_list_cells = SERVER.tool(
-    name="scratch_list_cells",
-    description=(
-        "List cells for a scratchpad without streaming full content. Use this as your index view: each entry returns `cell_id`, "
-        "index, language, tags, and any stored metadata so you can decide which cells to read or replace. "
-        "Treat `cell_ids` as a filter when you already know the targets (exact UUID matches) and combine with tag filters to "
-        "intersect metadata tags with your selectors. "
-        "Typical workflows: call `scratch_list_cells` after `scratch_create`, `scratch_list`, or `scratch_search` to locate a "
-        "plan, goals, or summary cell, then use `scratch_read` or `scratch_replace_cell` on the chosen `cell_id`."
-    ),
-)(_scratch_list_cells_impl)
-
-scratch_delete = SERVER.tool(
-    name="scratch_delete",
-    description=(
-        "Delete a scratch notebook by id. Use this for short-lived or noisy notebooks that you are confident will not be reused. "
-        "Consider listing candidate pads via `scratch_list` first and preserving notebooks that still provide historical context, "
-        "design decisions, or incident timelines."
-    ),
-)(_scratch_delete_impl)
-
-scratch_list = SERVER.tool(
-    name="scratch_list",
-    description=(
-        "List scratchpads with lean metadata suitable for navigation between notebooks. Each entry returns `scratch_id`, title, "
-        "description, namespace, and `cell_count`. Use this to choose which notebook to open with `scratch_read` or "
-        "`scratch_list_cells`. "
-        "Filter by `namespaces` to stay inside a project, and by `tags` to focus on particular kinds of notebooks (for example "
-        "`design`, `incident`, `research`); use `limit` to cap results when a namespace holds many notebooks."
-    ),
-)(_scratch_list_impl)
-
-scratch_list_tags = SERVER.tool(
-    name="scratch_list_tags",
-    description=(
-        "List scratchpad-level and cell-level tags, optionally filtered by namespace. Use this to discover and standardize the "
-        "tag vocabulary you rely on in `scratch_append_cell`, `scratch_replace_cell`, `scratch_list`, `scratch_list_cells`, "
-        "and `scratch_search`. "
-        "`scratchpad_tags` reflects tags declared on notebook metadata; `cell_tags` aggregates tags discovered on individual cells."
-    ),
-)(_scratch_list_tags_impl)
-
-scratch_append_cell = SERVER.tool(
-    name="scratch_append_cell",
-    description=(
-        "Append a new cell to a scratch notebook. This is the primary way to grow your notebook during a task: provide the target "
-        "`scratch_id`, set `cell.language` and `cell.content`, and store per-cell tags in `cell.metadata.tags` (for example "
-        "`plan`, `hypothesis`, `snippet`, `example`, `summary`). "
-        "Set `cell.validate=true` when you want advisory validation diagnostics returned alongside the updated pad. "
-        "`cell.json_schema` can reference inline schemas or `scratchpad://schemas/<name>` entries managed by `scratch_upsert_schema`; "
-        "missing shared schemas produce warnings rather than blocking writes. "
-        "Responses echo structural data (ids, indices, language, metadata, tags, validation summaries) but omit raw cell content; "
-        "call `scratch_read` whenever you need the full notebook payload."
-    ),
-)(_scratch_append_cell_impl)
-
-scratch_replace_cell = SERVER.tool(
-    name="scratch_replace_cell",
-    description=(
-        "Replace an existing cell by `cell_id` when you want to update or reorder information without losing the surrounding "
-        "notebook context. Use this instead of `scratch_append_cell` when you are refining an existing plan, decision, or example. "
-        "`new_index` lets you move the cell explicitly while keeping indices as ordering metadata only, for example pinning "
-        "goals and summary cells near the top. "
-        "If you omit `metadata` in the replacement payload, the server reuses the previous cell metadata (including tags) so "
-        "replacements keep their classification. "
-        "When `validate` is true, diagnostics are advisory and returned alongside the updated pad just like append operations. "
-        "Responses mirror append and create behavior by returning structural data without cell content; use `scratch_read` to "
-        "inspect the updated payload when needed."
-    ),
-)(_scratch_replace_cell_impl)
-
-scratch_validate = SERVER.tool(
-    name="scratch_validate",
-    description=(
-        "Validate one or more cells within a scratch notebook. Use this for structured content (JSON, YAML, markdown, code) before "
-        "you promote examples or configs into your codebase. "
-        "Pass explicit `cell_ids` to filter the validation target set (for example only cells tagged `example` or `config`); omit "
-        "the filter to re-check every cell in the pad. Validation uses any shared schemas registered via `scratch_upsert_schema` "
-        "and attached to the notebook. "
-        "Results contain `cell_id`, index, language, errors, warnings, and structured `details`, and diagnostics remain advisory "
-        "so you can persist cells even when issues are reported. If validation exceeds `validation_request_timeout`, the call "
-        "fails with `VALIDATION_TIMEOUT` and no partial results."
-    ),
-)(_scratch_validate_impl)
-
-scratch_search = SERVER.tool(
-    name="scratch_search",
-    description=(
-        "Perform semantic search across scratchpads and cells. Use this as your primary way to rediscover prior work instead of "
-        "relying on memory or listing all notebooks. "
-        "Provide a natural language `query` and optionally filter by `namespaces` (project) and `tags` (for example `design`, "
-        "`incident`, `summary`). Results include `scratch_id`, `cell_id`, `namespace`, tags, relevance `score`, and a `snippet` "
-        "so you can quickly decide which notebook to open next. "
-        "After finding a hit, call `scratch_read` or `scratch_list_cells` on the returned `scratch_id` and use `cell_ids` to "
-        "narrow to the specific cells of interest."
-    ),
-)(_scratch_search_impl)
-
-scratch_list_schemas = SERVER.tool(
-    name="scratch_list_schemas",
-    description=(
-        "List shared JSON Schemas attached to a scratch notebook. Use this alongside `scratch_upsert_schema` and `scratch_get_schema` "
-        "to manage the schema registry that structured cells reference via `cell.json_schema`. "
-        "These schemas support validation behavior in `scratch_append_cell`, `scratch_replace_cell`, and `scratch_validate`."
-    ),
-)(_scratch_list_schemas_impl)
-
-scratch_get_schema = SERVER.tool(
-    name="scratch_get_schema",
-    description=(
-        "Fetch a shared schema definition by id from a scratch notebook. Use this to inspect the JSON Schema object and its "
-        "metadata (`id`, `name`, `description`, `schema`) before attaching it to new cells via `cell.json_schema` or modifying "
-        "it via `scratch_upsert_schema`."
-    ),
-)(_scratch_get_schema_impl)
-
-scratch_upsert_schema = SERVER.tool(
-    name="scratch_upsert_schema",
-    description=(
-        "Create or update a shared JSON Schema definition on a scratch notebook. Use this to maintain the schema registry that "
-        "structured cells refer to via `cell.json_schema`. "
-        "Each entry includes an `id` (UUID), optional logical `name` for intra-notebook references, a human-readable `description`, "
-        "and a JSON Schema object. "
-        "Updated schemas influence subsequent validation behavior in `scratch_append_cell`, `scratch_replace_cell`, and "
-        "`scratch_validate` for JSON and YAML cells that reference them."
-    ),
-)(_scratch_upsert_schema_impl)
-
-_SCRATCH_CREATE_METADATA_SCHEMA = {
-    "type": "object",
-    "properties": {
-        "title": {
-            "type": ["string", "null"],
-            "description": "Canonical short label for the scratchpad.",
-            "default": None,
-        },
-        "description": {
-            "type": ["string", "null"],
-            "description": "Longer human-readable summary presented in listings.",
-            "default": None,
-        },
-        "summary": {
-            "type": ["string", "null"],
-            "description": "Optional concise synopsis for semantic search snippets.",
-            "default": None,
-        },
-    },
-    "additionalProperties": True,
-}
-
-_CELL_INPUT_SCHEMA = {
-    "type": "object",
-    "additionalProperties": False,
-    "properties": {
-        "cell_id": {
-            "type": "string",
-            "description": "Optional cell identifier. When omitted, the server generates a UUID.",
-        },
-        "language": {
-            "type": "string",
-            "minLength": 1,
-            "description": "Language/format of the cell content.",
-        },
-        "content": {
-            "type": "string",
-            "description": "Raw cell content as text.",
-        },
-        "validate": {
-            "type": "boolean",
-            "default": False,
-            "description": "Set true to request advisory validation before the cell is stored.",
-        },
-        "json_schema": {
-            "description": "Optional JSON Schema applied to JSON/YAML cells.",
-            "oneOf": [
-                {"type": "object"},
-                {"type": "string"},
-            ],
-        },
-        "metadata": {
-            "type": "object",
-            "description": "Per-cell metadata (for example `tags`, `note`).",
-            "additionalProperties": True,
-        },
-    },
-    "required": ["language", "content"],
-}
-
-scratch_create.parameters = {
-    "type": "object",
-    "properties": {
-        "scratch_id": dict(scratch_create.parameters["properties"]["scratch_id"]),
-        "metadata": {
-            "anyOf": [
-                _SCRATCH_CREATE_METADATA_SCHEMA,
-                {"type": "null"},
-            ],
-            "default": None,
-            "description": "Optional metadata payload including canonical fields.",
-        },
-        "cells": {
-            "anyOf": [
-                {
-                    "type": "array",
-                    "items": _CELL_INPUT_SCHEMA,
-                },
-                {"type": "null"},
-            ],
-            "default": None,
-            "description": "Optional list of cells persisted atomically during creation. Cells follow the same structure used by scratch_append_cell.",
-        },
-    },
-    "additionalProperties": True,
-}
-
-scratch_list.parameters = {
-    "type": "object",
-    "additionalProperties": False,
-    "properties": {
-        "namespaces": {
-            "type": "array",
-            "items": {"type": "string", "minLength": 1},
-            "description": "Optional namespace filter; when provided, results include only matching namespaces.",
-        },
-        "tags": {
-            "type": "array",
-            "items": {"type": "string", "minLength": 1},
-            "description": "Optional tag filter returning scratchpads whose tags or cell tags include any of the supplied values.",
-        },
-        "limit": {
-            "type": "integer",
-            "minimum": 0,
-            "description": "Optional result cap; when omitted, all matching scratchpads are returned.",
-        },
-    },
-}
-
-scratch_list_tags.parameters = {
-    "type": "object",
-    "additionalProperties": False,
-    "properties": {
-        "namespaces": {
-            "type": "array",
-            "items": {"type": "string", "minLength": 1},
-            "description": "Optional namespace filter limiting results to scratchpads in the provided namespaces.",
-        },
-    },
-}
-
-scratch_list.output_schema = {
-    "type": "object",
-    "additionalProperties": False,
-    "properties": {
-        "ok": {"type": "boolean"},
-        "error": {"type": ["object", "null"]},
-        "scratchpads": {
-            "type": "array",
-            "items": {
-                "type": "object",
-                "additionalProperties": False,
-                "properties": {
-                    "scratch_id": {"type": "string"},
-                    "title": {"type": ["string", "null"]},
-                    "description": {"type": ["string", "null"]},
-                    "namespace": {"type": ["string", "null"]},
-                    "cell_count": {"type": "integer", "minimum": 0},
-                },
-                "required": ["scratch_id", "title", "description", "namespace", "cell_count"],
-            },
-            "description": "Lean listing of scratchpads for navigation.",
-        },
-    },
-    "required": ["ok"],
-    "allOf": [
-        {
-            "if": {"properties": {"ok": {"const": True}}},
-            "then": {"required": ["scratchpads"]},
-            "else": {"required": ["error"]},
-        }
-    ],
-}
-
-
 @_shutdown_protected
 async def _scratch_namespace_list_impl(*, context: Context | None = None) -> dict[str, Any]:
     storage = get_storage(context)
@@ -1489,309 +1299,329 @@ async def _scratch_namespace_delete_impl(
     return success({"deleted": deleted, "removed_scratchpads": removed})
 
 
-scratch_namespace_list = SERVER.tool(
-    name="scratch_namespace_list",
-    description=(
-        "List namespaces available to the current tenant. Use this at the start of a session to discover project prefixes before "
-        "calling `scratch_create` or `scratch_list`. Reusing existing namespaces keeps related notebooks grouped and simplifies "
-        "later filtering in `scratch_list`, `scratch_search`, and `scratch_list_tags`."
+# ----------------------------------------------------------------------
+# Tool registration
+# ----------------------------------------------------------------------
+
+_TOOL_SPECS: tuple[tuple[str, str, Callable[..., Any]], ...] = (
+    (
+        "scratch_create",
+        (
+            "Create or reset a long-lived scratch notebook for your current task. "
+            "Use this as your primary working memory for multi-step work instead of ad-hoc notes: each notebook groups related "
+            "cells (markdown, code, JSON/YAML, text) plus canonical metadata (title, description, optional summary, namespace, tags). "
+            "Provide `scratch_id` only when you must reuse a deterministic identifier; otherwise omit it and the server allocates one. "
+            "Optionally seed the notebook with a `cells` array that follows the `scratch_append_cell` shape so you can atomically create an "
+            "initial plan, goals, or examples. "
+            "Follow up with `scratch_append_cell` to grow the notebook, `scratch_read` to view full content, and `scratch_list_cells` for "
+            "lightweight overviews. "
+            "Call `scratch_namespace_list` before creating a pad to discover or create project-specific namespaces and keep notebooks "
+            "partitioned by project."
+        ),
+        _scratch_create_impl,
+    ),
+    (
+        "scratch_read",
+        (
+            "Read a scratch notebook by id as part of an ongoing task. Prefer this over generic document fetches whenever you "
+            "need structured cells plus metadata. "
+            "Use the `cell_ids` filter (preferred) when you need explicit cell UUIDs, for example those discovered via "
+            "`scratch_list_cells` or `scratch_search`; this filter applies before tags so you can combine both. Provide `tags` to "
+            "return only cells whose metadata tags intersect the supplied values, and `namespaces` to assert that the pad lives inside "
+            "one of the allowed namespaces (otherwise the call fails with `UNAUTHORIZED`). "
+            "Set `include_metadata=false` when you only need cell payloads; canonical metadata remains available via `scratch_list` or "
+            "a follow-up read. Responses always include indices for ordering context, but `cell_id` remains the sole identifier for "
+            "follow-up edits via `scratch_append_cell` and `scratch_replace_cell`."
+        ),
+        _scratch_read_impl,
+    ),
+    (
+        "scratch_list_cells",
+        (
+            "List cells for a scratchpad without streaming full content. Use this as your index view: each entry returns `cell_id`, "
+            "index, language, tags, and any stored metadata so you can decide which cells to read or replace. "
+            "Treat `cell_ids` as a filter when you already know the targets (exact UUID matches) and combine with tag filters to "
+            "intersect metadata tags with your selectors. "
+            "Typical workflows: call `scratch_list_cells` after `scratch_create`, `scratch_list`, or `scratch_search` to locate a "
+            "plan, goals, or summary cell, then use `scratch_read` or `scratch_replace_cell` on the chosen `cell_id`."
+        ),
+        _scratch_list_cells_impl,
+    ),
+    (
+        "scratch_delete",
+        (
+            "Delete a scratch notebook by id. Use this for short-lived or noisy notebooks that you are confident will not be reused. "
+            "Consider listing candidate pads via `scratch_list` first and preserving notebooks that still provide historical context, "
+            "design decisions, or incident timelines."
+        ),
+        _scratch_delete_impl,
+    ),
+    (
+        "scratch_list",
+        (
+            "List scratchpads with lean metadata suitable for navigation between notebooks. Each entry returns `scratch_id`, title, "
+            "description, namespace, and `cell_count`. Use this to choose which notebook to open with `scratch_read` or "
+            "`scratch_list_cells`. "
+            "Filter by `namespaces` to stay inside a project, and by `tags` to focus on particular kinds of notebooks (for example "
+            "`design`, `incident`, `research`); use `limit` to cap results when a namespace holds many notebooks "
+            "and pass the returned `next_cursor` back as `cursor` to page through the rest."
+        ),
+        _scratch_list_impl,
+    ),
+    (
+        "scratch_list_tags",
+        (
+            "List scratchpad-level and cell-level tags, optionally filtered by namespace. Use this to discover and standardize the "
+            "tag vocabulary you rely on in `scratch_append_cell`, `scratch_replace_cell`, `scratch_list`, `scratch_list_cells`, "
+            "and `scratch_search`. "
+            "`scratchpad_tags` reflects tags declared on notebook metadata; `cell_tags` aggregates tags discovered on individual cells."
+        ),
+        _scratch_list_tags_impl,
+    ),
+    (
+        "scratch_append_cell",
+        (
+            "Append a new cell to a scratch notebook. This is the primary way to grow your notebook during a task: provide the target "
+            "`scratch_id`, set `cell.language` and `cell.content`, and store per-cell tags in `cell.metadata.tags` (for example "
+            "`plan`, `hypothesis`, `snippet`, `example`, `summary`). "
+            "Set `cell.validate=true` when you want advisory validation diagnostics returned alongside the updated pad. "
+            "`cell.json_schema` can reference inline schemas or `scratchpad://schemas/<name>` entries managed by `scratch_upsert_schema`; "
+            "missing shared schemas produce warnings rather than blocking writes. "
+            "Responses echo structural data (ids, indices, language, metadata, tags, validation summaries) but omit raw cell content; "
+            "call `scratch_read` whenever you need the full notebook payload."
+        ),
+        _scratch_append_cell_impl,
+    ),
+    (
+        "scratch_replace_cell",
+        (
+            "Replace an existing cell by `cell_id` when you want to update or reorder information without losing the surrounding "
+            "notebook context. Use this instead of `scratch_append_cell` when you are refining an existing plan, decision, or example. "
+            "`new_index` lets you move the cell explicitly while keeping indices as ordering metadata only, for example pinning "
+            "goals and summary cells near the top. "
+            "If you omit `metadata` in the replacement payload, the server reuses the previous cell metadata (including tags) so "
+            "replacements keep their classification. "
+            "When `validate` is true, diagnostics are advisory and returned alongside the updated pad just like append operations. "
+            "Responses mirror append and create behavior by returning structural data without cell content; use `scratch_read` to "
+            "inspect the updated payload when needed."
+        ),
+        _scratch_replace_cell_impl,
+    ),
+    (
+        "scratch_validate",
+        (
+            "Validate one or more cells within a scratch notebook. Use this for structured content (JSON, YAML, markdown, code) before "
+            "you promote examples or configs into your codebase. "
+            "Pass explicit `cell_ids` to filter the validation target set (for example only cells tagged `example` or `config`); omit "
+            "the filter to re-check every cell in the pad. Validation uses any shared schemas registered via `scratch_upsert_schema` "
+            "and attached to the notebook. "
+            "Results contain `cell_id`, index, language, errors, warnings, and structured `details`, and diagnostics remain advisory "
+            "so you can persist cells even when issues are reported. If validation exceeds `validation_request_timeout`, the call "
+            "fails with `VALIDATION_TIMEOUT` and no partial results."
+        ),
+        _scratch_validate_impl,
+    ),
+    (
+        "scratch_search",
+        (
+            "Perform semantic search across scratchpads and cells. Use this as your primary way to rediscover prior work instead of "
+            "relying on memory or listing all notebooks. "
+            "Provide a natural language `query` and optionally filter by `namespaces` (project) and `tags` (for example `design`, "
+            "`incident`, `summary`). Results include `scratch_id`, `cell_id`, `namespace`, tags, relevance `score`, and a `snippet` "
+            "so you can quickly decide which notebook to open next. "
+            "After finding a hit, call `scratch_read` or `scratch_list_cells` on the returned `scratch_id` and use `cell_ids` to "
+            "narrow to the specific cells of interest."
+        ),
+        _scratch_search_impl,
+    ),
+    (
+        "scratch_list_schemas",
+        (
+            "List shared JSON Schemas attached to a scratch notebook. Use this alongside `scratch_upsert_schema` and `scratch_get_schema` "
+            "to manage the schema registry that structured cells reference via `cell.json_schema`. "
+            "These schemas support validation behavior in `scratch_append_cell`, `scratch_replace_cell`, and `scratch_validate`."
+        ),
+        _scratch_list_schemas_impl,
+    ),
+    (
+        "scratch_get_schema",
+        (
+            "Fetch a shared schema definition by id from a scratch notebook. Use this to inspect the JSON Schema object and its "
+            "metadata (`id`, `name`, `description`, `schema`) before attaching it to new cells via `cell.json_schema` or modifying "
+            "it via `scratch_upsert_schema`."
+        ),
+        _scratch_get_schema_impl,
     ),
-)(_scratch_namespace_list_impl)
+    (
+        "scratch_upsert_schema",
+        (
+            "Create or update a shared JSON Schema definition on a scratch notebook. Use this to maintain the schema registry that "
+            "structured cells refer to via `cell.json_schema`. "
+            "Each entry includes an `id` (UUID), optional logical `name` for intra-notebook references, a human-readable `description`, "
+            "and a JSON Schema object. "
+            "Updated schemas influence subsequent validation behavior in `scratch_append_cell`, `scratch_replace_cell`, and "
+            "`scratch_validate` for JSON and YAML cells that reference them."
+        ),
+        _scratch_upsert_schema_impl,
+    ),
+    (
+        "scratch_namespace_list",
+        (
+            "List namespaces available to the current tenant. Use this at the start of a session to discover project prefixes before "
+            "calling `scratch_create` or `scratch_list`. Reusing existing namespaces keeps related notebooks grouped and simplifies "
+            "later filtering in `scratch_list`, `scratch_search`, and `scratch_list_tags`."
+        ),
+        _scratch_namespace_list_impl,
+    ),
+    (
+        "scratch_namespace_create",
+        (
+            "Register a namespace string for the current tenant. Use this when you are intentionally starting a new project boundary "
+            "and want future notebooks created via `scratch_create` to be scoped to that namespace. "
+            "Prefer reusing existing namespaces discovered via `scratch_namespace_list` unless there is a clear need for separation."
+        ),
+        _scratch_namespace_create_impl,
+    ),
+    (
+        "scratch_namespace_rename",
+        (
+            "Rename an existing namespace, optionally migrating scratchpads that reference it. Use this when project or product names "
+            "change and you want notebooks, `scratch_list`, and `scratch_search` queries to follow the new naming. "
+            "When `migrate_scratchpads` is true (the default), scratchpads that referenced the old namespace are updated to the new "
+            "one."
+        ),
+        _scratch_namespace_rename_impl,
+    ),
+    (
+        "scratch_namespace_delete",
+        (
+            "Delete a namespace, optionally cascading deletion to associated scratchpads. Use this sparingly when decommissioning an "
+            "entire project. "
+            "Consider calling `scratch_list` first to review notebooks in the namespace. When `delete_scratchpads` is true, notebooks "
+            "referencing the namespace are removed; when false, only the namespace registration is removed."
+        ),
+        _scratch_namespace_delete_impl,
+    ),
+)
 
-scratch_namespace_list.parameters = {
-    "type": "object",
-    "additionalProperties": False,
-}
 
-scratch_namespace_list.output_schema = {
-    "type": "object",
-    "additionalProperties": False,
-    "properties": {
-        "ok": {"type": "boolean"},
-        "error": {"type": ["object", "null"]},
-        "namespaces": {
-            "type": "array",
-            "items": {
-                "type": "object",
-                "additionalProperties": False,
-                "properties": {
-                    "namespace": {"type": "string"},
-                    "scratchpad_count": {"type": "integer", "minimum": 0},
-                },
-                "required": ["namespace", "scratchpad_count"],
-            },
-        },
-    },
-    "required": ["ok"],
-    "allOf": [
-        {
-            "if": {"properties": {"ok": {"const": True}}},
-            "then": {"required": ["namespaces"]},
-            "else": {"required": ["error"]},
-        }
-    ],
-}
+for _tool_name, _tool_description, _tool_impl in _TOOL_SPECS:
+    globals()[_tool_name] = SERVER.tool(name=_tool_name, description=_tool_description)(_tool_impl)
 
-scratch_namespace_create = SERVER.tool(
-    name="scratch_namespace_create",
-    description=(
-        "Register a namespace string for the current tenant. Use this when you are intentionally starting a new project boundary "
-        "and want future notebooks created via `scratch_create` to be scoped to that namespace. "
-        "Prefer reusing existing namespaces discovered via `scratch_namespace_list` unless there is a clear need for separation."
-    ),
-)(_scratch_namespace_create_impl)
 
-scratch_namespace_create.parameters = {
-    "type": "object",
-    "additionalProperties": False,
-    "properties": {
-        "namespace": {
-            "type": "string",
-            "minLength": 1,
-            "description": "Namespace string to register.",
-        },
-    },
-    "required": ["namespace"],
-}
+# ----------------------------------------------------------------------
+# Tool input/output schemas
+# ----------------------------------------------------------------------
 
-scratch_namespace_create.output_schema = {
-    "type": "object",
-    "additionalProperties": False,
-    "properties": {
-        "ok": {"type": "boolean"},
-        "error": {"type": ["object", "null"]},
-        "namespace": {"type": "string"},
-        "created": {"type": "boolean"},
-    },
-    "required": ["ok"],
-    "allOf": [
-        {
-            "if": {"properties": {"ok": {"const": True}}},
-            "then": {"required": ["namespace", "created"]},
-            "else": {"required": ["error"]},
-        }
-    ],
-}
 
-scratch_namespace_rename = SERVER.tool(
-    name="scratch_namespace_rename",
-    description=(
-        "Rename an existing namespace, optionally migrating scratchpads that reference it. Use this when project or product names "
-        "change and you want notebooks, `scratch_list`, and `scratch_search` queries to follow the new naming. "
-        "When `migrate_scratchpads` is true (the default), scratchpads that referenced the old namespace are updated to the new "
-        "one."
-    ),
-)(_scratch_namespace_rename_impl)
+def _string_array(description: str | None = None, *, min_length: int | None = 1) -> dict[str, Any]:
+    items: dict[str, Any] = {"type": "string"}
+    if min_length is not None:
+        items["minLength"] = min_length
+    schema: dict[str, Any] = {"type": "array", "items": items}
+    if description is not None:
+        schema["description"] = description
+    return schema
 
-scratch_namespace_rename.parameters = {
-    "type": "object",
-    "additionalProperties": False,
-    "properties": {
-        "old_namespace": {
-            "type": "string",
-            "minLength": 1,
-            "description": "Existing namespace to rename.",
-        },
-        "new_namespace": {
-            "type": "string",
-            "minLength": 1,
-            "description": "New namespace value.",
-        },
-        "migrate_scratchpads": {
-            "type": "boolean",
-            "default": True,
-            "description": "When true (default), migrate scratchpads referencing the old namespace.",
-        },
-    },
-    "required": ["old_namespace", "new_namespace"],
-}
 
-scratch_namespace_rename.output_schema = {
-    "type": "object",
-    "additionalProperties": False,
-    "properties": {
-        "ok": {"type": "boolean"},
-        "error": {"type": ["object", "null"]},
-        "namespace": {"type": "string"},
-        "migrated_count": {"type": "integer", "minimum": 0},
-    },
-    "required": ["ok"],
-    "allOf": [
-        {
-            "if": {"properties": {"ok": {"const": True}}},
-            "then": {"required": ["namespace", "migrated_count"]},
-            "else": {"required": ["error"]},
-        }
-    ],
-}
+def _id_property(description: str) -> dict[str, Any]:
+    return {"type": "string", "minLength": 1, "description": description}
 
-scratch_namespace_delete = SERVER.tool(
-    name="scratch_namespace_delete",
-    description=(
-        "Delete a namespace, optionally cascading deletion to associated scratchpads. Use this sparingly when decommissioning an "
-        "entire project. "
-        "Consider calling `scratch_list` first to review notebooks in the namespace. When `delete_scratchpads` is true, notebooks "
-        "referencing the namespace are removed; when false, only the namespace registration is removed."
-    ),
-)(_scratch_namespace_delete_impl)
 
-scratch_namespace_delete.parameters = {
-    "type": "object",
-    "additionalProperties": False,
-    "properties": {
-        "namespace": {
-            "type": "string",
-            "minLength": 1,
-            "description": "Namespace to delete.",
-        },
-        "delete_scratchpads": {
-            "type": "boolean",
-            "default": False,
-            "description": "When true, delete scratchpads referencing the namespace.",
-        },
-    },
-    "required": ["namespace"],
-}
+def _ok_switch(*required_on_ok: str) -> dict[str, Any]:
+    # Built fresh per tool so no two output schemas share a mutable fragment.
+    return {
+        "if": {"properties": {"ok": {"const": True}}},
+        "then": {"required": list(required_on_ok)},
+        "else": {"required": ["error"]},
+    }
 
-scratch_namespace_delete.output_schema = {
-    "type": "object",
-    "additionalProperties": False,
-    "properties": {
-        "ok": {"type": "boolean"},
-        "error": {"type": ["object", "null"]},
-        "deleted": {"type": "boolean"},
-        "removed_scratchpads": {"type": "integer", "minimum": 0},
-    },
-    "required": ["ok"],
-    "allOf": [
-        {
-            "if": {"properties": {"ok": {"const": True}}},
-            "then": {"required": ["deleted", "removed_scratchpads"]},
-            "else": {"required": ["error"]},
-        }
-    ],
-}
-scratch_list_tags.output_schema = {
-    "type": "object",
-    "additionalProperties": False,
-    "properties": {
-        "ok": {"type": "boolean"},
-        "error": {"type": ["object", "null"]},
-        "scratchpad_tags": {
-            "type": "array",
-            "items": {"type": "string"},
-            "description": "Deduplicated set of tags declared on scratchpad metadata.",
-        },
-        "cell_tags": {
-            "type": "array",
-            "items": {"type": "string"},
-            "description": "Deduplicated set of tags discovered on individual cells.",
+
+def _input_schema(
+    properties: Mapping[str, Any] | None = None,
+    *,
+    required: Sequence[str] = (),
+) -> dict[str, Any]:
+    schema: dict[str, Any] = {"type": "object", "additionalProperties": False}
+    if properties is not None:
+        schema["properties"] = dict(properties)
+    if required:
+        schema["required"] = list(required)
+    return schema
+
+
+def _output_schema(properties: Mapping[str, Any], *, required_on_ok: Sequence[str]) -> dict[str, Any]:
+    return {
+        "type": "object",
+        "additionalProperties": False,
+        "properties": {
+            "ok": {"type": "boolean"},
+            "error": {"type": ["object", "null"]},
+            **properties,
         },
-    },
-    "required": ["ok"],
-    "allOf": [
-        {
-            "if": {"properties": {"ok": {"const": True}}},
-            "then": {"required": ["scratchpad_tags", "cell_tags"]},
-            "else": {"required": ["error"]},
-        }
-    ],
-}
+        "required": ["ok"],
+        "allOf": [_ok_switch(*required_on_ok)],
+    }
 
-scratch_read.parameters = {
+
+_SCRATCH_CREATE_METADATA_SCHEMA = {
     "type": "object",
-    "additionalProperties": False,
     "properties": {
-        "scratch_id": {
-            "type": "string",
-            "minLength": 1,
-            "description": "Identifier of the target scratch notebook.",
-        },
-        "cell_ids": {
-            "type": "array",
-            "items": {"type": "string", "minLength": 1},
-            "description": "Optional subset of cell ids to return.",
-        },
-        "tags": {
-            "type": "array",
-            "items": {"type": "string", "minLength": 1},
-            "description": "Optional tag filter returning cells whose metadata tags intersect the supplied list.",
+        "title": {
+            "type": ["string", "null"],
+            "description": "Canonical short label for the scratchpad.",
+            "default": None,
         },
-        "namespaces": {
-            "type": "array",
-            "items": {"type": "string", "minLength": 1},
-            "description": "Optional namespace constraint that must include the scratchpad namespace.",
+        "description": {
+            "type": ["string", "null"],
+            "description": "Longer human-readable summary presented in listings.",
+            "default": None,
         },
-        "include_metadata": {
-            "type": "boolean",
-            "description": "When false, omits metadata from the response.",
-            "default": True,
+        "summary": {
+            "type": ["string", "null"],
+            "description": "Optional concise synopsis for semantic search snippets.",
+            "default": None,
         },
     },
-    "required": ["scratch_id"],
+    "additionalProperties": True,
 }
 
-scratch_search.parameters = {
+_CELL_INPUT_SCHEMA = {
     "type": "object",
     "additionalProperties": False,
     "properties": {
-        "query": {
+        "cell_id": {
+            "type": "string",
+            "description": "Optional cell identifier. When omitted, the server generates a UUID.",
+        },
+        "language": {
             "type": "string",
             "minLength": 1,
-            "description": "Natural language query to search across scratchpads and cells.",
+            "description": "Language/format of the cell content.",
         },
-        "namespaces": {
-            "type": "array",
-            "items": {"type": "string", "minLength": 1},
-            "description": "Optional namespace filter applied before ranking.",
+        "content": {
+            "type": "string",
+            "description": "Raw cell content as text.",
         },
-        "tags": {
-            "type": "array",
-            "items": {"type": "string", "minLength": 1},
-            "description": "Optional tag filter applied before ranking.",
+        "validate": {
+            "type": "boolean",
+            "default": False,
+            "description": "Set true to request advisory validation before the cell is stored.",
         },
-        "limit": {
-            "type": "integer",
-            "minimum": 1,
-            "maximum": 50,
-            "description": "Maximum number of hits to return.",
+        "json_schema": {
+            "description": "Optional JSON Schema applied to JSON/YAML cells.",
+            "oneOf": [
+                {"type": "object"},
+                {"type": "string"},
+            ],
         },
-    },
-    "required": ["query"],
-}
-
-scratch_search.output_schema = {
-    "type": "object",
-    "additionalProperties": False,
-    "properties": {
-        "ok": {"type": "boolean"},
-        "error": {"type": ["object", "null"]},
-        "hits": {
-            "type": "array",
-            "items": {
-                "type": "object",
-                "additionalProperties": False,
-                "properties": {
-                    "scratch_id": {"type": "string"},
-                    "cell_id": {"type": ["string", "null"]},
-                    "namespace": {"type": ["string", "null"]},
-                    "tags": {"type": "array", "items": {"type": "string"}},
-                    "score": {"type": "number"},
-                    "snippet": {"type": "string"},
-                },
-                "required": ["scratch_id", "cell_id", "namespace", "tags", "score", "snippet"],
-            },
+        "metadata": {
+            "type": "object",
+            "description": "Per-cell metadata (for example `tags`, `note`).",
+            "additionalProperties": True,
         },
-        "embedder": {"type": "string"},
     },
-    "required": ["ok"],
-    "allOf": [
-        {
-            "if": {"properties": {"ok": {"const": True}}},
-            "then": {"required": ["hits", "embedder"]},
-            "else": {"required": ["error"]},
-        }
-    ],
+    "required": ["language", "content"],
 }
 
 _LIST_CELL_ENTRY_SCHEMA = {
@@ -1802,53 +1632,11 @@ _LIST_CELL_ENTRY_SCHEMA = {
         "index": {"type": "integer", "minimum": 0},
         "language": {"type": "string"},
         "metadata": {"type": "object"},
-        "tags": {"type": "array", "items": {"type": "string"}},
+        "tags": _string_array(min_length=None),
     },
     "required": ["cell_id", "index", "language"],
 }
 
-_LIST_CELLS_SUCCESS_CONSTRAINT = {
-    "if": {"properties": {"ok": {"const": True}}},
-    "then": {"required": ["scratch_id", "cells"]},
-    "else": {"required": ["error"]},
-}
-
-scratch_list_cells.parameters = {
-    "type": "object",
-    "additionalProperties": False,
-    "properties": {
-        "scratch_id": {
-            "type": "string",
-            "minLength": 1,
-            "description": "Identifier of the scratch notebook whose cells should be listed.",
-        },
-        "cell_ids": {
-            "type": "array",
-            "items": {"type": "string", "minLength": 1},
-            "description": "Optional subset of cell ids to include.",
-        },
-        "tags": {
-            "type": "array",
-            "items": {"type": "string", "minLength": 1},
-            "description": "Optional tag filter returning cells that contain any of the supplied tags.",
-        },
-    },
-    "required": ["scratch_id"],
-}
-
-scratch_list_cells.output_schema = {
-    "type": "object",
-    "additionalProperties": False,
-    "properties": {
-        "ok": {"type": "boolean"},
-        "error": {"type": ["object", "null"]},
-        "scratch_id": {"type": "string"},
-        "cells": {"type": "array", "items": _LIST_CELL_ENTRY_SCHEMA},
-    },
-    "required": ["ok"],
-    "allOf": [_LIST_CELLS_SUCCESS_CONSTRAINT],
-}
-
 _SCHEMA_ENTRY_SCHEMA = {
     "type": "object",
     "additionalProperties": False,
@@ -1886,101 +1674,291 @@ _SCHEMA_INPUT_SCHEMA = {
     "required": ["schema"],
 }
 
-_SCHEMA_SUCCESS_CONSTRAINT = {
-    "if": {"properties": {"ok": {"const": True}}},
-    "then": {"required": ["schema"]},
-    "else": {"required": ["error"]},
-}
-
-scratch_list_schemas.parameters = {
-    "type": "object",
-    "additionalProperties": False,
-    "properties": {
-        "scratch_id": {
-            "type": "string",
-            "minLength": 1,
-            "description": "Identifier of the scratch notebook whose shared schemas should be listed.",
-        }
+_TOOL_SCHEMAS: dict[str, dict[str, dict[str, Any]]] = {
+    "scratch_create": {
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "scratch_id": dict(scratch_create.parameters["properties"]["scratch_id"]),
+                "metadata": {
+                    "anyOf": [
+                        _SCRATCH_CREATE_METADATA_SCHEMA,
+                        {"type": "null"},
+                    ],
+                    "default": None,
+                    "description": "Optional metadata payload including canonical fields.",
+                },
+                "cells": {
+                    "anyOf": [
+                        {
+                            "type": "array",
+                            "items": _CELL_INPUT_SCHEMA,
+                        },
+                        {"type": "null"},
+                    ],
+                    "default": None,
+                    "description": "Optional list of cells persisted atomically during creation. Cells follow the same structure used by scratch_append_cell.",
+                },
+            },
+            "additionalProperties": True,
+        },
     },
-    "required": ["scratch_id"],
-}
-
-scratch_list_schemas.output_schema = {
-    "type": "object",
-    "additionalProperties": False,
-    "properties": {
-        "ok": {"type": "boolean"},
-        "error": {"type": ["object", "null"]},
-        "scratch_id": {"type": "string"},
-        "schemas": {"type": "array", "items": _SCHEMA_ENTRY_SCHEMA},
+    "scratch_read": {
+        "parameters": _input_schema(
+            {
+                "scratch_id": _id_property("Identifier of the target scratch notebook."),
+                "cell_ids": _string_array("Optional subset of cell ids to return."),
+                "tags": _string_array("Optional tag filter returning cells whose metadata tags intersect the supplied list."),
+                "namespaces": _string_array("Optional namespace constraint that must include the scratchpad namespace."),
+                "include_metadata": {
+                    "type": "boolean",
+                    "description": "When false, omits metadata from the response.",
+                    "default": True,
+                },
+            },
+            required=["scratch_id"],
+        ),
     },
-    "required": ["ok"],
-    "allOf": [
-        {
-            "if": {"properties": {"ok": {"const": True}}},
-            "then": {"required": ["scratch_id", "schemas"]},
-            "else": {"required": ["error"]},
-        }
-    ],
-}
-
-scratch_get_schema.parameters = {
-    "type": "object",
-    "additionalProperties": False,
-    "properties": {
-        "scratch_id": {
-            "type": "string",
-            "minLength": 1,
-            "description": "Identifier of the scratch notebook containing the schema.",
-        },
-        "schema_id": {
-            "type": "string",
-            "minLength": 1,
-            "description": "UUID of the schema to fetch.",
-        },
+    "scratch_list_cells": {
+        "parameters": _input_schema(
+            {
+                "scratch_id": _id_property("Identifier of the scratch notebook whose cells should be listed."),
+                "cell_ids": _string_array("Optional subset of cell ids to include."),
+                "tags": _string_array("Optional tag filter returning cells that contain any of the supplied tags."),
+            },
+            required=["scratch_id"],
+        ),
+        "output_schema": _output_schema(
+            {
+                "scratch_id": {"type": "string"},
+                "cells": {"type": "array", "items": _LIST_CELL_ENTRY_SCHEMA},
+            },
+            required_on_ok=["scratch_id", "cells"],
+        ),
     },
-    "required": ["scratch_id", "schema_id"],
-}
-
-scratch_get_schema.output_schema = {
-    "type": "object",
-    "additionalProperties": False,
-    "properties": {
-        "ok": {"type": "boolean"},
-        "error": {"type": ["object", "null"]},
-        "schema": _SCHEMA_ENTRY_SCHEMA,
+    "scratch_list": {
+        "parameters": _input_schema(
+            {
+                "namespaces": _string_array(
+                    "Optional namespace filter; when provided, results include only matching namespaces."
+                ),
+                "tags": _string_array(
+                    "Optional tag filter returning scratchpads whose tags or cell tags include any of the supplied values."
+                ),
+                "limit": {
+                    "type": "integer",
+                    "minimum": 0,
+                    "description": "Optional result cap; when omitted, all matching scratchpads are returned.",
+                },
+                "cursor": {
+                    "type": ["string", "null"],
+                    "default": None,
+                    "description": "Resume listing after this scratch_id, typically the `next_cursor` of a previous page.",
+                },
+            }
+        ),
+        "output_schema": _output_schema(
+            {
+                "scratchpads": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "additionalProperties": False,
+                        "properties": {
+                            "scratch_id": {"type": "string"},
+                            "title": {"type": ["string", "null"]},
+                            "description": {"type": ["string", "null"]},
+                            "namespace": {"type": ["string", "null"]},
+                            "cell_count": {"type": "integer", "minimum": 0},
+                        },
+                        "required": ["scratch_id", "title", "description", "namespace", "cell_count"],
+                    },
+                    "description": "Lean listing of scratchpads for navigation.",
+                },
+                "next_cursor": {
+                    "type": "string",
+                    "description": "Present when `limit` truncated the listing; pass as `cursor` to fetch the next page.",
+                },
+            },
+            required_on_ok=["scratchpads"],
+        ),
     },
-    "required": ["ok"],
-    "allOf": [_SCHEMA_SUCCESS_CONSTRAINT],
-}
-
-
-scratch_upsert_schema.parameters = {
-    "type": "object",
-    "additionalProperties": False,
-    "properties": {
-        "scratch_id": {
-            "type": "string",
-            "minLength": 1,
-            "description": "Identifier of the scratch notebook where the schema should be stored.",
-        },
-        "schema": _SCHEMA_INPUT_SCHEMA,
+    "scratch_list_tags": {
+        "parameters": _input_schema(
+            {
+                "namespaces": _string_array(
+                    "Optional namespace filter limiting results to scratchpads in the provided namespaces."
+                ),
+            }
+        ),
+        "output_schema": _output_schema(
+            {
+                "scratchpad_tags": _string_array(
+                    "Deduplicated set of tags declared on scratchpad metadata.",
+                    min_length=None,
+                ),
+                "cell_tags": _string_array(
+                    "Deduplicated set of tags discovered on individual cells.",
+                    min_length=None,
+                ),
+            },
+            required_on_ok=["scratchpad_tags", "cell_tags"],
+        ),
     },
-    "required": ["scratch_id", "schema"],
-}
-
-scratch_upsert_schema.output_schema = {
-    "type": "object",
-    "additionalProperties": False,
-    "properties": {
-        "ok": {"type": "boolean"},
-        "error": {"type": ["object", "null"]},
-        "schema": _SCHEMA_ENTRY_SCHEMA,
+    "scratch_search": {
+        "parameters": _input_schema(
+            {
+                "query": _id_property("Natural language query to search across scratchpads and cells."),
+                "namespaces": _string_array("Optional namespace filter applied before ranking."),
+                "tags": _string_array("Optional tag filter applied before ranking."),
+                "limit": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "maximum": 50,
+                    "description": "Maximum number of hits to return.",
+                },
+            },
+            required=["query"],
+        ),
+        "output_schema": _output_schema(
+            {
+                "hits": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "additionalProperties": False,
+                        "properties": {
+                            "scratch_id": {"type": "string"},
+                            "cell_id": {"type": ["string", "null"]},
+                            "namespace": {"type": ["string", "null"]},
+                            "tags": _string_array(min_length=None),
+                            "score": {"type": "number"},
+                            "snippet": {"type": "string"},
+                        },
+                        "required": ["scratch_id", "cell_id", "namespace", "tags", "score", "snippet"],
+                    },
+                },
+                "embedder": {"type": "string"},
+            },
+            required_on_ok=["hits", "embedder"],
+        ),
+    },
+    "scratch_list_schemas": {
+        "parameters": _input_schema(
+            {
+                "scratch_id": _id_property("Identifier of the scratch notebook whose shared schemas should be listed."),
+            },
+            required=["scratch_id"],
+        ),
+        "output_schema": _output_schema(
+            {
+                "scratch_id": {"type": "string"},
+                "schemas": {"type": "array", "items": _SCHEMA_ENTRY_SCHEMA},
+            },
+            required_on_ok=["scratch_id", "schemas"],
+        ),
+    },
+    "scratch_get_schema": {
+        "parameters": _input_schema(
+            {
+                "scratch_id": _id_property("Identifier of the scratch notebook containing the schema."),
+                "schema_id": _id_property("UUID of the schema to fetch."),
+            },
+            required=["scratch_id", "schema_id"],
+        ),
+        "output_schema": _output_schema({"schema": _SCHEMA_ENTRY_SCHEMA}, required_on_ok=["schema"]),
+    },
+    "scratch_upsert_schema": {
+        "parameters": _input_schema(
+            {
+                "scratch_id": _id_property("Identifier of the scratch notebook where the schema should be stored."),
+                "schema": _SCHEMA_INPUT_SCHEMA,
+            },
+            required=["scratch_id", "schema"],
+        ),
+        "output_schema": _output_schema({"schema": _SCHEMA_ENTRY_SCHEMA}, required_on_ok=["schema"]),
+    },
+    "scratch_namespace_list": {
+        "parameters": _input_schema(),
+        "output_schema": _output_schema(
+            {
+                "namespaces": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "additionalProperties": False,
+                        "properties": {
+                            "namespace": {"type": "string"},
+                            "scratchpad_count": {"type": "integer", "minimum": 0},
+                        },
+                        "required": ["namespace", "scratchpad_count"],
+                    },
+                },
+            },
+            required_on_ok=["namespaces"],
+        ),
+    },
+    "scratch_namespace_create": {
+        "parameters": _input_schema(
+            {"namespace": _id_property("Namespace string to register.")},
+            required=["namespace"],
+        ),
+        "output_schema": _output_schema(
+            {
+                "namespace": {"type": "string"},
+                "created": {"type": "boolean"},
+            },
+            required_on_ok=["namespace", "created"],
+        ),
+    },
+    "scratch_namespace_rename": {
+        "parameters": _input_schema(
+            {
+                "old_namespace": _id_property("Existing namespace to rename."),
+                "new_namespace": _id_property("New namespace value."),
+                "migrate_scratchpads": {
+                    "type": "boolean",
+                    "default": True,
+                    "description": "When true (default), migrate scratchpads referencing the old namespace.",
+                },
+            },
+            required=["old_namespace", "new_namespace"],
+        ),
+        "output_schema": _output_schema(
+            {
+                "namespace": {"type": "string"},
+                "migrated_count": {"type": "integer", "minimum": 0},
+            },
+            required_on_ok=["namespace", "migrated_count"],
+        ),
+    },
+    "scratch_namespace_delete": {
+        "parameters": _input_schema(
+            {
+                "namespace": _id_property("Namespace to delete."),
+                "delete_scratchpads": {
+                    "type": "boolean",
+                    "default": False,
+                    "description": "When true, delete scratchpads referencing the namespace.",
+                },
+            },
+            required=["namespace"],
+        ),
+        "output_schema": _output_schema(
+            {
+                "deleted": {"type": "boolean"},
+                "removed_scratchpads": {"type": "integer", "minimum": 0},
+            },
+            required_on_ok=["deleted", "removed_scratchpads"],
+        ),
     },
-    "required": ["ok"],
-    "allOf": [_SCHEMA_SUCCESS_CONSTRAINT],
 }
 
+for _tool_name, _tool_schemas in _TOOL_SCHEMAS.items():
+    _tool = globals()[_tool_name]
+    for _attribute, _schema in _tool_schemas.items():
+        setattr(_tool, _attribute, _schema)
+
 
 def main(argv: list[str] | None = None) -> None:
     """CLI entrypoint for running the Scratch Notebook server."""
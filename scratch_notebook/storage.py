@@ -1,5 +1,5 @@
 """Public storage interface backed by LanceDB."""
 
-from .storage_lancedb import DEFAULT_TENANT_ID, Storage, StorageError
+from .storage_lancedb import DEFAULT_TENANT_ID, CellUndo, Storage, StorageError
 
-__all__ = ["Storage", "StorageError", "DEFAULT_TENANT_ID"]
+__all__ = ["Storage", "StorageError", "CellUndo", "DEFAULT_TENANT_ID"]
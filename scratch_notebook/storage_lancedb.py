@@ -2,19 +2,22 @@
 
 from __future__ import annotations
 
-import copy
 import json
+import math
 import re
-from collections import Counter
+import string
 from dataclasses import dataclass
+from collections import OrderedDict
 from collections.abc import Iterable, Mapping, Sequence
 from datetime import datetime, timezone, timedelta
 from functools import wraps
-from threading import RLock
+from threading import Lock, RLock, Thread
 from typing import Any
 
 import lancedb
+import orjson
 import pyarrow as pa
+import pyarrow.compute as pc
 
 from . import models
 from .config import Config
@@ -32,10 +35,21 @@ from .logging import get_logger
 
 logger = get_logger(__name__)
 
-_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,128}$")
+_ID_CHARACTERS = string.ascii_letters + string.digits + "_-"
+_ID_MAX_LENGTH = 128
+CELL_INDEX_CACHE_MAX_ENTRIES = 64
+# Upper bound on literals per ``IN (...)`` delete or update predicate.
+_DELETE_BATCH_SIZE = 1000
+# Deleted scratchpads between compactions of the deletion-fragmented tables.
+_COMPACT_AFTER_DELETES = 64
 _SCRATCHPAD_TABLE_NAME = "scratchpads"
 _EMBEDDINGS_TABLE_NAME = "embeddings"
 _NAMESPACES_TABLE_NAME = "namespaces"
+_ORJSON_DEFAULT = orjson.OPT_NON_STR_KEYS
+_ORJSON_SORTED = orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS
+# orjson reads integers outside the 64-bit range as floats. Blobs written with json.dumps may
+# hold them, so any run of 19+ digits sends the blob to the exact stdlib parser.
+_WIDE_INTEGER_RE = re.compile(r"\d{19}")
 DEFAULT_TENANT_ID = "default"
 
 _SCRATCHPAD_SCHEMA = pa.schema(
@@ -58,6 +72,15 @@ _SCRATCHPAD_SCHEMA = pa.schema(
     ]
 )
 
+_SCRATCHPAD_FIELD_NAMES = tuple(_SCRATCHPAD_SCHEMA.names)
+
+# Scalar columns enough to detect a row or carry its timestamps across a rewrite, without the JSON blobs.
+_KEY_COLUMNS = ["scratch_id"]
+_WRITE_CONTEXT_COLUMNS = ["scratch_id", "created_at", "last_access_at"]
+_HEADER_COLUMNS = ["scratch_id", "metadata_json"]
+
+_LISTING_COLUMNS = ["scratch_id", "namespace", "title", "description", "tags", "cell_tags", "cell_count"]
+
 _NAMESPACES_SCHEMA = pa.schema(
     [
         pa.field("namespace", pa.string()),
@@ -67,6 +90,10 @@ _NAMESPACES_SCHEMA = pa.schema(
 )
 
 
+# Schema metadata marking embeddings tables whose vectors are stored L2-normalised.
+_NORMALIZED_EMBEDDINGS_KEY = b"scratch_notebook.normalized_embeddings"
+
+
 def _build_embedding_schema(dimension: int) -> pa.Schema:
     return pa.schema(
         [
@@ -82,14 +109,40 @@ def _build_embedding_schema(dimension: int) -> pa.Schema:
             pa.field("cell_index", pa.int32()),
             pa.field("embedding", pa.list_(pa.float32(), dimension)),
             pa.field("updated_at", pa.timestamp("us", tz="UTC")),
-        ]
+        ],
+        metadata={_NORMALIZED_EMBEDDINGS_KEY: b"true"},
     )
 
 
+def _search_metric(table) -> str:
+    """Return ``dot`` for tables created with normalised vectors, ``cosine`` for older tables."""
+
+    metadata = table.schema.metadata or {}
+    return "dot" if metadata.get(_NORMALIZED_EMBEDDINGS_KEY) == b"true" else "cosine"
+
+
+def _unit_scale(norm: float) -> float:
+    return 1.0 / norm if norm > 0.0 else 1.0
+
+
 @dataclass(slots=True)
 class ScratchpadSnapshot:
-    row: dict[str, Any]
-    embeddings: list[dict[str, Any]]
+    """Stored scratchpad row and embedding rows, held as immutable Arrow tables."""
+
+    scratch_id: str
+    row: pa.Table
+    embeddings: pa.Table | None
+
+
+@dataclass(slots=True)
+class CellUndo:
+    """Logical undo record for a single-cell append or replace."""
+
+    scratch_id: str
+    op: str
+    cell_id: str
+    index: int | None = None
+    cell: models.ScratchCell | None = None
 
 
 class StorageError(ScratchNotebookError):
@@ -125,20 +178,87 @@ def _ensure_string_list(value: Any) -> list[str]:
 
 
 def _aggregate_cell_tags(cells: Iterable[models.ScratchCell]) -> list[str]:
+    tag_lists = [tags for tags in (cell.metadata.get("tags") for cell in cells) if tags]
     tags: set[str] = set()
-    for cell in cells:
-        for tag in _ensure_string_list(cell.metadata.get("tags")):
-            tags.add(tag)
+    # Normalised cell metadata stores tags as lists of strings; union those in one C-level call
+    # and only fall back to per-value coercion when something else slipped through.
+    if all(type(value) is list for value in tag_lists):
+        tags.update(*tag_lists)
+        if all(type(tag) is str for tag in tags):
+            return sorted(tags)
+        tags.clear()
+    for value in tag_lists:
+        tags.update(_ensure_string_list(value))
     return sorted(tags)
 
 
-def _encode_json(payload: Any, *, context: str) -> str:
+def _distinct_tags(column: pa.ChunkedArray) -> list[str]:
+    """Return the sorted distinct non-empty tags of a ``list<string>`` column."""
+
+    values = pc.drop_null(pc.unique(pc.utf8_trim_whitespace(pc.list_flatten(column))))
+    return sorted(tag for tag in values.to_pylist() if tag)
+
+
+def _any_tag_mask(table: pa.Table, columns: Sequence[str], wanted: Iterable[str]) -> pa.Array:
+    """Return a boolean mask of rows whose ``list<string>`` ``columns`` contain any ``wanted`` tag."""
+
+    value_set = pa.array(sorted(wanted), type=pa.string())
+    matched_rows: list[pa.Array] = []
+    for name in columns:
+        column = table.column(name)
+        if column.num_chunks == 0:
+            continue
+        values = column.chunk(0) if column.num_chunks == 1 else pa.concat_arrays(column.chunks)
+        hits = pc.is_in(pc.list_flatten(values), value_set=value_set)
+        matched_rows.append(pc.cast(pc.filter(pc.list_parent_indices(values), hits), pa.int64()))
+    row_numbers = pa.array(range(table.num_rows), type=pa.int64())
+    if not matched_rows:
+        return pa.array([False] * table.num_rows, type=pa.bool_())
+    return pc.is_in(row_numbers, value_set=pa.concat_arrays(matched_rows))
+
+
+def _contains_non_finite(payload: Any) -> bool:
+    stack = [payload]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, Mapping):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
+
+
+def _encode_json(payload: Any, *, context: str, sort_keys: bool = False) -> bytes:
+    # Stored blobs are only ever decoded again, never hashed or diffed, so key order is kept
+    # as constructed unless a caller asks for canonical output. orjson's UTF-8 bytes go to the
+    # string columns as-is; Arrow accepts them without an intermediate ``str``.
     try:
-        return json.dumps(payload, ensure_ascii=False, sort_keys=True)
+        encoded = orjson.dumps(payload, option=_ORJSON_SORTED if sort_keys else _ORJSON_DEFAULT)
+    except TypeError:
+        # Includes integers wider than 64 bits, which the stdlib encoder writes exactly.
+        encoded = None
+    # orjson writes NaN and infinities as null; the stdlib keeps them as NaN/Infinity literals.
+    if encoded is not None and not (b"null" in encoded and _contains_non_finite(payload)):
+        return encoded
+    try:
+        return json.dumps(payload, ensure_ascii=False, sort_keys=sort_keys).encode()
     except (TypeError, ValueError) as exc:  # pragma: no cover - defensive
         raise StorageError(CONFIG_ERROR, f"Unable to serialize {context}") from exc
 
 
+def _decode_json(payload: str) -> Any:
+    if _WIDE_INTEGER_RE.search(payload) is None:
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            # Blobs written with json.dumps may contain NaN or Infinity literals.
+            pass
+    return json.loads(payload)
+
+
 def _format_filter(field: str, value: str) -> str:
     escaped = value.replace("'", "\\'")
     return f"{field} = '{escaped}'"
@@ -149,6 +269,29 @@ def _quote_literal(value: str) -> str:
     return f"'{escaped}'"
 
 
+def _is_valid_identifier(value: str) -> bool:
+    # ``strip`` removes every allowed character from both ends, leaving "" only when none other occur.
+    return (
+        isinstance(value, str)
+        and 0 < len(value) <= _ID_MAX_LENGTH
+        and value.isascii()
+        and not value.strip(_ID_CHARACTERS)
+    )
+
+
+def _format_in_filter(field: str, values: Iterable[str]) -> str:
+    literals = ", ".join(_quote_literal(value) for value in sorted(values))
+    return f"{field} IN ({literals})"
+
+
+def _delete_in_batches(table: Any, scratch_ids: Sequence[str]) -> None:
+    """Delete rows of ``table`` for ``scratch_ids`` with one ``IN`` predicate per batch."""
+
+    ids = list(scratch_ids)
+    for start in range(0, len(ids), _DELETE_BATCH_SIZE):
+        table.delete(where=_format_in_filter("scratch_id", ids[start : start + _DELETE_BATCH_SIZE]))
+
+
 def _normalize_namespace_value(namespace: str) -> str:
     if not isinstance(namespace, str):
         raise ScratchNotebookError(VALIDATION_ERROR, "Namespace must be a string")
@@ -158,6 +301,23 @@ def _normalize_namespace_value(namespace: str) -> str:
     return normalized
 
 
+_ROOT_WRITE_LOCKS: dict[str, RLock] = {}
+_ROOT_WRITE_LOCKS_GUARD = RLock()
+# Embeddings generation per LanceDB root; bumped under that root's write lock.
+_ROOT_EMBEDDINGS_GENERATIONS: dict[str, int] = {}
+
+
+def _root_write_lock(root: Any) -> RLock:
+    """Return the process-wide write lock shared by every Storage opened on ``root``."""
+
+    key = str(root)
+    with _ROOT_WRITE_LOCKS_GUARD:
+        lock = _ROOT_WRITE_LOCKS.get(key)
+        if lock is None:
+            lock = _ROOT_WRITE_LOCKS[key] = RLock()
+        return lock
+
+
 def synchronized(method):
     @wraps(method)
     def wrapper(self, *args, **kwargs):
@@ -167,6 +327,21 @@ def synchronized(method):
     return wrapper
 
 
+def write_synchronized(method):
+    """Serialise ``method`` against all writers of the same LanceDB root.
+
+    The instance lock is always taken before the root lock, so synchronized methods that
+    delegate to writers keep a consistent lock order.
+    """
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock, self._write_lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 class Storage:
     """LanceDB-backed persistence for scratch notebooks."""
 
@@ -177,6 +352,13 @@ class Storage:
         tenant_value = (tenant_id or "").strip() if tenant_id else ""
         self._tenant_id = tenant_value or DEFAULT_TENANT_ID
         self._lock = RLock()
+        # Reads record access times here instead of writing; flush_access_times persists them.
+        self._pending_access: dict[str, datetime] = {}
+        self._pending_access_lock = Lock()
+        self._root_key = str(self._root.resolve())
+        self._write_lock = _root_write_lock(self._root_key)
+        # scratch_id -> (updated_at, cell_count, cell_id -> index) for recently edited pads.
+        self._cell_index_cache: OrderedDict[str, tuple[Any, int, dict[str, int]]] = OrderedDict()
         self._last_evicted: list[str] = []
         self._pending_eviction_snapshots: list[ScratchpadSnapshot] = []
         self._eviction_policy = (config.eviction_policy or "").strip().lower() or "discard"
@@ -187,8 +369,14 @@ class Storage:
             raise StorageError(CONFIG_ERROR, "Unable to open LanceDB database", details={"path": str(self._root)}) from exc
 
         self._table = self._ensure_table()
+        self._scratch_id_indexed = False
+        self._ensure_scratch_id_index()
         self._ensure_tenant_scalar_index()
         self._namespaces_table = self._ensure_namespaces_table()
+        # (tenant_id, namespace) pairs known to be registered; lets repeated writes skip the lookup.
+        self._known_namespaces: set[tuple[str, str]] = set()
+        self._deletes_since_compaction = 0
+        self._compaction_thread: Thread | None = None
         self._embeddings_table = None
         self._embedding_dimension = None
 
@@ -196,14 +384,14 @@ class Storage:
     # Public helpers
     # ------------------------------------------------------------------
 
-    @synchronized
     def validate_identifier(self, scratch_id: str) -> None:
+        # A pure string check; it reads no storage state, so it takes no lock.
         self._ensure_valid_identifier(scratch_id)
 
     @synchronized
     def has_scratchpad(self, scratch_id: str) -> bool:
         self._ensure_valid_identifier(scratch_id)
-        return self._fetch_row(scratch_id) is not None
+        return self._fetch_row(scratch_id, columns=_KEY_COLUMNS) is not None
 
     @synchronized
     def set_tenant(self, tenant_id: str | None) -> None:
@@ -214,7 +402,42 @@ class Storage:
     def tenant_id(self) -> str:
         return self._tenant_id
 
-    @synchronized
+    def embeddings_generation(self) -> int:
+        """Return a counter that changes whenever the embeddings table of this root is mutated.
+
+        The counter is shared by every Storage opened on the same root, so writes made through
+        another instance are seen too.
+        """
+
+        return _ROOT_EMBEDDINGS_GENERATIONS.get(self._root_key, 0)
+
+    @write_synchronized
+    def flush_access_times(self) -> None:
+        """Persist the access times recorded by reads since the last flush.
+
+        Each batch of pads is stamped with its newest recorded access in one column-only
+        update, so a flush adds one table version per batch however many reads it covers.
+        """
+
+        with self._pending_access_lock:
+            pending, self._pending_access = self._pending_access, {}
+        scratch_ids = sorted(pending)
+        for start in range(0, len(scratch_ids), _DELETE_BATCH_SIZE):
+            batch = scratch_ids[start : start + _DELETE_BATCH_SIZE]
+            self._table.update(
+                where=_format_in_filter("scratch_id", batch),
+                values={"last_access_at": max(pending[scratch_id] for scratch_id in batch)},
+            )
+
+    def finish_compaction(self) -> None:
+        """Wait for a compaction started after deletes to finish writing its files."""
+
+        # Not synchronized: the worker needs the root write lock to finish.
+        thread = self._compaction_thread
+        if thread is not None:
+            thread.join()
+
+    @write_synchronized
     def migrate_default_tenant(self, target_tenant: str | None) -> list[str]:
         desired = (target_tenant or "").strip() if target_tenant else ""
         if not desired or desired == DEFAULT_TENANT_ID:
@@ -234,8 +457,8 @@ class Storage:
                     rows.append(row)
 
         migrated: list[str] = []
-        original_tenant = self._tenant_id
-
+        records: list[dict[str, Any]] = []
+        timestamp = _now()
         for row in rows:
             tenant_value = (row.get("tenant_id") or "").strip() or DEFAULT_TENANT_ID
             if tenant_value != DEFAULT_TENANT_ID:
@@ -243,29 +466,34 @@ class Storage:
             scratch_id = row.get("scratch_id")
             if not scratch_id:
                 continue
-
-            pad = self._pad_from_row(row)
-            embeddings_rows = self._capture_embeddings_rows(scratch_id)
-            for embedding in embeddings_rows:
-                embedding["tenant_id"] = desired
-
-            self._tenant_id = desired
-            self._write_pad(pad, existing_row=row, touch_access=False)
-            if embeddings_rows:
-                self._restore_embeddings_rows(scratch_id, embeddings_rows)
+            # Only the tenant changes; the stored JSON blobs are carried over without decoding.
+            record = dict(row)
+            record["tenant_id"] = desired
+            record["updated_at"] = timestamp
+            record["last_access_at"] = _coerce_timestamp(row.get("last_access_at"), default=timestamp)
+            records.append(record)
             migrated.append(scratch_id)
+        if not records:
+            return []
 
-        self._tenant_id = desired if migrated else original_tenant
+        self._tenant_id = desired
+        self._upsert_rows(records)
+        self._rewrite_embeddings_field(migrated, "tenant_id", desired)
+        for namespace_value in sorted({str(record["namespace"]) for record in records if record.get("namespace")}):
+            try:
+                self.register_namespace(namespace_value)
+            except ScratchNotebookError:
+                logger.warning("Failed to register namespace '%s'", namespace_value, exc_info=True)
         return migrated
 
     # ------------------------------------------------------------------
     # CRUD operations
     # ------------------------------------------------------------------
 
-    @synchronized
+    @write_synchronized
     def create_scratchpad(self, pad: models.Scratchpad, *, overwrite: bool = True) -> models.Scratchpad:
         self._ensure_valid_identifier(pad.scratch_id)
-        existing = self._fetch_row(pad.scratch_id)
+        existing = self._fetch_row(pad.scratch_id, columns=_WRITE_CONTEXT_COLUMNS)
 
         if existing is not None and not overwrite:
             raise StorageError(INVALID_ID, f"Scratchpad {pad.scratch_id} already exists")
@@ -278,36 +506,58 @@ class Storage:
         self._write_pad(pad, existing)
         return pad
 
-    @synchronized
     def read_scratchpad(self, scratch_id: str) -> models.Scratchpad:
+        row = self._read_scratchpad_row(scratch_id)
+        # Decoding the JSON blobs touches no shared state, so it runs after the lock is released.
+        return self._pad_from_row(row)
+
+    def _read_pad_header(self, scratch_id: str) -> models.Scratchpad:
+        """Return ``scratch_id`` with its metadata only; ``cells_json`` is neither read nor decoded."""
+
+        return self._pad_from_row(self._read_scratchpad_row(scratch_id, columns=_HEADER_COLUMNS))
+
+    def _read_scratchpad_row(self, scratch_id: str, *, columns: Sequence[str] | None = None) -> dict[str, Any]:
+        # Takes no storage lock: the scan reads an immutable table version and the access time
+        # is only recorded in memory.
         self._ensure_valid_identifier(scratch_id)
-        row = self._fetch_row(scratch_id)
+        row = self._fetch_row(scratch_id, columns=columns)
         if row is None:
             raise StorageError(NOT_FOUND, f"Scratchpad {scratch_id} not found")
-        updated_row = self._touch_last_access(row)
-        return self._pad_from_row(updated_row)
+        self._record_access(str(scratch_id))
+        return row
 
-    @synchronized
+    @write_synchronized
     def delete_scratchpad(self, scratch_id: str) -> bool:
         self._ensure_valid_identifier(scratch_id)
-        if self._fetch_row(scratch_id) is None:
+        if self._fetch_row(scratch_id, columns=_KEY_COLUMNS) is None:
             return False
         self._delete_row(scratch_id)
-        self._restore_embeddings_rows(scratch_id, [])
-        return self._fetch_row(scratch_id) is None
+        self._restore_embeddings_rows(scratch_id, None)
+        self._cell_index_cache.pop(scratch_id, None)
+        self._record_deletes(1)
+        return self._fetch_row(scratch_id, columns=_KEY_COLUMNS) is None
 
-    @synchronized
+    @write_synchronized
     def register_namespace(self, namespace: str) -> tuple[str, bool]:
         normalized = _normalize_namespace_value(namespace)
+        key = (self._tenant_id, normalized)
+        if key in self._known_namespaces:
+            return normalized, False
         table = self._namespaces_table
-        existing = [
-            row
-            for row in table.to_arrow().to_pylist()
-            if (row.get("tenant_id") or "") == self._tenant_id and (row.get("namespace") or "") == normalized
-        ]
-        if existing:
+        existing = self._scan(
+            table,
+            equals={"tenant_id": self._tenant_id, "namespace": normalized},
+            columns=["namespace"],
+            limit=1,
+        )
+        if existing.num_rows:
+            self._known_namespaces.add(key)
             return normalized, False
-        table.add(
+        self._add_namespace_row(normalized)
+        return normalized, True
+
+    def _add_namespace_row(self, normalized: str) -> None:
+        self._namespaces_table.add(
             [
                 {
                     "namespace": normalized,
@@ -316,29 +566,27 @@ class Storage:
                 }
             ]
         )
-        return normalized, True
+        self._known_namespaces.add((self._tenant_id, normalized))
 
     @synchronized
     def list_namespaces(self) -> list[dict[str, Any]]:
-        table_rows = [
-            row
-            for row in self._namespaces_table.to_arrow().to_pylist()
-            if (row.get("tenant_id") or "") == self._tenant_id
-        ]
-        registry = {str(row.get("namespace") or ""): row for row in table_rows}
-
-        scratchpad_rows = [
-            row
-            for row in self._table.to_arrow().to_pylist()
-            if (row.get("tenant_id") or "") == self._tenant_id
-        ]
-        counts: Counter[str] = Counter()
-        for row in scratchpad_rows:
-            namespace_value = (row.get("namespace") or "").strip()
-            if namespace_value:
-                counts[namespace_value] += 1
+        tenant = {"tenant_id": self._tenant_id}
+        registered = self._scan(self._namespaces_table, equals=tenant, columns=["namespace"])
+        registry = {str(value or "") for value in registered.column("namespace").to_pylist()}
+
+        scratchpad_namespaces = self._scan(self._table, equals=tenant, columns=["namespace"])
+        namespace_column = pc.drop_null(pc.utf8_trim_whitespace(scratchpad_namespaces.column("namespace")))
+        value_counts = pc.value_counts(namespace_column)
+        counts = {
+            name: count
+            for name, count in zip(
+                value_counts.field("values").to_pylist(),
+                value_counts.field("counts").to_pylist(),
+            )
+            if name
+        }
 
-        namespaces = set(registry.keys()) | set(counts.keys())
+        namespaces = registry | set(counts.keys())
         entries: list[dict[str, Any]] = []
         for name in namespaces:
             if not name:
@@ -352,7 +600,7 @@ class Storage:
         entries.sort(key=lambda item: item["namespace"])
         return entries
 
-    @synchronized
+    @write_synchronized
     def rename_namespace(
         self,
         old_namespace: str,
@@ -368,22 +616,17 @@ class Storage:
             self.register_namespace(target)
             return target, 0
 
-        table_rows = [
-            row
-            for row in self._namespaces_table.to_arrow().to_pylist()
-            if (row.get("tenant_id") or "") == self._tenant_id
-        ]
-        existing_names = {str(row.get("namespace") or "") for row in table_rows}
+        registered = self._scan(self._namespaces_table, equals={"tenant_id": self._tenant_id}, columns=["namespace"])
+        existing_names = {str(value or "") for value in registered.column("namespace").to_pylist()}
         if source not in existing_names:
             raise ScratchNotebookError(NOT_FOUND, f"Namespace '{source}' not found")
         if target in existing_names:
             raise ScratchNotebookError(VALIDATION_ERROR, f"Namespace '{target}' already exists")
 
-        scratchpad_rows = [
-            row
-            for row in self._table.to_arrow().to_pylist()
-            if (row.get("tenant_id") or "") == self._tenant_id and (row.get("namespace") or "") == source
-        ]
+        scratchpad_rows = self._scan(
+            self._table,
+            equals={"tenant_id": self._tenant_id, "namespace": source},
+        ).to_pylist()
 
         if scratchpad_rows and not migrate_scratchpads:
             raise ScratchNotebookError(
@@ -391,44 +634,41 @@ class Storage:
                 f"Namespace '{source}' has {len(scratchpad_rows)} scratchpad(s); set migrate_scratchpads=true to rename.",
             )
 
-        migrated_count = 0
+        records: list[dict[str, Any]] = []
+        migrated_ids: list[str] = []
+        timestamp = _now()
         for row in scratchpad_rows:
             scratch_id = row.get("scratch_id")
             if not scratch_id:
                 continue
-            pad = self._pad_from_row(row)
-            pad.metadata = dict(pad.metadata or {})
-            pad.metadata["namespace"] = target
-            embeddings_rows = self._capture_embeddings_rows(scratch_id)
-            for embedding in embeddings_rows:
-                embedding["namespace"] = target
-            self._write_pad(pad, existing_row=row)
-            if embeddings_rows:
-                self._restore_embeddings_rows(scratch_id, embeddings_rows)
-            migrated_count += 1
+            # The namespace lives in the metadata blob and its own column; cells_json is untouched.
+            metadata_json = row.get("metadata_json")
+            metadata = _decode_json(metadata_json) if metadata_json else {}
+            metadata["namespace"] = target
+            record = dict(row)
+            record["namespace"] = target
+            record["metadata_json"] = _encode_json(metadata, context="metadata")
+            record["updated_at"] = timestamp
+            record["last_access_at"] = timestamp
+            records.append(record)
+            migrated_ids.append(scratch_id)
+        if records:
+            self._upsert_rows(records)
+            self._rewrite_embeddings_field(migrated_ids, "namespace", target)
 
         condition = f"{_format_filter('tenant_id', self._tenant_id)} AND {_format_filter('namespace', source)}"
         self._namespaces_table.delete(where=condition)
-        self._namespaces_table.add(
-            [
-                {
-                    "namespace": target,
-                    "tenant_id": self._tenant_id,
-                    "created_at": _now(),
-                }
-            ]
-        )
-        return target, migrated_count
+        self._known_namespaces.discard((self._tenant_id, source))
+        # ``existing_names`` was read under this same write lock and showed no target row.
+        self._add_namespace_row(target)
+        return target, len(migrated_ids)
 
-    @synchronized
+    @write_synchronized
     def delete_namespace(self, namespace: str, *, delete_scratchpads: bool = False) -> tuple[bool, int]:
         normalized = _normalize_namespace_value(namespace)
-        scratchpad_rows = [
-            row
-            for row in self._table.to_arrow().to_pylist()
-            if (row.get("tenant_id") or "") == self._tenant_id and (row.get("namespace") or "") == normalized
-        ]
-        scratchpad_ids = [str(row.get("scratch_id")) for row in scratchpad_rows if row.get("scratch_id")]
+        scope = {"tenant_id": self._tenant_id, "namespace": normalized}
+        scratchpad_rows = self._scan(self._table, equals=scope, columns=["scratch_id"])
+        scratchpad_ids = [str(value) for value in scratchpad_rows.column("scratch_id").to_pylist() if value]
 
         if scratchpad_ids and not delete_scratchpads:
             raise ScratchNotebookError(
@@ -436,24 +676,24 @@ class Storage:
                 f"Namespace '{normalized}' cannot be deleted while {len(scratchpad_ids)} scratchpad(s) reference it.",
             )
 
+        condition = f"{_format_filter('tenant_id', self._tenant_id)} AND {_format_filter('namespace', normalized)}"
         removed_count = 0
         if scratchpad_ids:
+            self._table.delete(where=condition)
+            self._bulk_delete_embeddings(scratchpad_ids)
             for scratch_id in scratchpad_ids:
-                if self.delete_scratchpad(scratch_id):
-                    removed_count += 1
-
-        table_rows = [
-            row
-            for row in self._namespaces_table.to_arrow().to_pylist()
-            if (row.get("tenant_id") or "") == self._tenant_id and (row.get("namespace") or "") == normalized
-        ]
+                self._cell_index_cache.pop(scratch_id, None)
+            removed_count = len(scratchpad_ids)
+            self._record_deletes(removed_count)
+
+        registered = self._scan(self._namespaces_table, equals=scope, columns=["namespace"], limit=1)
         deleted = False
-        if table_rows:
-            condition = f"{_format_filter('tenant_id', self._tenant_id)} AND {_format_filter('namespace', normalized)}"
+        if registered.num_rows:
             self._namespaces_table.delete(where=condition)
+            self._known_namespaces.discard((self._tenant_id, normalized))
             deleted = True
 
-        if not table_rows and not scratchpad_ids:
+        if not registered.num_rows and not scratchpad_ids:
             return False, 0
 
         return deleted, removed_count
@@ -465,9 +705,14 @@ class Storage:
         namespaces: Sequence[str] | None = None,
         tags: Sequence[str] | None = None,
         limit: int | None = None,
+        cursor: str | None = None,
     ) -> list[dict[str, Any]]:
-        arrow_table = self._table.to_arrow()
-        entries: list[dict[str, Any]] = []
+        """Return lean listing entries ordered by ``scratch_id``.
+
+        ``cursor`` resumes after the given ``scratch_id``; ``limit`` caps the entries returned
+        after filtering. Only the listing columns are materialised, never cell payloads.
+        """
+
         namespace_filter: set[str] | None = None
         if namespaces:
             namespace_filter = {
@@ -483,34 +728,29 @@ class Storage:
                 if isinstance(tag, (str, bytes)) and str(tag).strip()
             } or None
 
-        rows = arrow_table.to_pylist()
+        arrow_table = self._scan(
+            self._table,
+            equals={"tenant_id": self._tenant_id},
+            any_of={"namespace": namespace_filter} if namespace_filter else None,
+            columns=_LISTING_COLUMNS,
+        )
+        # Filter, sort and slice in Arrow; only the returned page is converted to Python.
+        if cursor is not None:
+            arrow_table = arrow_table.filter(pc.fill_null(pc.greater(arrow_table["scratch_id"], cursor), False))
+        if tag_filter is not None:
+            arrow_table = arrow_table.filter(_any_tag_mask(arrow_table, ("tags", "cell_tags"), tag_filter))
+        arrow_table = arrow_table.sort_by("scratch_id")
         if limit is not None and limit >= 0:
-            rows = rows[:limit]
-
-        for row in rows:
-            namespace_value = row.get("namespace") or ""
-            if namespace_filter is not None and namespace_value not in namespace_filter:
-                continue
-            if tag_filter is not None:
-                row_tags = {str(value) for value in (row.get("tags") or [])}
-                row_cell_tags = {str(value) for value in (row.get("cell_tags") or [])}
-                if not (row_tags | row_cell_tags).intersection(tag_filter):
-                    continue
-            entries.append(
-                {
-                    "scratch_id": row.get("scratch_id"),
-                    "title": row.get("title"),
-                    "description": row.get("description"),
-                    "namespace": row.get("namespace"),
-                    "cell_count": row.get("cell_count", 0) or 0,
-                }
-            )
-        entries.sort(key=lambda item: item.get("scratch_id") or "")
-        return entries
+            arrow_table = arrow_table.slice(0, limit)
+        arrow_table = arrow_table.set_column(
+            arrow_table.schema.get_field_index("cell_count"),
+            "cell_count",
+            pc.fill_null(arrow_table["cell_count"], 0),
+        )
+        return arrow_table.select(["scratch_id", "title", "description", "namespace", "cell_count"]).to_pylist()
 
     @synchronized
     def list_tags(self, *, namespaces: Sequence[str] | None = None) -> dict[str, list[str]]:
-        arrow_table = self._table.to_arrow()
         namespace_filter: set[str] | None = None
         if namespaces:
             namespace_filter = {
@@ -519,31 +759,16 @@ class Storage:
                 if isinstance(ns, (str, bytes)) and str(ns).strip()
             } or None
 
-        scratchpad_tags: list[str] = []
-        cell_tags: list[str] = []
-        seen_pad: set[str] = set()
-        seen_cell: set[str] = set()
-
-        for row in arrow_table.to_pylist():
-            namespace_value = row.get("namespace") or ""
-            if namespace_filter is not None and namespace_value not in namespace_filter:
-                continue
-
-            for value in row.get("tags") or []:
-                tag = (value.decode("utf-8", "ignore") if isinstance(value, bytes) else str(value)).strip()
-                if tag and tag not in seen_pad:
-                    seen_pad.add(tag)
-                    scratchpad_tags.append(tag)
-
-            for value in row.get("cell_tags") or []:
-                tag = (value.decode("utf-8", "ignore") if isinstance(value, bytes) else str(value)).strip()
-                if tag and tag not in seen_cell:
-                    seen_cell.add(tag)
-                    cell_tags.append(tag)
-
-        scratchpad_tags.sort()
-        cell_tags.sort()
-        return {"scratchpad_tags": scratchpad_tags, "cell_tags": cell_tags}
+        arrow_table = self._scan(
+            self._table,
+            equals={"tenant_id": self._tenant_id},
+            any_of={"namespace": namespace_filter} if namespace_filter else None,
+            columns=["tags", "cell_tags"],
+        )
+        return {
+            "scratchpad_tags": _distinct_tags(arrow_table.column("tags")),
+            "cell_tags": _distinct_tags(arrow_table.column("cell_tags")),
+        }
 
     @synchronized
     def list_cells(self, scratch_id: str) -> list[models.ScratchCell]:
@@ -552,7 +777,7 @@ class Storage:
 
     @synchronized
     def list_schemas(self, scratch_id: str) -> list[dict[str, Any]]:
-        pad = self.read_scratchpad(scratch_id)
+        pad = self._read_pad_header(scratch_id)
         registry = models.normalize_schema_registry_entries(pad.metadata.get("schemas"))
         entries = [dict(value) for value in registry.values()]
         entries.sort(key=lambda item: ((item.get("description") or "").lower(), item.get("name") or ""))
@@ -560,7 +785,7 @@ class Storage:
 
     @synchronized
     def get_schema(self, scratch_id: str, schema_id: str) -> dict[str, Any]:
-        pad = self.read_scratchpad(scratch_id)
+        pad = self._read_pad_header(scratch_id)
         registry = models.normalize_schema_registry_entries(pad.metadata.get("schemas"))
         normalized = schema_id.lower()
         for value in registry.values():
@@ -569,7 +794,7 @@ class Storage:
                 return dict(value)
         raise StorageError(NOT_FOUND, "Schema not found", details={"scratch_id": scratch_id, "schema_id": schema_id})
 
-    @synchronized
+    @write_synchronized
     def upsert_schema(self, scratch_id: str, entry: Mapping[str, Any]) -> dict[str, Any]:
         pad = self.read_scratchpad(scratch_id)
         registry = models.normalize_schema_registry_entries(pad.metadata.get("schemas"))
@@ -598,7 +823,7 @@ class Storage:
         self._write_pad(pad)
         return dict(canonical_registry[target_name])
 
-    @synchronized
+    @write_synchronized
     def append_cell(self, scratch_id: str, cell: models.ScratchCell) -> models.Scratchpad:
         row = self._fetch_row(scratch_id)
         if row is None:
@@ -611,7 +836,7 @@ class Storage:
         self._write_pad(pad, row)
         return pad
 
-    @synchronized
+    @write_synchronized
     def replace_cell(
         self,
         scratch_id: str,
@@ -624,8 +849,7 @@ class Storage:
         if row is None:
             raise StorageError(NOT_FOUND, f"Scratchpad {scratch_id} not found")
         pad = self._pad_from_row(row)
-        cell_lookup = {existing.cell_id: idx for idx, existing in enumerate(pad.cells)}
-        current_index = cell_lookup.get(str(cell_id))
+        cell_lookup, current_index = self._locate_cell(scratch_id, row, pad, str(cell_id))
         if current_index is None:
             raise StorageError(NOT_FOUND, f"Cell id {cell_id} not found")
 
@@ -648,7 +872,14 @@ class Storage:
         for idx, candidate in enumerate(pad.cells):
             candidate.index = idx
 
-        self._write_pad(pad, row)
+        record = self._write_pad(pad, row)
+        # An in-place replace keeps every cell at its position, so the lookup stays valid.
+        self._remember_cell_index(
+            scratch_id,
+            record,
+            cell_lookup if target_index == current_index else None,
+            pad,
+        )
         return pad
 
     # ------------------------------------------------------------------
@@ -662,8 +893,34 @@ class Storage:
             missing = [field.name for field in _SCRATCHPAD_SCHEMA if field.name not in table.schema.names]
             if missing:
                 raise StorageError(CONFIG_ERROR, "Existing LanceDB table missing required columns", details={"missing": missing})
-            return table
-        return self._db.create_table(_SCRATCHPAD_TABLE_NAME, schema=_SCRATCHPAD_SCHEMA)
+        else:
+            table = self._db.create_table(_SCRATCHPAD_TABLE_NAME, schema=_SCRATCHPAD_SCHEMA)
+        return table
+
+    def _ensure_scratch_id_index(self) -> None:
+        """Serve ``scratch_id`` lookups from a scalar index where LanceDB supports one.
+
+        LanceDB cannot index an empty table, so the attempt waits until the table has rows and
+        is retried after each write until then. Rows written after the index was built are
+        still scanned, so lookups stay correct.
+        """
+
+        if self._scratch_id_indexed:
+            return
+        if not hasattr(self._table, "create_scalar_index"):
+            self._scratch_id_indexed = True
+            return
+        if self._table.count_rows() == 0:
+            return
+        self._scratch_id_indexed = True
+        try:
+            self._table.create_scalar_index("scratch_id", replace=False)
+        except Exception as exc:  # pragma: no cover - index already exists or unsupported
+            message = str(exc).lower()
+            if "exists" in message or "duplicate" in message:
+                logger.debug("Scalar index for scratch_id already exists")
+                return
+            logger.warning("Unable to ensure scratch_id scalar index", exc_info=True)
 
     def _ensure_namespaces_table(self):
         table_names = set(self._db.table_names())
@@ -691,6 +948,20 @@ class Storage:
                 return
             logger.warning("Unable to ensure tenant_id scalar index", exc_info=True)
 
+    def _embeddings_table_exists(self) -> bool:
+        """Return whether the embeddings table exists, asking LanceDB only until it is opened.
+
+        Only a positive answer is remembered: another instance on the same root may create the
+        table later, so a miss is re-checked next time.
+        """
+
+        if self._embeddings_table is not None:
+            return True
+        if _EMBEDDINGS_TABLE_NAME not in self._db.table_names():
+            return False
+        self._ensure_embedding_table()
+        return True
+
     def _ensure_embedding_table(self, dimension: int | None = None):
         if self._embeddings_table is not None:
             table = self._embeddings_table
@@ -743,56 +1014,180 @@ class Storage:
         existing_row: dict[str, Any] | None = None,
         *,
         touch_access: bool = True,
-    ) -> None:
+    ) -> dict[str, Any]:
         if existing_row is None:
-            existing_row = self._fetch_row(pad.scratch_id)
+            existing_row = self._fetch_row(pad.scratch_id, columns=_WRITE_CONTEXT_COLUMNS)
         created_at = existing_row.get("created_at") if existing_row else None
+        now = _now()
         if touch_access:
-            last_access_at = _now()
+            last_access_at = now
+            # The write stores a newer access time than any read recorded before it.
+            with self._pending_access_lock:
+                self._pending_access.pop(pad.scratch_id, None)
         else:
             last_access_at = _coerce_timestamp(
                 (existing_row or {}).get("last_access_at"),
-                default=_now(),
+                default=now,
             )
-        record = self._serialize_pad(pad, created_at, last_access_at=last_access_at)
-        self._delete_row(pad.scratch_id)
-        self._table.add([record])
+        record = self._serialize_pad(pad, created_at, last_access_at=last_access_at, now=now)
+        self._upsert_row(record)
+        # Callers that know the new cell order re-remember it after the write.
+        self._cell_index_cache.pop(pad.scratch_id, None)
         namespace_value = record.get("namespace")
-        if namespace_value:
+        # Known namespaces skip the synchronized register call entirely on the steady-state write path.
+        if namespace_value and (self._tenant_id, namespace_value) not in self._known_namespaces:
             try:
                 self.register_namespace(str(namespace_value))
             except ScratchNotebookError:
                 # Registration failures should not prevent write; log for diagnostics.
                 logger.warning("Failed to register namespace '%s'", namespace_value, exc_info=True)
+        return record
+
+    def _locate_cell(
+        self,
+        scratch_id: str,
+        row: Mapping[str, Any],
+        pad: models.Scratchpad,
+        cell_id: str,
+    ) -> tuple[dict[str, int], int | None]:
+        """Return the cell id -> position lookup for ``pad`` and the position of ``cell_id``.
+
+        A cached lookup is reused while the row's ``updated_at`` and cell count match. Timestamps
+        can repeat (coarse clocks, bulk namespace rewrites), so the cached position is checked
+        against the decoded cells and the lookup is rebuilt when it disagrees.
+        """
+
+        cached = self._cell_index_cache.get(scratch_id)
+        if cached is not None and cached[0] == row.get("updated_at") and cached[1] == len(pad.cells):
+            lookup = cached[2]
+            index = lookup.get(cell_id)
+            if index is not None and pad.cells[index].cell_id == cell_id:
+                self._cell_index_cache.move_to_end(scratch_id)
+                return lookup, index
+        lookup = {existing.cell_id: idx for idx, existing in enumerate(pad.cells)}
+        self._remember_cell_index(scratch_id, row, lookup, pad)
+        return lookup, lookup.get(cell_id)
+
+    def _remember_cell_index(
+        self,
+        scratch_id: str,
+        row: Mapping[str, Any],
+        lookup: dict[str, int] | None,
+        pad: models.Scratchpad,
+    ) -> None:
+        if lookup is None:
+            lookup = {existing.cell_id: idx for idx, existing in enumerate(pad.cells)}
+        self._cell_index_cache[scratch_id] = (row.get("updated_at"), len(pad.cells), lookup)
+        self._cell_index_cache.move_to_end(scratch_id)
+        while len(self._cell_index_cache) > CELL_INDEX_CACHE_MAX_ENTRIES:
+            self._cell_index_cache.popitem(last=False)
+
+    def _record_access(self, scratch_id: str) -> None:
+        with self._pending_access_lock:
+            self._pending_access[scratch_id] = _now()
 
-    def _touch_last_access(self, row: Mapping[str, Any]) -> dict[str, Any]:
-        scratch_id = row.get("scratch_id")
-        if not scratch_id:
-            return dict(row)
-        updated = dict(row)
-        updated["last_access_at"] = _now()
-        self._delete_row(str(scratch_id))
-        self._table.add([updated])
-        return updated
+    def _pending_access_times(self) -> dict[str, datetime]:
+        with self._pending_access_lock:
+            return dict(self._pending_access)
+
+    def _upsert_row(self, record: Mapping[str, Any]) -> None:
+        """Insert or replace the scratchpad row keyed by ``scratch_id`` in one table version."""
+
+        self._upsert_rows([record])
+
+    def _upsert_rows(self, records: Sequence[Mapping[str, Any]]) -> None:
+        # Column-wise construction converts each column straight into its typed Arrow array.
+        columns = {name: [record.get(name) for record in records] for name in _SCRATCHPAD_FIELD_NAMES}
+        self._upsert_table(pa.Table.from_pydict(columns, schema=_SCRATCHPAD_SCHEMA))
+
+    def _upsert_table(self, data: pa.Table) -> None:
+        try:
+            builder = self._table.merge_insert("scratch_id")
+        except AttributeError:  # pragma: no cover - LanceDB releases without merge_insert
+            scratch_ids = [str(value) for value in data.column("scratch_id").to_pylist()]
+            self._table.delete(where=_format_in_filter("scratch_id", scratch_ids))
+            self._table.add(data)
+        else:
+            builder.when_matched_update_all().when_not_matched_insert_all().execute(data)
+        self._ensure_scratch_id_index()
 
     @synchronized
     def capture_snapshot(self, scratch_id: str) -> ScratchpadSnapshot | None:
-        row = self._fetch_row(scratch_id)
-        if row is None:
+        """Capture the stored row and embeddings for ``scratch_id``.
+
+        The rows stay in the Arrow tables returned by the scans; those buffers are immutable, so
+        the snapshot needs no copy and ``restore_snapshot`` writes them back without converting
+        through Python objects.
+        """
+
+        row = self._scan(
+            self._table,
+            equals={"scratch_id": scratch_id},
+            columns=self._table.schema.names,
+            limit=1,
+        )
+        if row.num_rows == 0:
             return None
-        embeddings = self._capture_embeddings_rows(scratch_id)
-        return ScratchpadSnapshot(row=copy.deepcopy(row), embeddings=copy.deepcopy(embeddings))
+        embeddings: pa.Table | None = None
+        if self._embeddings_table_exists():
+            table = self._ensure_embedding_table()
+            embeddings = self._scan(table, equals={"scratch_id": scratch_id}, columns=table.schema.names)
+        return ScratchpadSnapshot(scratch_id=scratch_id, row=row, embeddings=embeddings)
 
-    @synchronized
+    @write_synchronized
     def restore_snapshot(self, snapshot: ScratchpadSnapshot) -> None:
-        scratch_id = snapshot.row.get("scratch_id")
-        if scratch_id is None:
+        if not snapshot.scratch_id or snapshot.row.num_rows == 0:
             raise StorageError(CONFIG_ERROR, "Snapshot missing scratch_id")
-        self._delete_row(scratch_id)
-        self._table.add([snapshot.row])
-        self._restore_embeddings_rows(scratch_id, snapshot.embeddings)
+        self._upsert_table(snapshot.row)
+        self._cell_index_cache.pop(snapshot.scratch_id, None)
+        self._restore_embeddings_rows(snapshot.scratch_id, snapshot.embeddings)
 
-    @synchronized
+    def capture_cell_undo(
+        self,
+        scratch_id: str,
+        op: str,
+        *,
+        cell_id: str,
+        index: int | None = None,
+        cell: models.ScratchCell | None = None,
+    ) -> CellUndo:
+        """Build an undo record for a single-cell mutation without copying the pad.
+
+        ``append`` records only the new cell id; ``replace`` stashes the cell being
+        replaced together with its current index.
+        """
+
+        if op == "append":
+            return CellUndo(scratch_id=scratch_id, op=op, cell_id=str(cell_id))
+        if op == "replace":
+            if cell is None or index is None:
+                raise StorageError(CONFIG_ERROR, "Replace undo requires the original cell and index")
+            return CellUndo(scratch_id=scratch_id, op=op, cell_id=str(cell_id), index=index, cell=cell)
+        raise StorageError(CONFIG_ERROR, "Unknown undo operation", details={"op": op})
+
+    @write_synchronized
+    def apply_undo(self, undo: CellUndo) -> None:
+        row = self._fetch_row(undo.scratch_id)
+        if row is None:
+            return
+        pad = self._pad_from_row(row)
+        cells = [cell for cell in pad.cells if cell.cell_id != undo.cell_id]
+        if undo.op == "replace" and undo.cell is not None:
+            position = min(max(undo.index or 0, 0), len(cells))
+            cells.insert(position, undo.cell)
+        for idx, candidate in enumerate(cells):
+            candidate.index = idx
+        pad.cells = cells
+        # The shared instance may have switched tenants while the caller awaited; rewrite the
+        # row under the tenant that owns it rather than the currently active one.
+        active_tenant = self._tenant_id
+        self._tenant_id = str(row.get("tenant_id") or active_tenant)
+        try:
+            self._write_pad(pad, row, touch_access=False)
+        finally:
+            self._tenant_id = active_tenant
+
+    @write_synchronized
     def replace_embeddings(
         self,
         scratch_id: str,
@@ -800,42 +1195,57 @@ class Storage:
         *,
         dimension: int,
     ) -> None:
+        self._bump_embeddings_generation()
+        table = self._ensure_embedding_table(dimension)
         if not records:
-            table = self._ensure_embedding_table(dimension)
             table.delete(where=_format_filter("scratch_id", scratch_id))
             return
 
-        table = self._ensure_embedding_table(dimension)
-        table.delete(where=_format_filter("scratch_id", scratch_id))
-
-        normalized: list[dict[str, Any]] = []
-        timestamp = _now()
-        for record in records:
-            vector = [float(x) for x in record.get("embedding", [])]
+        # Build the whole batch before deleting so a bad vector leaves existing embeddings untouched.
+        vectors = [record.get("embedding") or [] for record in records]
+        for vector in vectors:
             if len(vector) != dimension:
                 raise StorageError(
                     CONFIG_ERROR,
                     "Embedding dimension mismatch",
                     details={"expected": dimension, "provided": len(vector)},
                 )
-            normalized.append(
-                {
-                    "scratch_id": scratch_id,
-                    "cell_id": record.get("cell_id"),
-                    "tenant_id": self._tenant_id,
-                    "namespace": record.get("namespace"),
-                    "tags": list(record.get("tags") or []),
-                    "title": record.get("title"),
-                    "description": record.get("description"),
-                    "summary": record.get("summary"),
-                    "snippet": record.get("snippet"),
-                    "cell_index": record.get("cell_index", -1),
-                    "embedding": vector,
-                    "updated_at": timestamp,
-                }
-            )
-        if normalized:
-            table.add(normalized)
+        try:
+            # One contiguous float32 buffer viewed as fixed-size lists; no per-row vector objects.
+            flat = pa.array([value for vector in vectors for value in vector], type=pa.float32())
+        except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError) as exc:
+            raise StorageError(CONFIG_ERROR, "Embedding values must be numeric") from exc
+        # Store unit vectors so search can rank by dot product instead of cosine. Norms come from one
+        # grouped sum of squares over the flat buffer; unthreaded grouping keeps the rows in order.
+        rows = pc.list_parent_indices(pa.FixedSizeListArray.from_arrays(flat, dimension))
+        wide = flat.cast(pa.float64())
+        squares = pa.table({"row": rows, "square": pc.multiply(wide, wide)})
+        sums = squares.group_by("row", use_threads=False).aggregate([("square", "sum")])["square_sum"]
+        norms = pc.sqrt(sums.combine_chunks())
+        scales = pc.if_else(pc.greater(norms, 0.0), pc.divide(1.0, norms), 1.0)
+        unit = pc.multiply(wide, pc.take(scales, rows)).cast(pa.float32())
+        embedding_column = pa.FixedSizeListArray.from_arrays(unit, dimension)
+        count = len(records)
+        timestamp = _now()
+        batch = pa.Table.from_pydict(
+            {
+                "scratch_id": [scratch_id] * count,
+                "cell_id": [record.get("cell_id") for record in records],
+                "tenant_id": [self._tenant_id] * count,
+                "namespace": [record.get("namespace") for record in records],
+                "tags": [list(record.get("tags") or []) for record in records],
+                "title": [record.get("title") for record in records],
+                "description": [record.get("description") for record in records],
+                "summary": [record.get("summary") for record in records],
+                "snippet": [record.get("snippet") for record in records],
+                "cell_index": [record.get("cell_index", -1) for record in records],
+                "embedding": embedding_column,
+                "updated_at": [timestamp] * count,
+            },
+            schema=_build_embedding_schema(dimension),
+        )
+        table.delete(where=_format_filter("scratch_id", scratch_id))
+        table.add(batch)
 
     @synchronized
     def search_embeddings(
@@ -846,7 +1256,7 @@ class Storage:
         namespaces: set[str] | None = None,
         tags: set[str] | None = None,
     ) -> list[dict[str, Any]]:
-        if self._embeddings_table is None and _EMBEDDINGS_TABLE_NAME not in set(self._db.table_names()):
+        if not self._embeddings_table_exists():
             return []
         dimension = len(query_vector)
         table = self._ensure_embedding_table(dimension)
@@ -859,31 +1269,31 @@ class Storage:
         oversample_factor = 3 if tags else 1
         fetch_count = max(limit * oversample_factor, limit)
 
-        query = table.search(list(query_vector), vector_column_name="embedding").metric("cosine")
+        metric = _search_metric(table)
+        vector = list(query_vector)
+        if metric == "dot":
+            scale = _unit_scale(math.hypot(*vector))
+            vector = [value * scale for value in vector]
+        query = table.search(vector, vector_column_name="embedding").metric(metric)
         if predicate_parts:
             where_clause = " AND ".join(predicate_parts)
             query = self._apply_prefilter(query, where_clause)
         query = query.limit(fetch_count)
-        hits = query.to_list()
-
-        if not namespaces and not tags:
-            return hits[:limit]
-
-        filtered: list[dict[str, Any]] = []
-        tag_filter = tags or set()
-        for row in hits:
-            if namespaces:
-                namespace_value = (row.get("namespace") or "").strip()
-                if namespace_value not in namespace_filter:
-                    continue
-            if tags:
-                row_tags = set(row.get("tags") or [])
-                if not row_tags.intersection(tag_filter):
-                    continue
-            filtered.append(row)
-            if len(filtered) >= limit:
-                break
-        return filtered
+        hits = query.to_arrow()
+        if hits.num_rows == 0:
+            return []
+
+        # Post-filter the hits with compute kernels and convert only the rows returned.
+        if namespaces:
+            namespace_values = pc.fill_null(pc.utf8_trim_whitespace(hits["namespace"]), "")
+            hits = hits.filter(pc.is_in(namespace_values, value_set=pa.array(sorted(namespace_filter), type=pa.string())))
+        if tags:
+            hits = hits.filter(_any_tag_mask(hits, ("tags",), tags))
+        return hits.slice(0, limit).to_pylist()
+
+    @synchronized
+    def list_pad_embeddings(self, scratch_id: str, *, columns: Sequence[str] | None = None) -> list[dict[str, Any]]:
+        return self._capture_embeddings_rows(scratch_id, columns=columns)
 
     def _apply_prefilter(self, query, where_clause: str):
         try:
@@ -892,35 +1302,66 @@ class Storage:
             logger.debug("Prefilter not supported for clause '%s'; continuing without pushdown", where_clause, exc_info=True)
             return query
 
-    def _capture_embeddings_rows(self, scratch_id: str) -> list[dict[str, Any]]:
-        if self._embeddings_table is None and _EMBEDDINGS_TABLE_NAME not in set(self._db.table_names()):
+    def _capture_embeddings_rows(
+        self,
+        scratch_id: str,
+        *,
+        columns: Sequence[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        if not self._embeddings_table_exists():
             return []
         table = self._ensure_embedding_table()
-        arrow_table = table.to_arrow()
-        rows: list[dict[str, Any]] = []
-        for row in arrow_table.to_pylist():
-            if row.get("scratch_id") == scratch_id:
-                rows.append(row)
-        return rows
-
-    def _restore_embeddings_rows(self, scratch_id: str, rows: Sequence[Mapping[str, Any]]) -> None:
-        if not rows:
-            if self._embeddings_table is not None or _EMBEDDINGS_TABLE_NAME in set(self._db.table_names()):
+        return self._scan(table, equals={"scratch_id": scratch_id}, columns=columns).to_pylist()
+
+    def _bump_embeddings_generation(self) -> None:
+        # Callers hold the root write lock, so increments from different instances never race.
+        _ROOT_EMBEDDINGS_GENERATIONS[self._root_key] = self.embeddings_generation() + 1
+
+    def _bulk_delete_embeddings(self, scratch_ids: Sequence[str]) -> None:
+        """Delete the embeddings of all ``scratch_ids`` with one ``IN`` predicate per batch."""
+
+        if not scratch_ids:
+            return
+        if not self._embeddings_table_exists():
+            return
+        self._bump_embeddings_generation()
+        _delete_in_batches(self._ensure_embedding_table(), scratch_ids)
+
+    def _restore_embeddings_rows(self, scratch_id: str, rows: pa.Table | None) -> None:
+        self._bump_embeddings_generation()
+        if rows is None or rows.num_rows == 0:
+            if self._embeddings_table_exists():
                 table = self._ensure_embedding_table()
-                table.delete(where=_format_filter("scratch_id", scratch_id))
+                # A one-row probe is cheaper than a delete, which rewrites fragments even on no match.
+                if self._scan(table, equals={"scratch_id": scratch_id}, columns=["scratch_id"], limit=1).num_rows:
+                    table.delete(where=_format_filter("scratch_id", scratch_id))
             return
-        sample = rows[0]
-        embedding = sample.get("embedding") or []
-        dimension = len(embedding)
+        dimension = getattr(rows.schema.field("embedding").type, "list_size", None)
         table = self._ensure_embedding_table(dimension)
         table.delete(where=_format_filter("scratch_id", scratch_id))
-        table.add(list(rows))
+        table.add(rows)
+
+    def _rewrite_embeddings_field(self, scratch_ids: Sequence[str], field: str, value: str) -> None:
+        """Set ``field`` to ``value`` on every embedding row of ``scratch_ids`` with one delete and one add."""
+
+        if not scratch_ids:
+            return
+        if not self._embeddings_table_exists():
+            return
+        table = self._ensure_embedding_table()
+        rows = self._scan(table, any_of={"scratch_id": scratch_ids}, columns=table.schema.names)
+        if rows.num_rows == 0:
+            return
+        column = pa.array([value] * rows.num_rows, type=rows.schema.field(field).type)
+        rows = rows.set_column(rows.schema.get_field_index(field), field, column)
+        self._bulk_delete_embeddings(scratch_ids)
+        table.add(rows)
 
     @synchronized
     def get_embedding_dimension(self) -> int | None:
         if self._embedding_dimension is not None:
             return self._embedding_dimension
-        if _EMBEDDINGS_TABLE_NAME not in set(self._db.table_names()):
+        if not self._embeddings_table_exists():
             return None
         table = self._ensure_embedding_table()
         embedding_field = table.schema.field("embedding")
@@ -936,6 +1377,8 @@ class Storage:
         pad: models.Scratchpad,
         created_at: datetime | None,
         last_access_at: datetime | None = None,
+        *,
+        now: datetime | None = None,
     ) -> dict[str, Any]:
         metadata = dict(pad.metadata or {})
         pad_tags = _ensure_string_list(metadata.get("tags"))
@@ -957,7 +1400,7 @@ class Storage:
         cells_payload = [cell.to_dict() for cell in pad.cells]
         schemas_payload = metadata.get("schemas", {})
 
-        access_timestamp = last_access_at or _now()
+        now = now or _now()
         record = {
             "scratch_id": pad.scratch_id,
             "tenant_id": self._tenant_id,
@@ -971,33 +1414,111 @@ class Storage:
             "metadata_json": _encode_json(metadata, context="metadata"),
             "cells_json": _encode_json(cells_payload, context="cells"),
             "schemas_json": _encode_json(schemas_payload, context="schemas"),
-            "created_at": (created_at or _now()),
-            "updated_at": _now(),
-            "last_access_at": access_timestamp,
+            "created_at": created_at or now,
+            "updated_at": now,
+            "last_access_at": last_access_at or now,
         }
         return record
 
     def _pad_from_row(self, row: Mapping[str, Any]) -> models.Scratchpad:
+        # Pure function of ``row``; safe to call without holding ``self._lock``.
         metadata_json = row.get("metadata_json")
         cells_json = row.get("cells_json")
-        metadata = json.loads(metadata_json) if metadata_json else {}
-        cells_payload = json.loads(cells_json) if cells_json else []
+        metadata = _decode_json(metadata_json) if metadata_json else {}
+        cells_payload = _decode_json(cells_json) if cells_json else []
         cells = [models.ScratchCell.from_dict(item) for item in cells_payload]
         return models.Scratchpad(scratch_id=str(row.get("scratch_id")), cells=cells, metadata=metadata)
 
-    def _fetch_row(self, scratch_id: str) -> dict[str, Any] | None:
-        arrow = self._table.to_arrow()
-        for row in arrow.to_pylist():
-            if row.get("scratch_id") == scratch_id:
-                return row
-        return None
+    def _scan(
+        self,
+        table: Any,
+        *,
+        equals: Mapping[str, str] | None = None,
+        any_of: Mapping[str, Iterable[str]] | None = None,
+        columns: Sequence[str] | None = None,
+        limit: int | None = None,
+    ) -> pa.Table:
+        """Return rows of ``table`` matching the given column predicates as an Arrow table.
+
+        Predicates and the column projection are pushed down to LanceDB so only matching rows
+        and requested columns are read; older LanceDB versions fall back to filtering a full
+        Arrow scan with pyarrow compute.
+        """
+
+        equals = equals or {}
+        any_of = {field: list(values) for field, values in (any_of or {}).items()}
+        conditions = [_format_filter(field, value) for field, value in equals.items()]
+        conditions.extend(_format_in_filter(field, values) for field, values in any_of.items())
+        try:
+            query = table.search()
+            if conditions:
+                query = query.where(" AND ".join(conditions))
+            if columns is not None:
+                query = query.select(list(columns))
+            return query.limit(limit).to_arrow()
+        except Exception:  # pragma: no cover - falls back for older LanceDB versions
+            logger.debug("Filtered scan falling back to full table scan", exc_info=True)
+        arrow = table.to_arrow()
+        for field, value in equals.items():
+            arrow = arrow.filter(pc.fill_null(pc.equal(arrow[field], value), False))
+        for field, values in any_of.items():
+            arrow = arrow.filter(pc.is_in(arrow[field], value_set=pa.array(values, type=pa.string())))
+        if columns is not None:
+            arrow = arrow.select(list(columns))
+        if limit is not None:
+            arrow = arrow.slice(0, limit)
+        return arrow
+
+    def _fetch_row(self, scratch_id: str, *, columns: Sequence[str] | None = None) -> dict[str, Any] | None:
+        """Return the stored row for ``scratch_id``, limited to ``columns`` when given."""
+
+        arrow = self._scan(self._table, equals={"scratch_id": scratch_id}, columns=columns, limit=1)
+        if arrow.num_rows == 0:
+            return None
+        return arrow.slice(0, 1).to_pylist()[0]
+
+    def _record_deletes(self, count: int) -> None:
+        """Compact the tables after every ``_COMPACT_AFTER_DELETES`` deleted scratchpads.
+
+        LanceDB deletes leave tombstones in the affected fragments; compacting periodically keeps
+        scans from paying for them without rewriting fragments on every delete. The rewrite runs
+        on a worker thread so the deleting call does not wait for it.
+        """
+
+        self._deletes_since_compaction += count
+        if self._deletes_since_compaction < _COMPACT_AFTER_DELETES:
+            return
+        if self._compaction_thread is not None and self._compaction_thread.is_alive():
+            return
+        self._deletes_since_compaction = 0
+        tables = [table for table in (self._table, self._embeddings_table) if table is not None]
+        self._compaction_thread = Thread(
+            target=self._compact_tables,
+            args=(tables,),
+            name="scratch-notebook-compaction",
+            daemon=True,
+        )
+        self._compaction_thread.start()
+
+    def _compact_tables(self, tables: Sequence[Any]) -> None:
+        # Holding the root write lock keeps every writer on this root out while fragments are rewritten.
+        with self._write_lock:
+            for table in tables:
+                try:
+                    if hasattr(table, "optimize"):
+                        table.optimize()
+                    else:
+                        table.compact_files()
+                except Exception:  # pragma: no cover - compaction is an optimisation only
+                    logger.warning("Table compaction after deletes failed", exc_info=True)
 
     def _delete_row(self, scratch_id: str) -> None:
         filter_expr = _format_filter("scratch_id", scratch_id)
         self._table.delete(where=filter_expr)
 
-    def _ensure_valid_identifier(self, scratch_id: str) -> None:
-        if not _ID_PATTERN.match(scratch_id):
+    @staticmethod
+    def _ensure_valid_identifier(scratch_id: str) -> None:
+        if not _is_valid_identifier(scratch_id):
             raise StorageError(INVALID_ID, "Scratchpad identifier contains invalid characters", details={"scratch_id": scratch_id})
 
     def _enforce_capacity_limit(self) -> list[str]:
@@ -1031,26 +1552,35 @@ class Storage:
                 pass
         return int(self._table.to_arrow().num_rows)
 
+    def _access_times(self) -> pa.Table:
+        """Return ``scratch_id``, effective last access and creation time for every stored row.
+
+        Only the key and timestamp columns are read; missing access times fall back to the
+        update and creation times, then to the epoch, as the eviction policies expect. Access
+        times recorded by reads but not yet flushed take precedence when newer.
+        """
+
+        arrow = self._scan(self._table, columns=["scratch_id", "last_access_at", "updated_at", "created_at"])
+        arrow = arrow.filter(pc.fill_null(pc.not_equal(arrow["scratch_id"], ""), False))
+        epoch = pa.scalar(datetime(1970, 1, 1, tzinfo=timezone.utc), type=arrow.schema.field("created_at").type)
+        access = pc.coalesce(arrow["last_access_at"], arrow["updated_at"], arrow["created_at"], epoch)
+        pending = self._pending_access_times()
+        if pending:
+            # Reads not yet flushed still count as accesses.
+            recorded = pa.array([pending.get(value) for value in arrow["scratch_id"].to_pylist()], type=access.type)
+            access = pc.if_else(pc.fill_null(pc.greater(recorded, access), False), recorded, access)
+        return pa.table(
+            {
+                "scratch_id": arrow["scratch_id"],
+                "access": access,
+                "created": pc.coalesce(arrow["created_at"], epoch),
+            }
+        )
+
     def _select_eviction_candidates(self, count: int) -> list[str]:
-        arrow_table = self._table.to_arrow()
-        rows = arrow_table.to_pylist()
-        candidates: list[tuple[datetime, datetime, str]] = []
-        epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
-        for row in rows:
-            scratch_id = row.get("scratch_id")
-            if not scratch_id:
-                continue
-            last_access = row.get("last_access_at") or row.get("updated_at") or row.get("created_at")
-            created_at = row.get("created_at") or epoch
-            candidates.append(
-                (
-                    _coerce_timestamp(last_access, default=epoch),
-                    _coerce_timestamp(created_at, default=epoch),
-                    str(scratch_id),
-                )
-            )
-        candidates.sort(key=lambda item: (item[0], item[1]))
-        return [scratch_id for _, _, scratch_id in candidates[:count]]
+        # Least recently accessed first, older pads first among ties; Arrow's sort is stable.
+        ordered = self._access_times().sort_by([("access", "ascending"), ("created", "ascending")])
+        return ordered.column("scratch_id").slice(0, count).to_pylist()
 
     def _evict_scratchpads(
         self,
@@ -1067,8 +1597,10 @@ class Storage:
                 snapshot = self.capture_snapshot(scratch_id)
                 if snapshot is not None:
                     self._pending_eviction_snapshots.append(snapshot)
-            self._delete_row(scratch_id)
-            self._restore_embeddings_rows(scratch_id, [])
+            self._cell_index_cache.pop(scratch_id, None)
+        _delete_in_batches(self._table, scratchpad_ids)
+        self._bulk_delete_embeddings(scratchpad_ids)
+        self._record_deletes(len(scratchpad_ids))
         if record_event:
             self._last_evicted = list(scratchpad_ids)
         metrics.record_eviction(self._eviction_policy, count=len(scratchpad_ids))
@@ -1082,21 +1614,13 @@ class Storage:
             },
         )
 
-    @synchronized
+    @write_synchronized
     def evict_stale(self, age: timedelta) -> list[str]:
         threshold = _now() - age
-        arrow_table = self._table.to_arrow()
-        rows = arrow_table.to_pylist()
-        epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
-        victims: list[str] = []
-        for row in rows:
-            scratch_id = row.get("scratch_id")
-            if not scratch_id:
-                continue
-            last_access = row.get("last_access_at") or row.get("updated_at") or row.get("created_at")
-            access_time = _coerce_timestamp(last_access, default=epoch)
-            if access_time <= threshold:
-                victims.append(str(scratch_id))
+        access_times = self._access_times()
+        cutoff = pa.scalar(threshold, type=access_times.schema.field("access").type)
+        stale = access_times.filter(pc.less_equal(access_times["access"], cutoff))
+        victims: list[str] = stale.column("scratch_id").to_pylist()
         if victims:
             self._evict_scratchpads(
                 victims,
@@ -1117,32 +1641,28 @@ class Storage:
     def peek_recent_evictions(self) -> list[str]:
         return list(self._last_evicted)
 
-    @synchronized
+    @write_synchronized
     def restore_evicted_snapshots(self) -> None:
         while self._pending_eviction_snapshots:
             snapshot = self._pending_eviction_snapshots.pop()
             try:
                 self.restore_snapshot(snapshot)
             except Exception:
-                logger.exception("Failed to restore evicted scratchpad '%s'", snapshot.row.get("scratch_id"))
+                logger.exception("Failed to restore evicted scratchpad '%s'", snapshot.scratch_id)
         self._last_evicted.clear()
 
     @synchronized
     def snapshot_counts(self) -> dict[str, int]:
         """Return current scratchpad and cell counts for Prometheus gauges."""
 
-        arrow = self._table.to_arrow()
-        rows = arrow.to_pylist()
-        scratchpads = 0
-        cells = 0
+        arrow = self._scan(self._table, columns=["tenant_id", "cell_count"])
         tenant = (self._tenant_id or "").strip() or DEFAULT_TENANT_ID
-        for row in rows:
-            row_tenant = (row.get("tenant_id") or "").strip() or DEFAULT_TENANT_ID
-            if row_tenant != tenant:
-                continue
-            scratchpads += 1
-            cells += int(row.get("cell_count") or 0)
-        return {"scratchpads": scratchpads, "cells": cells}
+        # Blank or missing tenants count as the default tenant, matching migrate_default_tenant.
+        row_tenants = pc.fill_null(pc.utf8_trim_whitespace(arrow["tenant_id"]), "")
+        row_tenants = pc.if_else(pc.equal(row_tenants, ""), DEFAULT_TENANT_ID, row_tenants)
+        cell_counts = pc.filter(arrow["cell_count"], pc.equal(row_tenants, tenant))
+        cells = pc.sum(cell_counts).as_py() or 0
+        return {"scratchpads": len(cell_counts), "cells": int(cells)}
 
     def _enforce_cell_limits(
         self,
@@ -1168,10 +1688,15 @@ class Storage:
     def _enforce_cell_size(self, cell: models.ScratchCell) -> None:
         max_bytes = self._config.max_cell_bytes
         if max_bytes and max_bytes > 0:
-            content_bytes = cell.content.encode("utf-8")
-            if len(content_bytes) > max_bytes:
+            content = cell.content
+            # UTF-8 needs at most four bytes per code point and exactly one for ASCII, so most
+            # cells are sized without encoding a copy of their content.
+            if len(content) * 4 <= max_bytes:
+                return
+            size = len(content) if content.isascii() else len(content.encode("utf-8"))
+            if size > max_bytes:
                 raise StorageError(
                     CAPACITY_LIMIT_REACHED,
                     "Cell content exceeds configured byte limit",
-                    details={"limit": max_bytes, "size": len(content_bytes)},
+                    details={"limit": max_bytes, "size": size},
                 )
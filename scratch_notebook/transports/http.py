@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import asyncio
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Mapping
+from types import MappingProxyType
+from typing import Any, Mapping
 
 import uvicorn
 from fastmcp import FastMCP
@@ -32,12 +33,20 @@ try:  # FastMCP >= 0.3
 except ModuleNotFoundError:  # pragma: no cover - fallback for older fastmcp
     RequireAuthMiddleware = None  # type: ignore
 
+try:  # pragma: no cover - optional accelerator (not available on Windows)
+    import uvloop
+except ImportError:  # pragma: no cover - fallback to the stdlib event loop
+    uvloop = None  # type: ignore[assignment]
+
 logger = get_logger(__name__)
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class HttpTransportConfig:
-    """Configuration for the HTTP/SSE transport layer."""
+    """Configuration for the HTTP/SSE transport layer.
+
+    Frozen so the routes derived at construction can never disagree with the fields they come from.
+    """
 
     host: str
     port: int
@@ -48,19 +57,33 @@ class HttpTransportConfig:
     enable_http: bool
     enable_sse: bool
     socket_path: Path | None = None
+    # Normalised once at construction; the transport reads them for every route it builds.
+    http_route: str = field(init=False, repr=False, compare=False)
+    sse_route: str = field(init=False, repr=False, compare=False)
+    metrics_route: str = field(init=False, repr=False, compare=False)
+    routes: Mapping[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        http_route = _normalise_path(self.http_path)
+        sse_route = _normalise_path(self.sse_path)
+        metrics_route = _normalise_path(self.metrics_path)
+        routes: dict[str, str] = {}
+        if self.enable_http:
+            routes["http"] = http_route
+        if self.enable_sse:
+            routes["sse"] = sse_route
+        if self.enable_metrics:
+            routes["metrics"] = metrics_route
+        object.__setattr__(self, "http_route", http_route)
+        object.__setattr__(self, "sse_route", sse_route)
+        object.__setattr__(self, "metrics_route", metrics_route)
+        object.__setattr__(self, "routes", MappingProxyType(routes))
 
 
 def describe_routes(config: HttpTransportConfig) -> Mapping[str, str]:
     """Return a mapping of logical endpoints to their configured paths."""
 
-    routes: dict[str, str] = {}
-    if config.enable_http:
-        routes["http"] = _normalise_path(config.http_path)
-    if config.enable_sse:
-        routes["sse"] = _normalise_path(config.sse_path)
-    if config.enable_metrics:
-        routes["metrics"] = _normalise_path(config.metrics_path)
-    return routes
+    return config.routes
 
 
 def run_http(server: FastMCP, config: HttpTransportConfig) -> None:
@@ -70,7 +93,7 @@ def run_http(server: FastMCP, config: HttpTransportConfig) -> None:
         logger.info("transport.http.skip_all_disabled")
         return
 
-    routes = describe_routes(config)
+    routes = dict(describe_routes(config))
     context = {
         "host": config.host,
         "port": config.port,
@@ -116,8 +139,10 @@ def run_http(server: FastMCP, config: HttpTransportConfig) -> None:
             await server_instance.serve()
 
     logger.info("transport.http.start", extra={"context": context})
+    # Only pass ``loop_factory`` when uvloop is present so the default loop path stays a plain asyncio.run().
+    run_kwargs: dict[str, Any] = {"loop_factory": uvloop.new_event_loop} if uvloop is not None else {}
     try:
-        asyncio.run(_serve())
+        asyncio.run(_serve(), **run_kwargs)
     except KeyboardInterrupt:
         logger.info("transport.http.interrupted", extra={"context": context})
         raise
@@ -139,8 +164,8 @@ def _build_transport_app(
     auth: AuthProvider | None = getattr(server, "auth", None)
     deprecated_settings = server._deprecated_settings  # type: ignore[attr-defined]
 
-    http_path = _normalise_path(config.http_path)
-    sse_path = _normalise_path(config.sse_path)
+    http_path = config.http_route
+    sse_path = config.sse_route
     message_path = _derive_message_path(config, deprecated_settings.message_path)
 
     if auth and RequireAuthMiddleware:
@@ -290,7 +315,7 @@ def _normalise_path(path: str) -> str:
 def _derive_message_path(config: HttpTransportConfig, default_message_path: str) -> str:
     if not config.enable_sse:
         return default_message_path
-    base = _normalise_path(config.sse_path)
+    base = config.sse_route
     if base == "/":
         candidate = "/messages"
     else:
@@ -3,10 +3,20 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import hashlib
 import json
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
 from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
 from typing import Any, Callable, Sequence, TypeVar
 
+import orjson
+
 from .errors import INTERNAL_ERROR
 from .logging import get_logger
 from .models import ScratchCell, ValidationResult, normalize_schema_registry_entries
@@ -33,30 +43,33 @@ YAML_VALIDATION_SKIPPED_MESSAGE = "YAML validation skipped because PyYAML is una
 MARKDOWN_SKIPPED_MESSAGE = "Markdown analysis not available"
 SYNTAX_CHECK_SKIPPED_MESSAGE = "Syntax checker not available for this language"
 SCHEMA_REF_PREFIX = "scratchpad://schemas/"
+_SCHEMA_REF_PREFIX_LEN = len(SCHEMA_REF_PREFIX)
 
 # Every language that should be validated via the syntax-checker backend.
-CODE_LANGUAGES: set[str] = {
-    "py",
-    "js",
-    "ts",
-    "tsx",
-    "jsx",
-    "rs",
-    "c",
-    "h",
-    "cpp",
-    "hpp",
-    "sh",
-    "css",
-    "html",
-    "htm",
-    "java",
-    "go",
-    "rb",
-    "toml",
-    "php",
-    "cs",
-}
+CODE_LANGUAGES: frozenset[str] = frozenset(
+    {
+        "py",
+        "js",
+        "ts",
+        "tsx",
+        "jsx",
+        "rs",
+        "c",
+        "h",
+        "cpp",
+        "hpp",
+        "sh",
+        "css",
+        "html",
+        "htm",
+        "java",
+        "go",
+        "rb",
+        "toml",
+        "php",
+        "cs",
+    }
+)
 
 try:  # pragma: no cover - import availability depends on environment
     import jsonschema  # type: ignore[assignment]
@@ -78,6 +91,12 @@ try:  # pragma: no cover
     import yaml  # type: ignore[assignment]
 except ImportError:  # pragma: no cover
     yaml = None  # type: ignore[assignment]
+    _YAML_SAFE_LOADER = None
+    _HAS_LIBYAML = False
+else:
+    # libyaml's C loader parses several times faster than the pure-Python SafeLoader.
+    _HAS_LIBYAML = hasattr(yaml, "CSafeLoader")
+    _YAML_SAFE_LOADER = yaml.CSafeLoader if _HAS_LIBYAML else yaml.SafeLoader
 
 try:  # pragma: no cover
     import markdown_analysis  # type: ignore[assignment]
@@ -89,11 +108,57 @@ try:  # pragma: no cover
 except ImportError:  # pragma: no cover
     syntax_checker = None  # type: ignore[assignment]
 
-_syntax_checker_missing_logged = False
-_markdown_missing_logged = False
-_yaml_missing_logged = False
-_jsonschema_missing_logged = False
-_referencing_missing_logged = False
+
+_SCHEMA_CACHE_SIZE = 512
+# orjson reads integers outside the 64-bit range as floats; such documents go to json.loads.
+_WIDE_INTEGER_RE = re.compile(r"\d{19}")
+_PREPARED_SCHEMAS_CACHE_SIZE = 64
+
+
+@dataclass(slots=True)
+class _PreparedSchemas:
+    """Shared schemas of a scratchpad, normalised once and reused for every cell of a request."""
+
+    registry: dict[str, Mapping[str, Any]]
+    store: dict[str, Mapping[str, Any]]
+    _referencing: Any = field(default=None, repr=False)
+    _bound: dict[int, tuple[Any, Any, Any]] = field(default_factory=dict, repr=False)
+
+    def referencing_registry(self) -> Any:
+        """Return the ``referencing`` registry for ``store``, built on first use."""
+
+        if self._referencing is None or Registry is None:
+            self._referencing = _make_referencing_registry(self.store)
+        return self._referencing
+
+    def bind(self, validator: Any, registry: Any) -> Any:
+        """Return ``validator`` bound to ``registry``, reusing the binding made for earlier cells.
+
+        Binding combines the registry with the bundled metaschemas and builds the root resolver,
+        so it is done once per validator rather than per cell. Entries are keyed by ``id`` and
+        checked by identity, since cached validators can be evicted and their ids reused.
+        """
+
+        entry = self._bound.get(id(validator))
+        if entry is not None and entry[0] is validator and entry[1] is registry:
+            return entry[2]
+        # ``evolve`` would keep the cached resolver of the shared instance, so bind a fresh one.
+        bound = type(validator)(validator.schema, registry=registry)
+        self._bound[id(validator)] = (validator, registry, bound)
+        return bound
+
+
+# Shared by every cell that needs no schemas; it never builds a referencing registry.
+_NO_SCHEMAS = _PreparedSchemas(registry={}, store={})
+_prepared_schemas_cache: OrderedDict[str, _PreparedSchemas] = OrderedDict()
+_prepared_schemas_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _log_once(key: str, message: str, level: int = logging.WARNING) -> None:
+    """Log ``message`` the first time ``key`` is reported; used for missing optional backends."""
+
+    logger.log(level, message)
 
 
 async def run_validation_task(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
@@ -109,20 +174,23 @@ def validate_cell(
 ) -> ValidationResult:
     """Synchronously validate a single scratch cell."""
 
-    normalized_registry = _normalize_schema_registry(schemas)
-    schema_store = _build_schema_store(normalized_registry)
-
     language = cell.language.lower()
-    if language == "json":
-        return _validate_json(cell, normalized_registry, schema_store)
-    if language in {"yaml", "yml"}:
-        return _validate_yaml(cell, normalized_registry, schema_store)
-    if language == "md":
-        return _validate_markdown(cell)
-    if language == "txt":
-        return _validate_plain_text(cell)
+    # Only JSON and YAML cells consult shared schemas; skip normalising them for everything else.
+    prepared = _prepare_schemas(schemas) if language in _SCHEMA_VALIDATORS else _NO_SCHEMAS
+    return _validate_cell_prepared(cell, prepared, language)
+
+
+def _validate_cell_prepared(cell: ScratchCell, schemas: _PreparedSchemas, language: str) -> ValidationResult:
+    """Validate ``cell`` whose lower-cased language is ``language``."""
+
+    schema_validator = _SCHEMA_VALIDATORS.get(language)
+    if schema_validator is not None:
+        return schema_validator(cell, schemas)
+    cell_validator = _CELL_VALIDATORS.get(language)
+    if cell_validator is not None:
+        return cell_validator(cell)
     if language in CODE_LANGUAGES:
-        return _validate_code(cell)
+        return _validate_code(cell, language)
     return _not_validated(cell, NOT_VALIDATED_MESSAGE, code="VALIDATION_SKIPPED")
 
 
@@ -141,28 +209,83 @@ async def validate_cells(
     *,
     timeout: float | None = None,
     schemas: Mapping[str, Any] | None = None,
+    max_concurrency: int | None = None,
 ) -> list[ValidationResult]:
-    """Validate a sequence of cells, honouring an optional timeout."""
+    """Validate a sequence of cells, honouring an optional timeout.
+
+    JSON, YAML, markdown and plain-text cells are cheap and are validated in order by a single
+    worker-thread call. When ``max_concurrency`` is greater than one, code cells, whose syntax
+    checks may be slow, are instead validated in parallel worker threads (bounded by a
+    semaphore) alongside that batch. Results keep the order of ``cells`` either way. Shared
+    schemas are normalised once for the whole sequence, and only when a JSON or YAML cell
+    needs them.
+    """
+
+    languages = [cell.language.lower() for cell in cells]
+    needs_schemas = any(language in _SCHEMA_VALIDATORS for language in languages)
+    prepared = _prepare_schemas(schemas) if needs_schemas else _NO_SCHEMAS
+
+    deadline = time.monotonic() + timeout if timeout is not None and timeout > 0 else None
 
     async def _execute() -> list[ValidationResult]:
-        results: list[ValidationResult] = []
-        for cell in cells:
-            results.append(await validate_cell_async(cell, schemas=schemas))
-        return results
+        parallel = bool(max_concurrency and max_concurrency > 1)
+        offloaded = [index for index, language in enumerate(languages) if parallel and _is_code_language(language)]
+        if not offloaded:
+            return await run_validation_task(_validate_sequentially, list(cells), languages, prepared, deadline)
+
+        offloaded_set = set(offloaded)
+        batched = [index for index in range(len(cells)) if index not in offloaded_set]
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _validate_batch(indices: Sequence[int]) -> list[ValidationResult]:
+            if not indices:
+                return []
+            batch_cells = [cells[index] for index in indices]
+            batch_languages = [languages[index] for index in indices]
+            return await run_validation_task(_validate_sequentially, batch_cells, batch_languages, prepared, deadline)
+
+        async def _validate_one(index: int) -> list[ValidationResult]:
+            # Each worker call checks the deadline first, so cells still queued stop once it passes.
+            async with semaphore:
+                return await _validate_batch([index])
+
+        outcomes = await asyncio.gather(_validate_batch(batched), *(_validate_one(index) for index in offloaded))
+        by_index = dict(zip(batched, outcomes[0]))
+        by_index.update((index, result) for index, [result] in zip(offloaded, outcomes[1:]))
+        return [by_index[index] for index in range(len(cells))]
 
     if timeout is None or timeout <= 0:
         return await _execute()
     return await asyncio.wait_for(_execute(), timeout=timeout)
 
 
-def _validate_json(
-    cell: ScratchCell,
-    schema_registry: Mapping[str, Mapping[str, Any]],
-    schema_store: Mapping[str, Mapping[str, Any]],
-) -> ValidationResult:
-    result = ValidationResult(cell_index=cell.index, language=cell.language, cell_id=cell.cell_id)
+def _is_code_language(language: str) -> bool:
+    return language in CODE_LANGUAGES and language not in _SCHEMA_VALIDATORS and language not in _CELL_VALIDATORS
+
+
+def _validate_sequentially(
+    cells: Sequence[ScratchCell],
+    languages: Sequence[str],
+    schemas: _PreparedSchemas,
+    deadline: float | None,
+) -> list[ValidationResult]:
+    results: list[ValidationResult] = []
+    for cell, language in zip(cells, languages):
+        # ``wait_for`` cannot stop the worker thread, so stop here once the caller has given up.
+        if deadline is not None and time.monotonic() >= deadline:
+            raise TimeoutError("Validation deadline exceeded")
+        results.append(_validate_cell_prepared(cell, schemas, language))
+    return results
+
+
+def _make_result(cell: ScratchCell) -> ValidationResult:
+    return ValidationResult(cell_index=cell.index, language=cell.language, cell_id=cell.cell_id)
+
+
+def _validate_json(cell: ScratchCell, schemas: _PreparedSchemas) -> ValidationResult:
+    result = _make_result(cell)
     try:
-        parsed = json.loads(cell.content)
+        parsed = _loads_json(cell.content)
     except json.JSONDecodeError as exc:
         result.add_error(
             f"Invalid JSON: {exc.msg}",
@@ -174,38 +297,35 @@ def _validate_json(
         return result
 
     if jsonschema is None:
-        global _jsonschema_missing_logged
-        if not _jsonschema_missing_logged:
-            logger.warning("jsonschema library unavailable; JSON schema validation disabled")
-            _jsonschema_missing_logged = True
+        _log_once("jsonschema", "jsonschema library unavailable; JSON schema validation disabled")
         result.add_warning(JSON_SCHEMA_SKIPPED_MESSAGE, code="VALIDATION_SKIPPED")
         result.details["schema_applied"] = False
         return result
 
-    schema, schema_ref = _coerce_json_schema(cell.json_schema, result, registry=schema_registry)
+    schema, schema_ref = _coerce_json_schema(cell.json_schema, result, registry=schemas.registry)
     if schema is None:
         return result
 
-    _validate_with_jsonschema(parsed, schema, result, schema_store, schema_ref)
+    _validate_with_jsonschema(parsed, schema, result, schemas, schema_ref)
     return result
 
 
-def _validate_yaml(
-    cell: ScratchCell,
-    schema_registry: Mapping[str, Mapping[str, Any]],
-    schema_store: Mapping[str, Mapping[str, Any]],
-) -> ValidationResult:
-    result = ValidationResult(cell_index=cell.index, language=cell.language, cell_id=cell.cell_id)
+def _validate_yaml(cell: ScratchCell, schemas: _PreparedSchemas) -> ValidationResult:
+    result = _make_result(cell)
     if yaml is None:
-        global _yaml_missing_logged
-        if not _yaml_missing_logged:
-            logger.warning("PyYAML unavailable; YAML validation disabled")
-            _yaml_missing_logged = True
+        _log_once("yaml", "PyYAML unavailable; YAML validation disabled")
         result.add_warning(YAML_VALIDATION_SKIPPED_MESSAGE, code="VALIDATION_SKIPPED")
         return result
 
+    if not _HAS_LIBYAML:
+        _log_once(
+            "libyaml",
+            "PyYAML built without libyaml; YAML cells use the pure-Python loader",
+            level=logging.INFO,
+        )
+
     try:
-        parsed = yaml.safe_load(cell.content)  # type: ignore[attr-defined]
+        parsed = yaml.load(cell.content, Loader=_YAML_SAFE_LOADER)  # type: ignore[attr-defined]
     except Exception as exc:  # pragma: no cover - specific error classes vary
         result.add_error(f"Invalid YAML: {exc}")
         return result
@@ -214,29 +334,23 @@ def _validate_yaml(
         return result
 
     if jsonschema is None:
-        global _jsonschema_missing_logged
-        if not _jsonschema_missing_logged:
-            logger.warning("jsonschema library unavailable; JSON schema validation disabled")
-            _jsonschema_missing_logged = True
+        _log_once("jsonschema", "jsonschema library unavailable; JSON schema validation disabled")
         result.add_warning(JSON_SCHEMA_SKIPPED_MESSAGE, code="VALIDATION_SKIPPED")
         return result
 
-    schema, schema_ref = _coerce_json_schema(cell.json_schema, result, registry=schema_registry)
+    schema, schema_ref = _coerce_json_schema(cell.json_schema, result, registry=schemas.registry)
     if schema is None:
         return result
 
-    _validate_with_jsonschema(parsed, schema, result, schema_store, schema_ref)
+    _validate_with_jsonschema(parsed, schema, result, schemas, schema_ref)
     return result
 
 
 def _validate_markdown(cell: ScratchCell) -> ValidationResult:
-    result = ValidationResult(cell_index=cell.index, language=cell.language, cell_id=cell.cell_id)
+    result = _make_result(cell)
     analyzer = getattr(markdown_analysis, "analyze", None)
     if analyzer is None:
-        global _markdown_missing_logged
-        if not _markdown_missing_logged:
-            logger.warning("markdown-analysis unavailable; markdown diagnostics disabled")
-            _markdown_missing_logged = True
+        _log_once("markdown", "markdown-analysis unavailable; markdown diagnostics disabled")
         result.add_warning(MARKDOWN_SKIPPED_MESSAGE, code="VALIDATION_SKIPPED")
         return result
 
@@ -248,34 +362,33 @@ def _validate_markdown(cell: ScratchCell) -> ValidationResult:
         return result
 
     issues = _extract_analysis_messages(analysis)
-    for warning in issues.get("warnings", []):
-        result.add_warning(warning)
-    for error in issues.get("errors", []):
-        result.add_error(error)
+    add_warning = result.add_warning
+    for warning in issues["warnings"]:
+        add_warning(warning)
+    add_error = result.add_error
+    for error in issues["errors"]:
+        add_error(error)
     return result
 
 
 def _validate_plain_text(cell: ScratchCell) -> ValidationResult:
-    result = ValidationResult(cell_index=cell.index, language=cell.language, cell_id=cell.cell_id)
+    result = _make_result(cell)
     result.add_warning(NOT_VALIDATED_MESSAGE, code="VALIDATION_SKIPPED")
     result.details["reason"] = "Plain text does not require validation"
     return result
 
 
-def _validate_code(cell: ScratchCell) -> ValidationResult:
-    result = ValidationResult(cell_index=cell.index, language=cell.language, cell_id=cell.cell_id)
+def _validate_code(cell: ScratchCell, language: str) -> ValidationResult:
+    result = _make_result(cell)
     checker = _resolve_syntax_checker()
     if checker is None:
-        global _syntax_checker_missing_logged
-        if not _syntax_checker_missing_logged:
-            logger.warning("syntax-checker unavailable; code validation disabled")
-            _syntax_checker_missing_logged = True
+        _log_once("syntax_checker", "syntax-checker unavailable; code validation disabled")
         result.add_warning(SYNTAX_CHECK_SKIPPED_MESSAGE, code="VALIDATION_SKIPPED")
         result.details["reason"] = SYNTAX_CHECK_SKIPPED_MESSAGE
         return result
 
     try:
-        outcome = checker(language=cell.language.lower(), code=cell.content)
+        outcome = checker(language=language, code=cell.content)
     except Exception as exc:  # pragma: no cover - dependency specific
         result.add_warning(f"Syntax checker failed: {exc}")
         result.details["syntax_error"] = str(exc)
@@ -286,12 +399,25 @@ def _validate_code(cell: ScratchCell) -> ValidationResult:
 
 
 def _not_validated(cell: ScratchCell, message: str, *, code: str | None = None) -> ValidationResult:
-    result = ValidationResult(cell_index=cell.index, language=cell.language, cell_id=cell.cell_id)
+    result = _make_result(cell)
     result.add_warning(message, code=code)
     result.details.setdefault("reason", message)
     return result
 
 
+# Language dispatch: JSON and YAML validators take the prepared shared schemas, markdown and plain
+# text only the cell; CODE_LANGUAGES go to the syntax checker with their lower-cased language.
+_SCHEMA_VALIDATORS: dict[str, Callable[[ScratchCell, _PreparedSchemas], ValidationResult]] = {
+    "json": _validate_json,
+    "yaml": _validate_yaml,
+    "yml": _validate_yaml,
+}
+_CELL_VALIDATORS: dict[str, Callable[[ScratchCell], ValidationResult]] = {
+    "md": _validate_markdown,
+    "txt": _validate_plain_text,
+}
+
+
 def _extract_analysis_messages(result: Any) -> dict[str, list[str]]:
     messages: dict[str, list[str]] = {"warnings": [], "errors": []}
     if result is None:
@@ -301,19 +427,25 @@ def _extract_analysis_messages(result: Any) -> dict[str, list[str]]:
     errors = getattr(result, "errors", None)
 
     if isinstance(warnings, Iterable) and not isinstance(warnings, (str, bytes)):
-        messages["warnings"] = [str(item) for item in warnings]
+        messages["warnings"] = list(map(str, warnings))
     if isinstance(errors, Iterable) and not isinstance(errors, (str, bytes)):
-        messages["errors"] = [str(item) for item in errors]
+        messages["errors"] = list(map(str, errors))
     return messages
 
 
 def _resolve_syntax_checker() -> Callable[..., Any] | None:
     if syntax_checker is None:
         return None
-    if hasattr(syntax_checker, "check"):
-        return getattr(syntax_checker, "check")
-    if hasattr(syntax_checker, "check_code"):
-        return getattr(syntax_checker, "check_code")
+    return _syntax_checker_entrypoint(syntax_checker)
+
+
+@functools.lru_cache(maxsize=4)
+def _syntax_checker_entrypoint(module: Any) -> Callable[..., Any] | None:
+    # Keyed by the module object, so a swapped-in backend is resolved afresh.
+    for name in ("check", "check_code"):
+        entrypoint = getattr(module, name, None)
+        if entrypoint is not None:
+            return entrypoint
     return None
 
 
@@ -323,11 +455,29 @@ def _apply_syntax_checker_outcome(outcome: Any, result: ValidationResult) -> Non
     errors = getattr(outcome, "errors", None)
     warnings = getattr(outcome, "warnings", None)
     if isinstance(errors, Iterable) and not isinstance(errors, (str, bytes)):
-        for error in errors:
-            result.add_error(str(error))
+        add_error = result.add_error
+        for error in map(str, errors):
+            add_error(error)
     if isinstance(warnings, Iterable) and not isinstance(warnings, (str, bytes)):
-        for warning in warnings:
-            result.add_warning(str(warning))
+        add_warning = result.add_warning
+        for warning in map(str, warnings):
+            add_warning(warning)
+
+
+def _loads_json(text: str) -> Any:
+    """Parse ``text`` with orjson, falling back to ``json.loads`` where orjson differs.
+
+    orjson refuses ``NaN`` and reports positions differently, so failures are re-parsed to keep
+    the stdlib's verdict and ``JSONDecodeError`` details. It also reads integers wider than 64
+    bits as floats, so documents with long digit runs skip it.
+    """
+
+    if _WIDE_INTEGER_RE.search(text) is None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
 
 
 def _normalize_schema_registry(schemas: Mapping[str, Any] | None) -> dict[str, Mapping[str, Any]]:
@@ -339,12 +489,49 @@ def _normalize_schema_registry(schemas: Mapping[str, Any] | None) -> dict[str, M
     for name, entry in registry_entries.items():
         schema = entry.get("schema")
         if isinstance(schema, Mapping):
-            normalized[name] = dict(schema)
+            normalized[name] = schema
         else:
             logger.warning("Shared schema '%s' is missing a schema object; ignoring entry", name)
     return normalized
 
 
+def _prepare_schemas(schemas: Mapping[str, Any] | None) -> _PreparedSchemas:
+    """Return the normalised registry and reference store for ``schemas``.
+
+    Shared schemas arrive freshly decoded from scratchpad metadata on every request, so prepared
+    results are cached by a digest of their canonical JSON rather than by object identity, and
+    built from a private copy of that JSON. Inputs without a canonical form are prepared uncached.
+    """
+
+    if not schemas:
+        return _NO_SCHEMAS
+    if not isinstance(schemas, Mapping) or not all(isinstance(name, str) for name in schemas):
+        return _build_prepared_schemas(schemas)
+    try:
+        canonical = json.dumps(schemas, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    except (TypeError, ValueError):
+        return _build_prepared_schemas(schemas)
+    digest = hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+    with _prepared_schemas_lock:
+        prepared = _prepared_schemas_cache.get(digest)
+        if prepared is not None:
+            _prepared_schemas_cache.move_to_end(digest)
+            return prepared
+
+    prepared = _build_prepared_schemas(json.loads(canonical))
+    with _prepared_schemas_lock:
+        _prepared_schemas_cache[digest] = prepared
+        while len(_prepared_schemas_cache) > _PREPARED_SCHEMAS_CACHE_SIZE:
+            _prepared_schemas_cache.popitem(last=False)
+    return prepared
+
+
+def _build_prepared_schemas(schemas: Any) -> _PreparedSchemas:
+    registry = _normalize_schema_registry(schemas)
+    return _PreparedSchemas(registry=registry, store=_build_schema_store(registry))
+
+
 def _build_schema_store(registry: Mapping[str, Mapping[str, Any]]) -> dict[str, Mapping[str, Any]]:
     if not registry:
         return {}
@@ -370,16 +557,18 @@ def _coerce_json_schema_with_registry(
         return None, None
 
     schema_ref: str | None = None
+    # Schemas are only read from here on (jsonschema does not mutate them), so no copies are made.
+    mapping: Mapping[str, Any]
     if isinstance(schema, Mapping):
-        mapping = dict(schema)
+        mapping = schema
         schema_ref = _extract_direct_schema_ref(mapping)
     elif isinstance(schema, str):
         if schema.startswith(SCHEMA_REF_PREFIX):
             mapping = {"$ref": schema}
-            schema_ref = schema[len(SCHEMA_REF_PREFIX) :]
+            schema_ref = schema[_SCHEMA_REF_PREFIX_LEN:]
         else:
             try:
-                loaded = json.loads(schema)
+                loaded = _loads_json(schema)
             except json.JSONDecodeError as exc:
                 result.add_error(
                     f"Invalid JSON schema string: {exc.msg}",
@@ -387,7 +576,7 @@ def _coerce_json_schema_with_registry(
                 )
                 return None, None
             if isinstance(loaded, Mapping):
-                mapping = dict(loaded)
+                mapping = loaded
                 schema_ref = _extract_direct_schema_ref(mapping)
             else:
                 result.add_error("JSON schema string must decode to an object")
@@ -409,22 +598,17 @@ def _coerce_json_schema_with_registry(
 
 def _extract_direct_schema_ref(mapping: Mapping[str, Any]) -> str | None:
     ref = mapping.get("$ref")
-    if isinstance(ref, str) and ref.startswith(SCHEMA_REF_PREFIX):
-        return ref[len(SCHEMA_REF_PREFIX) :]
-    return None
+    return ref[_SCHEMA_REF_PREFIX_LEN:] if isinstance(ref, str) and ref.startswith(SCHEMA_REF_PREFIX) else None
 
 
 def _make_referencing_registry(schema_store: Mapping[str, Mapping[str, Any]]) -> Registry | None:
     if not schema_store:
         return None
     if Registry is None or Resource is None:  # pragma: no cover - guarded by dependency
-        global _referencing_missing_logged
-        if not _referencing_missing_logged:
-            logger.warning("referencing library unavailable; JSON schema references will be skipped")
-            _referencing_missing_logged = True
+        _log_once("referencing", "referencing library unavailable; JSON schema references will be skipped")
         return None
 
-    registry = Registry()
+    resources = []
     for uri, contents in schema_store.items():
         if DRAFT202012 is not None:  # pragma: no cover - dependency provided
             resource = DRAFT202012.create_resource(contents)
@@ -432,15 +616,17 @@ def _make_referencing_registry(schema_store: Mapping[str, Mapping[str, Any]]) ->
             materialized = dict(contents)
             materialized.setdefault("$schema", "https://json-schema.org/draft/2020-12/schema")
             resource = Resource.from_contents(materialized)
-        registry = registry.with_resource(uri, resource)
-    return registry
+        resources.append((uri, resource))
+    # Registries are immutable: add every resource in one step and crawl once up front, so
+    # anchors and embedded ``$id``s are indexed here rather than on each reference lookup.
+    return Registry().with_resources(resources).crawl()
 
 
 def _validate_with_jsonschema(
     instance: Any,
     schema: Mapping[str, Any],
     result: ValidationResult,
-    schema_store: Mapping[str, Mapping[str, Any]],
+    schemas: _PreparedSchemas,
     schema_ref: str | None,
 ) -> None:
     if jsonschema is None:  # pragma: no cover - guarded upstream
@@ -448,18 +634,14 @@ def _validate_with_jsonschema(
         return
 
     try:
-        validator_cls = jsonschema.validators.validator_for(schema)  # type: ignore[union-attr]
-        validator_cls.check_schema(schema)  # type: ignore[union-attr]
-        registry = _make_referencing_registry(schema_store)
-        if schema_store and registry is None:
+        validator = _compiled_validator(schema)
+        registry = schemas.referencing_registry()
+        if schemas.store and registry is None:
             result.add_warning(JSON_SCHEMA_REFERENCE_SKIPPED_MESSAGE, code="VALIDATION_SKIPPED")
             return
 
-        validator = (
-            validator_cls(schema, registry=registry)  # type: ignore[union-attr]
-            if registry is not None
-            else validator_cls(schema)  # type: ignore[union-attr]
-        )
+        if registry is not None:
+            validator = schemas.bind(validator, registry)
         validator.validate(instance)
         result.details["schema_applied"] = True
         if schema_ref:
@@ -479,6 +661,35 @@ def _validate_with_jsonschema(
         raise
 
 
+def _compiled_validator(schema: Mapping[str, Any]) -> Any:
+    """Return a validator for ``schema`` that has been checked against its metaschema.
+
+    Metaschema checks and validator construction dominate setup, so validators are cached by a
+    digest of the canonical schema JSON and shared between cells; validator instances are
+    immutable, so schemas without shared references validate without any further setup.
+    Schemas that cannot be serialised are compiled uncached.
+    """
+
+    try:
+        canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    except (TypeError, ValueError):
+        return _check_schema(schema)(schema)
+    digest = hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+    return _compile_schema(digest, canonical)
+
+
+@functools.lru_cache(maxsize=_SCHEMA_CACHE_SIZE)
+def _compile_schema(schema_hash: str, schema_json: str) -> Any:
+    schema = json.loads(schema_json)
+    return _check_schema(schema)(schema)
+
+
+def _check_schema(schema: Mapping[str, Any]) -> Any:
+    validator_cls = jsonschema.validators.validator_for(schema)  # type: ignore[union-attr]
+    validator_cls.check_schema(schema)  # type: ignore[union-attr]
+    return validator_cls
+
+
 def _handle_referencing_error(exc: Exception, result: ValidationResult, schema_ref: str | None) -> bool:
     try:
         from referencing.exceptions import Unresolvable  # type: ignore[assignment]
@@ -489,7 +700,7 @@ def _handle_referencing_error(exc: Exception, result: ValidationResult, schema_r
         reference = getattr(exc, "target", None) or getattr(exc, "message", None) or str(exc)
         display_ref = reference
         if isinstance(reference, str) and reference.startswith(SCHEMA_REF_PREFIX):
-            display_ref = reference[len(SCHEMA_REF_PREFIX) :]
+            display_ref = reference[_SCHEMA_REF_PREFIX_LEN:]
         result.add_error(
             f"JSON schema reference '{display_ref}' could not be resolved",
             details={"reference": reference},
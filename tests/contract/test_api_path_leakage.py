@@ -26,7 +26,6 @@ def app(tmp_path):
     return tmp_path
 
 
-@pytest.mark.asyncio
 async def test_list_response_does_not_leak_paths(app) -> None:
     storage_dir = str(app)
 
@@ -1,4 +1,3 @@
-import pytest
 import logging
 
 from scratch_notebook import load_config
@@ -14,7 +13,6 @@ class _RecordingHandler(logging.Handler):
         self.records.append(record)
 
 
-@pytest.mark.asyncio
 async def test_default_tenant_migration_logs_and_reassigns(tmp_path):
     storage_dir = tmp_path / "storage"
     environ = {
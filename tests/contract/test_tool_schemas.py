@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from scratch_notebook.server import scratch_create, scratch_list
+from scratch_notebook.server import _TOOL_SCHEMAS, scratch_create, scratch_list
 
 
 def test_scratch_create_metadata_schema_exposes_canonical_fields() -> None:
@@ -36,3 +36,11 @@ def test_scratch_create_description_instructs_namespace_reuse() -> None:
     lower_desc = description.lower()
     assert "reuse an existing prefix" in lower_desc
     assert "default tenant" in lower_desc or "multiple assistants" in lower_desc
+
+
+def test_output_schema_ok_switches_are_not_shared_between_tools() -> None:
+    switches = [
+        spec["output_schema"]["allOf"][0] for spec in _TOOL_SCHEMAS.values() if "output_schema" in spec
+    ]
+    fragments = [fragment for switch in switches for fragment in (switch, switch["if"], switch["then"], switch["else"])]
+    assert len({id(fragment) for fragment in fragments}) == len(fragments)
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import pytest
+
+from scratch_notebook import load_config
+from scratch_notebook.server import initialize_app, shutdown_app
+
+from .helpers import disable_indexing, reset_store
+
+_BASE_ENVIRON = {
+    "SCRATCH_NOTEBOOK_ENABLE_STDIO": "false",
+    "SCRATCH_NOTEBOOK_ENABLE_HTTP": "false",
+    "SCRATCH_NOTEBOOK_ENABLE_SSE": "false",
+    "SCRATCH_NOTEBOOK_ENABLE_METRICS": "false",
+    "SCRATCH_NOTEBOOK_ENABLE_AUTH": "false",
+    "SCRATCH_NOTEBOOK_EMBEDDING_MODEL": "debug-hash",
+}
+
+
+@pytest.fixture(scope="module")
+def app(request, tmp_path_factory):
+    """Initialise one app per module.
+
+    Modules may set ``APP_ENVIRON`` to override settings, and ``SKIP_INDEXING`` when they never search.
+    """
+
+    environ = {
+        **_BASE_ENVIRON,
+        "SCRATCH_NOTEBOOK_STORAGE_DIR": str(tmp_path_factory.mktemp("storage")),
+        **getattr(request.module, "APP_ENVIRON", {}),
+    }
+    config = load_config(argv=[], environ=environ)
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        if getattr(request.module, "SKIP_INDEXING", False):
+            disable_indexing(monkeypatch)
+        initialize_app(config)
+        yield config
+        shutdown_app()
+
+
+@pytest.fixture(autouse=True)
+async def _isolate(request):
+    # Modules that build their own app (HTTP transports, CLI) do not use the shared one.
+    if "app" in request.fixturenames:
+        await reset_store()
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import json
+import re
+
+from scratch_notebook.search import SearchService
+from scratch_notebook.server import (
+    _scratch_delete_impl,
+    _scratch_list_impl,
+    _scratch_namespace_delete_impl,
+    _scratch_namespace_list_impl,
+)
+
+_SSE_DATA_RE = re.compile(r"^data: (.*)$", re.MULTILINE)
+
+
+def parse_sse_json(body: str) -> dict[str, object]:
+    """Decode the JSON payload of the first ``data:`` line in a ``text/event-stream`` body."""
+
+    match = _SSE_DATA_RE.search(body)
+    if match is None:
+        raise AssertionError(f"No SSE data line found: {body!r}")
+    return json.loads(match.group(1))
+
+
+
+async def reset_store() -> None:
+    """Delete every scratchpad and namespace of the active tenant through the tool impls.
+
+    Lets a module share one initialised app while each test starts from an empty store.
+    """
+
+    listing = await _scratch_list_impl()
+    for entry in listing.get("scratchpads", []):
+        await _scratch_delete_impl(entry["scratch_id"])
+    namespaces = await _scratch_namespace_list_impl()
+    for entry in namespaces.get("namespaces", []):
+        await _scratch_namespace_delete_impl(entry["namespace"], delete_scratchpads=True)
+
+
+async def _skip_indexing(*_args, **_kwargs) -> None:
+    return None
+
+
+def disable_indexing(monkeypatch) -> None:
+    """Make the search service embed and store nothing, for suites that never search."""
+
+    for name in ("reindex_pad", "upsert_cell", "replace_cell", "delete_pad_embeddings"):
+        monkeypatch.setattr(SearchService, name, _skip_indexing)
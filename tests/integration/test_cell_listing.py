@@ -2,11 +2,7 @@ from __future__ import annotations
 
 import json
 
-import pytest
-
-from scratch_notebook import load_config
 from scratch_notebook.server import (
-    initialize_app,
     _scratch_append_cell_impl,
     _scratch_create_impl,
     _scratch_list_cells_impl,
@@ -15,22 +11,6 @@ from scratch_notebook.server import (
 )
 
 
-@pytest.fixture
-def app(tmp_path):
-    environ = {
-        "SCRATCH_NOTEBOOK_STORAGE_DIR": str(tmp_path),
-        "SCRATCH_NOTEBOOK_ENABLE_STDIO": "false",
-        "SCRATCH_NOTEBOOK_ENABLE_HTTP": "false",
-        "SCRATCH_NOTEBOOK_ENABLE_SSE": "false",
-        "SCRATCH_NOTEBOOK_ENABLE_METRICS": "false",
-        "SCRATCH_NOTEBOOK_ENABLE_AUTH": "false",
-        "SCRATCH_NOTEBOOK_EMBEDDING_MODEL": "debug-hash",
-    }
-    config = load_config(argv=[], environ=environ)
-    initialize_app(config)
-    return config
-
-
 async def _make_scratchpad_with_cells() -> tuple[str, list[str]]:
     create_resp = await _scratch_create_impl(
         metadata={
@@ -59,7 +39,6 @@ async def _make_scratchpad_with_cells() -> tuple[str, list[str]]:
     return scratch_id, cell_ids
 
 
-@pytest.mark.asyncio
 async def test_cell_listing_and_filtered_read_behaviour(app) -> None:
     scratch_id, cell_ids = await _make_scratchpad_with_cells()
 
@@ -1,22 +1,17 @@
 from __future__ import annotations
 
-import json
+import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncIterator, Tuple
 
 import httpx
-import pytest
+import pytest_asyncio
 
 from scratch_notebook import load_config
 from scratch_notebook.server import SERVER, initialize_app, shutdown_app
 from scratch_notebook.transports.http import HttpTransportConfig, _build_transport_app
 
-
-def _parse_sse_json(body: str) -> dict[str, object]:
-    for line in body.splitlines():
-        if line.startswith("data: "):
-            return json.loads(line[6:])
-    raise AssertionError(f"No data line found in SSE payload: {body!r}")
+from .helpers import parse_sse_json
 
 
 @asynccontextmanager
@@ -53,81 +48,101 @@ async def _http_test_client(tmp_path) -> AsyncIterator[Tuple[httpx.AsyncClient,
             socket_path=None,
         )
         app = _build_transport_app(SERVER, http_config)
-        async with app.router.lifespan_context(app):
+        started = asyncio.Event()
+        stop = asyncio.Event()
+        lifespan = asyncio.create_task(_run_lifespan(app, started, stop))
+        await started.wait()
+        try:
             transport = httpx.ASGITransport(app=app)
             async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
                 yield client, http_config
+        finally:
+            stop.set()
+            await lifespan
     finally:
         shutdown_app()
 
 
-@pytest.mark.anyio
-async def test_http_initialize_and_call_tool(tmp_path) -> None:
-    async with _http_test_client(tmp_path) as (client, config):
-        base_headers = {
-            "Authorization": "Bearer secret",
-            "Accept": "application/json, text/event-stream",
-        }
-
-        init_payload = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "initialize",
-            "params": {
-                "protocolVersion": "2025-06-18",
-                "capabilities": {},
-                "clientInfo": {"name": "test-client", "version": "0.0.0"},
-            },
-        }
-        init_response = await client.post(config.http_path, json=init_payload, headers=base_headers)
-        assert init_response.status_code == 200
-        assert init_response.headers.get("content-type", "").startswith("text/event-stream")
-        session_id = init_response.headers["mcp-session-id"]
-        init_event = _parse_sse_json(init_response.text)
-        assert init_event["id"] == 1
-
-        call_headers = dict(base_headers)
-        call_headers.update({
-            "Content-Type": "application/json",
-            "mcp-session-id": session_id,
-        })
-        call_payload = {
-            "jsonrpc": "2.0",
-            "id": 2,
-            "method": "tools/call",
-            "params": {
-                "name": "scratch_list",
-                "arguments": {},
-            },
-        }
-        call_response = await client.post(config.http_path, json=call_payload, headers=call_headers)
-        assert call_response.status_code == 200
-        assert call_response.headers.get("content-type", "").startswith("text/event-stream")
-        call_event = _parse_sse_json(call_response.text)
-        assert call_event["id"] == 2
-        payload = call_event["result"]
-        assert isinstance(payload, dict)
-        assert payload["structuredContent"] == {"ok": True, "scratchpads": []}
-
-
-@pytest.mark.anyio
-async def test_metrics_endpoint_exposes_prometheus(tmp_path) -> None:
-    async with _http_test_client(tmp_path) as (client, config):
-        headers = {"Authorization": "Bearer secret"}
-        response = await client.get(config.metrics_path, headers=headers)
-        assert response.status_code == 200
-        body = response.text
-        assert "scratch_notebook_ops_total" in body
-        assert "scratch_notebook_uptime_seconds" in body
-
-
-@pytest.mark.anyio
-async def test_http_auth_rejects_missing_token(tmp_path) -> None:
-    async with _http_test_client(tmp_path) as (client, config):
-        response = await client.post(
-            config.http_path,
-            json={"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}},
-        )
-        assert response.status_code == 401
-        problem = response.json()
-        assert problem["error"] == "invalid_token"
+async def _run_lifespan(app, started: asyncio.Event, stop: asyncio.Event) -> None:
+    # The lifespan's cancel scopes must be entered and exited by the same task, which a
+    # module-scoped fixture does not guarantee for its setup and teardown.
+    async with app.router.lifespan_context(app):
+        started.set()
+        await stop.wait()
+
+
+@pytest_asyncio.fixture(scope="module")
+async def http_client(tmp_path_factory) -> AsyncIterator[Tuple[httpx.AsyncClient, HttpTransportConfig]]:
+    # Lifespan startup dominates these tests, so the app and client are shared by the module;
+    # none of the tests leave scratchpads behind.
+    async with _http_test_client(tmp_path_factory.mktemp("http")) as client_and_config:
+        yield client_and_config
+
+
+async def test_http_initialize_and_call_tool(http_client) -> None:
+    client, config = http_client
+    base_headers = {
+        "Authorization": "Bearer secret",
+        "Accept": "application/json, text/event-stream",
+    }
+
+    init_payload = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "initialize",
+        "params": {
+            "protocolVersion": "2025-06-18",
+            "capabilities": {},
+            "clientInfo": {"name": "test-client", "version": "0.0.0"},
+        },
+    }
+    init_response = await client.post(config.http_path, json=init_payload, headers=base_headers)
+    assert init_response.status_code == 200
+    assert init_response.headers.get("content-type", "").startswith("text/event-stream")
+    session_id = init_response.headers["mcp-session-id"]
+    init_event = parse_sse_json(init_response.text)
+    assert init_event["id"] == 1
+
+    call_headers = dict(base_headers)
+    call_headers.update({
+        "Content-Type": "application/json",
+        "mcp-session-id": session_id,
+    })
+    call_payload = {
+        "jsonrpc": "2.0",
+        "id": 2,
+        "method": "tools/call",
+        "params": {
+            "name": "scratch_list",
+            "arguments": {},
+        },
+    }
+    call_response = await client.post(config.http_path, json=call_payload, headers=call_headers)
+    assert call_response.status_code == 200
+    assert call_response.headers.get("content-type", "").startswith("text/event-stream")
+    call_event = parse_sse_json(call_response.text)
+    assert call_event["id"] == 2
+    payload = call_event["result"]
+    assert isinstance(payload, dict)
+    assert payload["structuredContent"] == {"ok": True, "scratchpads": []}
+
+
+async def test_metrics_endpoint_exposes_prometheus(http_client) -> None:
+    client, config = http_client
+    headers = {"Authorization": "Bearer secret"}
+    response = await client.get(config.metrics_path, headers=headers)
+    assert response.status_code == 200
+    body = response.text
+    assert "scratch_notebook_ops_total" in body
+    assert "scratch_notebook_uptime_seconds" in body
+
+
+async def test_http_auth_rejects_missing_token(http_client) -> None:
+    client, config = http_client
+    response = await client.post(
+        config.http_path,
+        json={"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}},
+    )
+    assert response.status_code == 401
+    problem = response.json()
+    assert problem["error"] == "invalid_token"
@@ -1,8 +1,5 @@
 from __future__ import annotations
 
-import pytest
-
-from scratch_notebook import load_config
 from scratch_notebook.server import (
     _scratch_create_impl,
     _scratch_namespace_create_impl,
@@ -10,27 +7,12 @@ from scratch_notebook.server import (
     _scratch_namespace_list_impl,
     _scratch_namespace_rename_impl,
     _scratch_read_impl,
-    initialize_app,
 )
 
 
-@pytest.fixture
-def app(tmp_path):
-    environ = {
-        "SCRATCH_NOTEBOOK_STORAGE_DIR": str(tmp_path),
-        "SCRATCH_NOTEBOOK_ENABLE_STDIO": "false",
-        "SCRATCH_NOTEBOOK_ENABLE_HTTP": "false",
-        "SCRATCH_NOTEBOOK_ENABLE_SSE": "false",
-        "SCRATCH_NOTEBOOK_ENABLE_METRICS": "false",
-        "SCRATCH_NOTEBOOK_ENABLE_AUTH": "false",
-        "SCRATCH_NOTEBOOK_EMBEDDING_MODEL": "debug-hash",
-    }
-    config = load_config(argv=[], environ=environ)
-    initialize_app(config)
-    return config
+SKIP_INDEXING = True
 
 
-@pytest.mark.asyncio
 async def test_namespace_lifecycle(app) -> None:
     list_resp = await _scratch_namespace_list_impl()
     assert list_resp["ok"] is True
@@ -2,9 +2,6 @@ from __future__ import annotations
 
 import uuid
 
-import pytest
-
-from scratch_notebook import load_config
 from scratch_notebook.server import (
     initialize_app,
     _scratch_append_cell_impl,
@@ -16,23 +13,9 @@ from scratch_notebook.server import (
 )
 
 
-@pytest.fixture
-def app(tmp_path):
-    environ = {
-        "SCRATCH_NOTEBOOK_STORAGE_DIR": str(tmp_path),
-        "SCRATCH_NOTEBOOK_ENABLE_STDIO": "false",
-        "SCRATCH_NOTEBOOK_ENABLE_HTTP": "false",
-        "SCRATCH_NOTEBOOK_ENABLE_SSE": "false",
-        "SCRATCH_NOTEBOOK_ENABLE_METRICS": "false",
-        "SCRATCH_NOTEBOOK_ENABLE_AUTH": "false",
-        "SCRATCH_NOTEBOOK_EMBEDDING_MODEL": "debug-hash",
-    }
-    config = load_config(argv=[], environ=environ)
-    initialize_app(config)
-    return config
+SKIP_INDEXING = True
 
 
-@pytest.mark.asyncio
 async def test_full_scratchpad_lifecycle(app) -> None:
     create_resp = await _scratch_create_impl(
         metadata={
@@ -90,8 +73,6 @@ async def test_full_scratchpad_lifecycle(app) -> None:
     assert replace_resp["scratchpad"]["tags"] == ["alpha", "payload"]
     assert replace_resp["scratchpad"]["cells"][0]["tags"] == ["payload"]
 
-    initialize_app(app)
-
     read_resp = await _scratch_read_impl(scratch_id)
     assert read_resp["ok"] is True
     assert read_resp["scratchpad"]["scratch_id"] == scratch_id
@@ -123,7 +104,29 @@ async def test_full_scratchpad_lifecycle(app) -> None:
     assert missing_resp["error"]["code"] == "NOT_FOUND"
 
 
-@pytest.mark.asyncio
+async def test_scratchpad_persists_across_reload(app) -> None:
+    create_resp = await _scratch_create_impl(metadata={"title": "Persistent", "tags": ["alpha"], "namespace": "research"})
+    scratch_id = create_resp["scratchpad"]["scratch_id"]
+    append_resp = await _scratch_append_cell_impl(
+        scratch_id,
+        {"language": "json", "content": "{\"value\": 1}", "metadata": {"tags": ["payload"]}},
+    )
+    cell_id = append_resp["scratchpad"]["cells"][0]["cell_id"]
+
+    # Reopen storage from disk; the only test in this module that pays for a full reload.
+    initialize_app(app)
+
+    read_resp = await _scratch_read_impl(scratch_id)
+    assert read_resp["ok"] is True
+    scratchpad = read_resp["scratchpad"]
+    assert scratchpad["metadata"]["title"] == "Persistent"
+    assert scratchpad["namespace"] == "research"
+    assert scratchpad["tags"] == ["alpha", "payload"]
+    assert scratchpad["cell_tags"] == ["payload"]
+    assert [cell["cell_id"] for cell in scratchpad["cells"]] == [cell_id]
+    assert scratchpad["cells"][0]["content"] == "{\"value\": 1}"
+
+
 async def test_scratch_create_with_initial_cells(app) -> None:
     metadata = {
         "title": "Seeded Pad",
@@ -164,7 +167,6 @@ async def test_scratch_create_with_initial_cells(app) -> None:
     assert read_cells[1]["content"] == "# Heading"
 
 
-@pytest.mark.asyncio
 async def test_scratch_create_invalid_cell_rolls_back(app) -> None:
     resp = await _scratch_create_impl(
         scratch_id="invalid-pad",
@@ -3,11 +3,10 @@ from __future__ import annotations
 import json
 
 import pytest
+import pytest_asyncio
 
-from scratch_notebook import load_config
 from scratch_notebook import validation as validation_module
 from scratch_notebook.server import (
-    initialize_app,
     _scratch_append_cell_impl,
     _scratch_create_impl,
     _scratch_read_impl,
@@ -16,68 +15,98 @@ from scratch_notebook.server import (
 from scratch_notebook.validation import NOT_VALIDATED_MESSAGE, SYNTAX_CHECK_SKIPPED_MESSAGE
 
 
-@pytest.fixture
-def app(tmp_path):
-    environ = {
-        "SCRATCH_NOTEBOOK_STORAGE_DIR": str(tmp_path),
-        "SCRATCH_NOTEBOOK_ENABLE_STDIO": "false",
-        "SCRATCH_NOTEBOOK_ENABLE_HTTP": "false",
-        "SCRATCH_NOTEBOOK_ENABLE_SSE": "false",
-        "SCRATCH_NOTEBOOK_ENABLE_METRICS": "false",
-        "SCRATCH_NOTEBOOK_ENABLE_AUTH": "false",
-        "SCRATCH_NOTEBOOK_EMBEDDING_MODEL": "debug-hash",
-    }
-    config = load_config(argv=[], environ=environ)
-    initialize_app(config)
-    return config
+_SHARED_SCHEMA = {
+    "type": "object",
+    "properties": {"value": {"type": "integer"}},
+    "required": ["value"],
+}
 
 
-@pytest.mark.asyncio
-async def test_scratch_validate_returns_results_for_json_cell(app) -> None:
-    create_resp = await _scratch_create_impl(metadata={"title": "validation"})
-    scratch_id = create_resp["scratchpad"]["scratch_id"]
+@pytest_asyncio.fixture
+async def validation_pad(app) -> tuple[str, dict[str, str]]:
+    """One pad holding a cell per read-only validation scenario, keyed by scenario name."""
 
-    append_resp = await _scratch_append_cell_impl(
-        scratch_id,
-        {
+    cells = {
+        "valid_json": {"language": "json", "content": json.dumps({"value": 1})},
+        "txt": {"language": "txt", "content": "notes"},
+        "shared_ref": {
             "language": "json",
-            "content": json.dumps({"value": 1}),
+            "content": json.dumps({"value": 7}),
+            "json_schema": {"$ref": "scratchpad://schemas/payload"},
         },
+        "missing_ref": {
+            "language": "json",
+            "content": json.dumps({"value": 9}),
+            "json_schema": "scratchpad://schemas/not-there",
+        },
+    }
+    create_resp = await _scratch_create_impl(
+        metadata={"title": "validation", "schemas": {"payload": _SHARED_SCHEMA}},
+        cells=list(cells.values()),
     )
-    cell_id = append_resp["scratchpad"]["cells"][0]["cell_id"]
+    scratchpad = create_resp["scratchpad"]
+    cell_ids = {key: cell["cell_id"] for key, cell in zip(cells, scratchpad["cells"])}
+    return scratchpad["scratch_id"], cell_ids
+
+
+@pytest.mark.parametrize(
+    ("cell_key", "warning_fragment", "schema_ref"),
+    [
+        ("valid_json", None, None),
+        ("txt", NOT_VALIDATED_MESSAGE, None),
+        ("shared_ref", None, "payload"),
+        ("missing_ref", "JSON schema reference", None),
+    ],
+)
+async def test_scratch_validate_reports_cell_result(
+    validation_pad, cell_key: str, warning_fragment: str | None, schema_ref: str | None
+) -> None:
+    if cell_key == "missing_ref" and validation_module.jsonschema is None:
+        pytest.skip("jsonschema not available in runtime")
+    scratch_id, cell_ids = validation_pad
+
+    validate_resp = await _scratch_validate_impl(scratch_id, cell_ids=[cell_ids[cell_key]])
+
+    assert validate_resp["ok"] is True
+    [result] = validate_resp["results"]
+    assert result["cell_id"] == cell_ids[cell_key]
+    assert result["valid"] is True
+    if warning_fragment is not None:
+        assert any(warning_fragment in warning["message"] for warning in result["warnings"])
+    if schema_ref is not None:
+        assert result.get("details", {}).get("schema_ref") == schema_ref
+
 
-    initialize_app(app)
+async def test_scratch_validate_returns_results_for_every_cell(validation_pad) -> None:
+    scratch_id, cell_ids = validation_pad
 
     validate_resp = await _scratch_validate_impl(scratch_id)
 
     assert validate_resp["ok"] is True
-    results = validate_resp["results"]
-    assert len(results) == 1
-    assert results[0]["valid"] is True
-    assert results[0]["cell_id"] == cell_id
+    assert [result["cell_id"] for result in validate_resp["results"]] == list(cell_ids.values())
 
 
-@pytest.mark.asyncio
-async def test_scratch_validate_with_cell_ids_limits_scope(app) -> None:
-    create_resp = await _scratch_create_impl(metadata={})
-    scratch_id = create_resp["scratchpad"]["scratch_id"]
+async def test_scratch_validate_with_invalid_cell_id_returns_error(validation_pad) -> None:
+    scratch_id, _ = validation_pad
 
-    first_append = await _scratch_append_cell_impl(
-        scratch_id,
-        {
-            "language": "json",
-            "content": json.dumps({"one": 1}),
-        },
-    )
-    second_append = await _scratch_append_cell_impl(
-        scratch_id,
-        {
-            "language": "json",
-            "content": json.dumps({"two": 2}),
-        },
+    validate_resp = await _scratch_validate_impl(scratch_id, cell_ids=["missing"])
+
+    assert validate_resp["ok"] is False
+    assert validate_resp["error"]["code"] == "NOT_FOUND"
+
+
+async def test_scratch_validate_with_cell_ids_limits_scope(app) -> None:
+    create_resp = await _scratch_create_impl(
+        metadata={},
+        cells=[
+            {"language": "json", "content": json.dumps({"one": 1})},
+            {"language": "json", "content": json.dumps({"two": 2})},
+        ],
     )
-    target_cell_id = second_append["scratchpad"]["cells"][1]["cell_id"]
-    other_cell_id = first_append["scratchpad"]["cells"][0]["cell_id"]
+    scratchpad = create_resp["scratchpad"]
+    scratch_id = scratchpad["scratch_id"]
+    other_cell_id = scratchpad["cells"][0]["cell_id"]
+    target_cell_id = scratchpad["cells"][1]["cell_id"]
 
     validate_resp = await _scratch_validate_impl(scratch_id, cell_ids=[target_cell_id])
 
@@ -88,26 +117,6 @@ async def test_scratch_validate_with_cell_ids_limits_scope(app) -> None:
     assert results[0]["cell_id"] != other_cell_id
 
 
-@pytest.mark.asyncio
-async def test_scratch_validate_with_invalid_cell_id_returns_error(app) -> None:
-    create_resp = await _scratch_create_impl(metadata={})
-    scratch_id = create_resp["scratchpad"]["scratch_id"]
-
-    await _scratch_append_cell_impl(
-        scratch_id,
-        {
-            "language": "json",
-            "content": json.dumps({"value": 1}),
-        },
-    )
-
-    validate_resp = await _scratch_validate_impl(scratch_id, cell_ids=["missing"])
-
-    assert validate_resp["ok"] is False
-    assert validate_resp["error"]["code"] == "NOT_FOUND"
-
-
-@pytest.mark.asyncio
 async def test_append_with_validate_flag_returns_validation_summary(app) -> None:
     create_resp = await _scratch_create_impl(metadata={})
     scratch_id = create_resp["scratchpad"]["scratch_id"]
@@ -130,7 +139,6 @@ async def test_append_with_validate_flag_returns_validation_summary(app) -> None
     )
 
 
-@pytest.mark.asyncio
 async def test_append_with_validate_flag_rejects_invalid_payload(app) -> None:
     create_resp = await _scratch_create_impl(metadata={})
     scratch_id = create_resp["scratchpad"]["scratch_id"]
@@ -157,56 +165,6 @@ async def test_append_with_validate_flag_rejects_invalid_payload(app) -> None:
     assert len(read_resp["scratchpad"]["cells"]) == 1
 
 
-@pytest.mark.asyncio
-async def test_validate_reports_plain_text_warning(app) -> None:
-    create_resp = await _scratch_create_impl(metadata={})
-    scratch_id = create_resp["scratchpad"]["scratch_id"]
-
-    await _scratch_append_cell_impl(
-        scratch_id,
-        {
-            "language": "txt",
-            "content": "notes",
-        },
-    )
-
-    validate_resp = await _scratch_validate_impl(scratch_id)
-
-    assert validate_resp["ok"] is True
-    warnings = validate_resp["results"][0]["warnings"]
-    assert any(NOT_VALIDATED_MESSAGE in warning["message"] for warning in warnings)
-
-
-@pytest.mark.asyncio
-async def test_validate_uses_shared_schema_registry(app) -> None:
-    shared_schema = {
-        "type": "object",
-        "properties": {"value": {"type": "integer"}},
-        "required": ["value"],
-    }
-    create_resp = await _scratch_create_impl(metadata={"schemas": {"payload": shared_schema}})
-    scratch_id = create_resp["scratchpad"]["scratch_id"]
-
-    await _scratch_append_cell_impl(
-        scratch_id,
-        {
-            "language": "json",
-            "content": json.dumps({"value": 7}),
-            "json_schema": {"$ref": "scratchpad://schemas/payload"},
-        },
-    )
-
-    initialize_app(app)
-
-    validate_resp = await _scratch_validate_impl(scratch_id)
-
-    assert validate_resp["ok"] is True
-    result = validate_resp["results"][0]
-    assert result["valid"] is True
-    assert result.get("details", {}).get("schema_ref") == "payload"
-
-
-@pytest.mark.asyncio
 async def test_append_validate_flag_rejects_missing_shared_schema(app) -> None:
     create_resp = await _scratch_create_impl(metadata={"schemas": {}})
     scratch_id = create_resp["scratchpad"]["scratch_id"]
@@ -230,33 +188,6 @@ async def test_append_validate_flag_rejects_missing_shared_schema(app) -> None:
     )
 
 
-@pytest.mark.asyncio
-async def test_validate_surfaces_missing_schema_reference_warnings(app) -> None:
-    if validation_module.jsonschema is None:
-        pytest.skip("jsonschema not available in runtime")
-
-    create_resp = await _scratch_create_impl(metadata={"schemas": {}})
-    scratch_id = create_resp["scratchpad"]["scratch_id"]
-
-    await _scratch_append_cell_impl(
-        scratch_id,
-        {
-            "language": "json",
-            "content": json.dumps({"value": 9}),
-            "json_schema": "scratchpad://schemas/not-there",
-        },
-    )
-
-    validate_resp = await _scratch_validate_impl(scratch_id)
-
-    assert validate_resp["ok"] is True
-    warning_messages = validate_resp["results"][0]["warnings"]
-    assert any("JSON schema reference" in warning["message"] for warning in warning_messages)
-    read_resp = await _scratch_read_impl(scratch_id)
-    assert len(read_resp["scratchpad"]["cells"]) == 1
-
-
-@pytest.mark.asyncio
 async def test_append_validate_for_missing_code_checker_only_warns(
     app, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -285,3 +216,23 @@ async def test_append_validate_for_missing_code_checker_only_warns(
     assert any(SYNTAX_CHECK_SKIPPED_MESSAGE in warning["message"] for warning in validate_warnings)
     read_resp = await _scratch_read_impl(scratch_id)
     assert len(read_resp["scratchpad"]["cells"]) == 1
+
+
+async def test_append_reverts_cell_when_validation_crashes(app, monkeypatch) -> None:
+    create_resp = await _scratch_create_impl(metadata={"title": "validation crash"})
+    scratch_id = create_resp["scratchpad"]["scratch_id"]
+
+    def _boom(*_args, **_kwargs):
+        raise RuntimeError("validator crashed")
+
+    monkeypatch.setattr(validation_module, "_validate_cell_prepared", _boom)
+
+    with pytest.raises(RuntimeError):
+        await _scratch_append_cell_impl(
+            scratch_id,
+            {"language": "json", "content": "{}", "validate": True},
+        )
+
+    read_resp = await _scratch_read_impl(scratch_id)
+    assert read_resp["ok"] is True
+    assert read_resp["scratchpad"]["cells"] == []
@@ -1,33 +1,12 @@
 from __future__ import annotations
 
-import pytest
-
-from scratch_notebook import load_config
 from scratch_notebook.server import (
-    initialize_app,
     _scratch_append_cell_impl,
     _scratch_create_impl,
     _scratch_search_impl,
 )
 
 
-@pytest.fixture()
-def app(tmp_path):
-    environ = {
-        "SCRATCH_NOTEBOOK_STORAGE_DIR": str(tmp_path),
-        "SCRATCH_NOTEBOOK_ENABLE_STDIO": "false",
-        "SCRATCH_NOTEBOOK_ENABLE_HTTP": "false",
-        "SCRATCH_NOTEBOOK_ENABLE_SSE": "false",
-        "SCRATCH_NOTEBOOK_ENABLE_METRICS": "false",
-        "SCRATCH_NOTEBOOK_ENABLE_AUTH": "false",
-        "SCRATCH_NOTEBOOK_EMBEDDING_MODEL": "debug-hash",
-    }
-    config = load_config(argv=[], environ=environ)
-    initialize_app(config)
-    return config
-
-
-@pytest.mark.asyncio
 async def test_scratch_search_returns_ranked_hits(app) -> None:
     create_resp = await _scratch_create_impl(
         metadata={
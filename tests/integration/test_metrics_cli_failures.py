@@ -31,7 +31,6 @@ def test_metrics_requires_http_integration(tmp_path) -> None:
         )
 
 
-@pytest.mark.asyncio
 async def test_metrics_disabled_preserves_stdio_workflows(tmp_path) -> None:
     config = load_config(
         argv=[
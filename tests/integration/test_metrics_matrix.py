@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from contextlib import asynccontextmanager
 from typing import AsyncIterator, Tuple
 
@@ -11,12 +10,7 @@ from scratch_notebook.config import ConfigError, load_config
 from scratch_notebook.server import SERVER, initialize_app, shutdown_app
 from scratch_notebook.transports.http import HttpTransportConfig, _build_transport_app
 
-
-def _parse_sse_json(body: str) -> dict[str, object]:
-    for line in body.splitlines():
-        if line.startswith("data: "):
-            return json.loads(line[6:])
-    raise AssertionError(f"No SSE data line found: {body!r}")
+from .helpers import parse_sse_json
 
 
 @asynccontextmanager
@@ -81,7 +75,6 @@ def test_metrics_matrix_requires_http(tmp_path) -> None:
         )
 
 
-@pytest.mark.anyio
 async def test_metrics_matrix_metrics_without_sse(tmp_path) -> None:
     async with _http_matrix_client(
         tmp_path,
@@ -96,7 +89,6 @@ async def test_metrics_matrix_metrics_without_sse(tmp_path) -> None:
         assert "scratch_notebook_uptime_seconds" in body
 
 
-@pytest.mark.anyio
 async def test_metrics_matrix_metrics_with_sse(tmp_path) -> None:
     async with _http_matrix_client(
         tmp_path,
@@ -120,7 +112,7 @@ async def test_metrics_matrix_metrics_with_sse(tmp_path) -> None:
             headers={"Accept": "application/json, text/event-stream"},
         )
         assert response.status_code == 200
-        event = _parse_sse_json(response.text)
+        event = parse_sse_json(response.text)
         assert event["id"] == 1
 
         metrics_response = await client.get(config.metrics_path)
@@ -128,7 +120,6 @@ async def test_metrics_matrix_metrics_with_sse(tmp_path) -> None:
         assert "scratch_notebook_ops_total" in metrics_response.text
 
 
-@pytest.mark.anyio
 @pytest.mark.parametrize(
     "enable_http, enable_sse",
     [
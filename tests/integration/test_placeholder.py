@@ -1,7 +1,3 @@
-import pytest
-
-
-@pytest.mark.asyncio
 async def test_placeholder_integration() -> None:
     """Placeholder async integration test to validate discovery."""
 
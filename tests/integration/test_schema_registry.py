@@ -2,11 +2,7 @@ from __future__ import annotations
 
 import json
 
-import pytest
-
-from scratch_notebook import load_config
 from scratch_notebook.server import (
-    initialize_app,
     _scratch_append_cell_impl,
     _scratch_create_impl,
     _scratch_get_schema_impl,
@@ -16,23 +12,6 @@ from scratch_notebook.server import (
 )
 
 
-@pytest.fixture
-def app(tmp_path):
-    environ = {
-        "SCRATCH_NOTEBOOK_STORAGE_DIR": str(tmp_path),
-        "SCRATCH_NOTEBOOK_ENABLE_STDIO": "false",
-        "SCRATCH_NOTEBOOK_ENABLE_HTTP": "false",
-        "SCRATCH_NOTEBOOK_ENABLE_SSE": "false",
-        "SCRATCH_NOTEBOOK_ENABLE_METRICS": "false",
-        "SCRATCH_NOTEBOOK_ENABLE_AUTH": "false",
-        "SCRATCH_NOTEBOOK_EMBEDDING_MODEL": "debug-hash",
-    }
-    config = load_config(argv=[], environ=environ)
-    initialize_app(config)
-    return config
-
-
-@pytest.mark.asyncio
 async def test_schema_registry_roundtrip(app) -> None:
     create_resp = await _scratch_create_impl()
     scratch_id = create_resp["scratchpad"]["scratch_id"]
@@ -110,7 +89,6 @@ async def test_schema_registry_roundtrip(app) -> None:
     assert "label" in post_update_payload["schema"]["properties"]
 
 
-@pytest.mark.asyncio
 async def test_upsert_schema_rejects_invalid_schema(app) -> None:
     create_resp = await _scratch_create_impl()
     scratch_id = create_resp["scratchpad"]["scratch_id"]
@@ -128,7 +106,6 @@ async def test_upsert_schema_rejects_invalid_schema(app) -> None:
     assert invalid_resp["error"]["code"] == "VALIDATION_ERROR"
 
 
-@pytest.mark.asyncio
 async def test_upserted_schema_integrates_with_validation(app) -> None:
     create_resp = await _scratch_create_impl()
     scratch_id = create_resp["scratchpad"]["scratch_id"]
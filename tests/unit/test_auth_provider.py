@@ -3,14 +3,11 @@ from __future__ import annotations
 import asyncio
 from types import SimpleNamespace
 
-import pytest
-
 from scratch_notebook import load_config
 from scratch_notebook.auth import ScratchTokenAuthProvider
 from scratch_notebook.server import APP_STATE, get_storage, initialize_app, shutdown_app
 
 
-@pytest.mark.asyncio
 async def test_verify_token_matches_registry() -> None:
     provider = ScratchTokenAuthProvider({"tenant-a": "token-123"})
     token = await provider.verify_token("token-123")
@@ -19,7 +16,6 @@ async def test_verify_token_matches_registry() -> None:
     assert token.claims["tenant_id"] == "tenant-a"
 
 
-@pytest.mark.asyncio
 async def test_verify_token_unknown_returns_none() -> None:
     provider = ScratchTokenAuthProvider({"tenant-a": "token-123"})
     token = await provider.verify_token("other")
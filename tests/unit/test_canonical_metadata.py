@@ -27,7 +27,6 @@ def app(tmp_path):
     return config
 
 
-@pytest.mark.asyncio
 async def test_create_returns_trimmed_canonical_fields(app) -> None:
     resp = await _scratch_create_impl(
         metadata={"title": "  Title  ", "description": " Description ", "summary": "  Summary  "}
@@ -43,7 +42,6 @@ async def test_create_returns_trimmed_canonical_fields(app) -> None:
     assert pad["metadata"]["summary"] == "Summary"
 
 
-@pytest.mark.asyncio
 async def test_read_persists_canonical_fields_across_restart(app) -> None:
     create_resp = await _scratch_create_impl(
         metadata={"title": "Notebook", "description": "Primary notebook", "summary": "Key notes"}
@@ -63,7 +61,6 @@ async def test_read_persists_canonical_fields_across_restart(app) -> None:
     assert pad["metadata"]["summary"] == "Key notes"
 
 
-@pytest.mark.asyncio
 async def test_list_returns_null_when_canonical_metadata_missing(app) -> None:
     first = await _scratch_create_impl()
     second = await _scratch_create_impl(metadata={"title": "Other pad", "description": "Other description"})
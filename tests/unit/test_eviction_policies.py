@@ -60,3 +60,23 @@ def test_pop_recent_evictions_clears_queue(tmp_path) -> None:
     storage.create_scratchpad(_pad("pad_b"))
     assert storage.pop_recent_evictions() == ["pad_a"]
     assert storage.pop_recent_evictions() == []
+
+
+def test_reads_record_access_times_until_flushed(tmp_path) -> None:
+    storage = _make_storage(tmp_path)
+
+    storage.create_scratchpad(_pad("pad_a"))
+    before = storage._fetch_row("pad_a")  # type: ignore[attr-defined]
+    version = storage._table.version  # type: ignore[attr-defined]
+    time.sleep(0.01)
+
+    storage.read_scratchpad("pad_a")
+    storage.read_scratchpad("pad_a")
+    assert storage._table.version == version  # type: ignore[attr-defined]
+
+    storage.flush_access_times()
+    after = storage._fetch_row("pad_a")  # type: ignore[attr-defined]
+    assert storage._table.version == version + 1  # type: ignore[attr-defined]
+    assert after["last_access_at"] > before["last_access_at"]
+    assert after["updated_at"] == before["updated_at"]
+    assert after["cells_json"] == before["cells_json"]
@@ -72,3 +72,25 @@ def test_preemptive_sweeper_removes_stale_entries(tmp_path) -> None:
         sweeper.stop()
 
     assert not storage.has_scratchpad("pad_old")
+
+
+def test_sweeper_without_age_only_persists_access_times(tmp_path) -> None:
+    storage = _make_storage(tmp_path)
+
+    storage.create_scratchpad(_pad("pad_old"))
+    stale = datetime.now(timezone.utc) - timedelta(minutes=5)
+    _set_last_access(storage, "pad_old", stale)
+    storage.read_scratchpad("pad_old")
+
+    sweeper = PreemptiveSweeper(storage, age=None, interval=timedelta(seconds=0.1))
+    sweeper.start()
+
+    try:
+        deadline = time.time() + 2.0
+        while storage._fetch_row("pad_old")["last_access_at"] <= stale and time.time() < deadline:  # type: ignore[attr-defined,index]
+            time.sleep(0.05)
+    finally:
+        sweeper.stop()
+
+    assert storage._fetch_row("pad_old")["last_access_at"] > stale  # type: ignore[attr-defined,index]
+    assert storage.has_scratchpad("pad_old")
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import json
+import math
+import threading
 import uuid
 
 import pytest
 
-from scratch_notebook import load_config, models
+from scratch_notebook import load_config, models, storage_lancedb
 from scratch_notebook.errors import CAPACITY_LIMIT_REACHED, CONFIG_ERROR, INVALID_INDEX, NOT_FOUND, ScratchNotebookError
 from scratch_notebook.storage import DEFAULT_TENANT_ID, Storage
+from scratch_notebook.storage_lancedb import _decode_json
 
 
 def _build_config(tmp_path, **overrides):
@@ -135,6 +138,45 @@ def test_replace_cell_with_new_index_reorders(tmp_path) -> None:
     assert updated.cells[2].metadata["tags"] == ["moved"]
 
 
+def test_sequential_replaces_track_moved_cells(tmp_path) -> None:
+    cfg = _build_config(tmp_path)
+    storage = Storage(cfg)
+
+    pad = _make_pad(cell_count=3)
+    storage.create_scratchpad(pad)
+    first_id, second_id, third_id = (cell.cell_id for cell in pad.cells)
+
+    storage.replace_cell(pad.scratch_id, second_id, _make_cell(0, content='{"edit": 1}'))
+    storage.replace_cell(pad.scratch_id, first_id, _make_cell(0), new_index=2)
+    updated = storage.replace_cell(pad.scratch_id, third_id, _make_cell(0, content='{"edit": 2}'))
+
+    assert [cell.cell_id for cell in updated.cells] == [second_id, third_id, first_id]
+    assert json.loads(updated.cells[1].content) == {"edit": 2}
+    assert json.loads(storage.read_scratchpad(pad.scratch_id).cells[0].content) == {"edit": 1}
+
+
+def test_replace_after_undo_with_repeated_timestamp_targets_right_cell(tmp_path, monkeypatch) -> None:
+    cfg = _build_config(tmp_path)
+    storage = Storage(cfg)
+    frozen = storage_lancedb._now()
+    monkeypatch.setattr(storage_lancedb, "_now", lambda: frozen)
+
+    pad = _make_pad(cell_count=3)
+    storage.create_scratchpad(pad)
+    first, second, _ = pad.cells
+    original_first = models.ScratchCell.from_dict(first.to_dict())
+
+    storage.replace_cell(pad.scratch_id, first.cell_id, _make_cell(0), new_index=2)
+    undo = storage.capture_cell_undo(pad.scratch_id, "replace", cell_id=first.cell_id, index=0, cell=original_first)
+    storage.apply_undo(undo)
+    updated = storage.replace_cell(pad.scratch_id, second.cell_id, _make_cell(0, content='{"edit": 1}'))
+
+    assert [cell.cell_id for cell in updated.cells] == [cell.cell_id for cell in pad.cells]
+    stored = storage.read_scratchpad(pad.scratch_id).cells
+    assert stored[0].content == original_first.content
+    assert json.loads(stored[1].content) == {"edit": 1}
+
+
 def test_list_scratchpads_returns_minimal_fields_sorted(tmp_path) -> None:
     cfg = _build_config(tmp_path)
     storage = Storage(cfg)
@@ -221,6 +263,86 @@ def test_storage_persists_across_reopen(tmp_path) -> None:
     assert reloaded.metadata["title"] == "Transient"
 
 
+def test_scratch_id_index_is_built_once_rows_exist(tmp_path) -> None:
+    storage = Storage(_build_config(tmp_path))
+
+    storage.create_scratchpad(_make_pad())
+    storage.create_scratchpad(_make_pad())
+
+    indexed_fields = [index["fields"] for index in storage._table.to_lance().list_indices()]
+    assert indexed_fields.count(["scratch_id"]) == 1
+    # A reopened store finds the index already built.
+    assert Storage(_build_config(tmp_path))._scratch_id_indexed is True
+
+
+def test_compaction_after_deletes_runs_off_the_deleting_thread(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(storage_lancedb, "_COMPACT_AFTER_DELETES", 2)
+    storage = Storage(_build_config(tmp_path))
+    pads = [_make_pad(), _make_pad()]
+    for pad in pads:
+        storage.create_scratchpad(pad)
+    compacted_on: list[threading.Thread] = []
+    monkeypatch.setattr(
+        storage._table, "optimize", lambda: compacted_on.append(threading.current_thread()), raising=False
+    )
+
+    for pad in pads:
+        storage.delete_scratchpad(pad.scratch_id)
+    storage.finish_compaction()
+
+    assert len(compacted_on) == 1
+    assert compacted_on[0] is not threading.current_thread()
+
+
+def test_replace_embeddings_stores_unit_vectors_in_row_order(tmp_path) -> None:
+    storage = Storage(_build_config(tmp_path))
+    pad = _make_pad()
+    storage.create_scratchpad(pad)
+    vectors = [[3.0, 4.0, 0.0], [0.0, 0.0, 0.0], [0.0, -2.0, 0.0], [1.0, 1.0, 1.0]]
+    records = [{"cell_id": f"cell-{idx}", "cell_index": idx, "embedding": vector} for idx, vector in enumerate(vectors)]
+
+    storage.replace_embeddings(pad.scratch_id, records, dimension=3)
+
+    rows = sorted(storage.list_pad_embeddings(pad.scratch_id), key=lambda row: row["cell_index"])
+    stored = [row["embedding"] for row in rows]
+    third = 1 / math.sqrt(3)
+    expected = [[0.6, 0.8, 0.0], [0.0, 0.0, 0.0], [0.0, -1.0, 0.0], [third, third, third]]
+    assert stored == [pytest.approx(vector, abs=1e-6) for vector in expected]
+
+
+def test_json_blobs_roundtrip_numbers_exactly(tmp_path) -> None:
+    cfg = _build_config(tmp_path)
+    storage = Storage(cfg)
+
+    numbers = {"max_u64": 2**64 - 1, "min_i64": -(2**63), "fraction": 0.1, "missing": None}
+    pad = _make_pad(metadata={"numbers": numbers})
+    storage.create_scratchpad(pad)
+
+    assert storage.read_scratchpad(pad.scratch_id).metadata["numbers"] == numbers
+
+
+@pytest.mark.parametrize("value", [2**70, float("nan"), float("inf")])
+def test_json_blobs_roundtrip_values_orjson_cannot_encode(tmp_path, value) -> None:
+    cfg = _build_config(tmp_path)
+    storage = Storage(cfg)
+
+    pad = _make_pad(metadata={"value": value})
+    storage.create_scratchpad(pad)
+
+    stored = storage.read_scratchpad(pad.scratch_id).metadata["value"]
+    if isinstance(value, float) and math.isnan(value):
+        assert math.isnan(stored)
+    else:
+        assert stored == value
+
+
+def test_json_blobs_written_by_stdlib_still_decode_exactly() -> None:
+    decoded = _decode_json(json.dumps({"wide": 2**70, "nan": float("nan")}))
+
+    assert decoded["wide"] == 2**70
+    assert math.isnan(decoded["nan"])
+
+
 def test_schema_registry_roundtrip(tmp_path) -> None:
     cfg = _build_config(tmp_path)
     storage = Storage(cfg)
@@ -326,3 +448,36 @@ def test_migrate_default_tenant_filters_only_default_rows(tmp_path) -> None:
     for pad_id in default_ids:
         assert tenant_map[pad_id] == "tenant-alpha"
     assert tenant_map[other_pad.scratch_id] == "tenant-other"
+
+
+def test_list_scratchpads_cursor_resumes_after_scratch_id(tmp_path) -> None:
+    cfg = _build_config(tmp_path)
+    storage = Storage(cfg)
+
+    for idx in range(5):
+        storage.create_scratchpad(models.Scratchpad(scratch_id=f"pad-{idx}"))
+
+    first_page = storage.list_scratchpads(limit=2)
+    second_page = storage.list_scratchpads(limit=2, cursor=first_page[-1]["scratch_id"])
+    remainder = storage.list_scratchpads(cursor=second_page[-1]["scratch_id"])
+
+    assert [entry["scratch_id"] for entry in first_page] == ["pad-0", "pad-1"]
+    assert [entry["scratch_id"] for entry in second_page] == ["pad-2", "pad-3"]
+    assert [entry["scratch_id"] for entry in remainder] == ["pad-4"]
+
+
+def test_listings_are_scoped_to_active_tenant(tmp_path) -> None:
+    cfg = _build_config(tmp_path)
+    storage = Storage(cfg)
+
+    own_pad = _make_pad(metadata={"namespace": "shared", "tags": ["mine"]})
+    storage.create_scratchpad(own_pad)
+    storage.set_tenant("tenant-other")
+    foreign_pad = _make_pad(metadata={"namespace": "shared", "tags": ["theirs"]})
+    storage.create_scratchpad(foreign_pad)
+    storage.set_tenant(DEFAULT_TENANT_ID)
+
+    listed = storage.list_scratchpads(namespaces=["shared"])
+    assert [entry["scratch_id"] for entry in listed] == [own_pad.scratch_id]
+    assert storage.list_tags()["scratchpad_tags"] == ["mine"]
+    assert storage.list_namespaces() == [{"namespace": "shared", "scratchpad_count": 1}]
@@ -49,7 +49,6 @@ async def _make_pad_with_cells() -> tuple[str, list[str]]:
     return scratch_id, cell_ids
 
 
-@pytest.mark.asyncio
 async def test_list_cells_returns_all_entries(app) -> None:
     scratch_id, cell_ids = await _make_pad_with_cells()
 
@@ -63,7 +62,6 @@ async def test_list_cells_returns_all_entries(app) -> None:
     assert [cell["tags"] for cell in cells] == [["tag-0"], ["tag-1"], ["tag-2"]]
 
 
-@pytest.mark.asyncio
 async def test_list_cells_filters_by_cell_ids(app) -> None:
     scratch_id, cell_ids = await _make_pad_with_cells()
 
@@ -76,7 +74,6 @@ async def test_list_cells_filters_by_cell_ids(app) -> None:
     assert cells[0]["cell_id"] == target
 
 
-@pytest.mark.asyncio
 async def test_list_cells_filters_by_tags(app) -> None:
     scratch_id, cell_ids = await _make_pad_with_cells()
 
@@ -89,7 +86,6 @@ async def test_list_cells_filters_by_tags(app) -> None:
     assert cells[0]["tags"] == ["tag-1"]
 
 
-@pytest.mark.asyncio
 async def test_list_cells_intersection_of_cell_ids_and_tags(app) -> None:
     scratch_id, cell_ids = await _make_pad_with_cells()
 
@@ -105,7 +101,6 @@ async def test_list_cells_intersection_of_cell_ids_and_tags(app) -> None:
     assert cells[0]["cell_id"] == cell_ids[1]
 
 
-@pytest.mark.asyncio
 async def test_list_cells_invalid_cell_id_returns_error(app) -> None:
     scratch_id, _ = await _make_pad_with_cells()
 
@@ -115,7 +110,6 @@ async def test_list_cells_invalid_cell_id_returns_error(app) -> None:
     assert resp["error"]["code"] == "NOT_FOUND"
 
 
-@pytest.mark.asyncio
 async def test_list_cells_invalid_tags_type_returns_error(app) -> None:
     scratch_id, _ = await _make_pad_with_cells()
 
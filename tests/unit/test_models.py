@@ -86,3 +86,21 @@ def test_validation_result_helpers() -> None:
 def test_reject_invalid_language() -> None:
     with pytest.raises(ValueError):
         models.ScratchCell.from_dict(build_cell(language="unsupported"))
+
+
+def test_scratch_cell_equivalence_ignores_position() -> None:
+    payload = build_cell()
+    original = models.ScratchCell.from_dict(payload)
+
+    assert original.equivalent_to(models.ScratchCell.from_dict({**payload, "index": 3}))
+    assert not original.equivalent_to(models.ScratchCell.from_dict({**payload, "content": "[]"}))
+    assert not original.equivalent_to(models.ScratchCell.from_dict({**payload, "metadata": {"title": "other"}}))
+
+
+def test_validation_payload_matches_to_dict() -> None:
+    result = models.ValidationResult(cell_index=1, language="json", cell_id="cell-1")
+    result.add_error("broken", code="E1", details={"line": 1})
+    result.add_warning("careful")
+    result.details["schema_applied"] = False
+
+    assert models.validation_payload([result]) == [result.to_dict()]
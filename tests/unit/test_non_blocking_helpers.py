@@ -5,7 +5,6 @@ import pytest
 from scratch_notebook.validation import run_validation_task
 
 
-@pytest.mark.asyncio
 async def test_validation_helper_uses_executor(monkeypatch: pytest.MonkeyPatch) -> None:
     called = False
 
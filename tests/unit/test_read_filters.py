@@ -51,7 +51,6 @@ async def _create_populated_pad() -> tuple[str, list[str]]:
     return scratch_id, cell_ids
 
 
-@pytest.mark.asyncio
 async def test_read_filters_by_cell_ids(app) -> None:
     scratch_id, cell_ids = await _create_populated_pad()
 
@@ -66,7 +65,6 @@ async def test_read_filters_by_cell_ids(app) -> None:
     assert resp["scratchpad"]["tags"] == ["tag-0", "tag-1", "tag-2"]
 
 
-@pytest.mark.asyncio
 async def test_read_filters_by_cell_ids_custom_order(app) -> None:
     scratch_id, cell_ids = await _create_populated_pad()
 
@@ -79,7 +77,6 @@ async def test_read_filters_by_cell_ids_custom_order(app) -> None:
     assert resp["scratchpad"]["tags"] == ["tag-0", "tag-1", "tag-2"]
 
 
-@pytest.mark.asyncio
 async def test_read_filters_by_cell_ids_and_tags_intersection(app) -> None:
     scratch_id, cell_ids = await _create_populated_pad()
 
@@ -92,7 +89,6 @@ async def test_read_filters_by_cell_ids_and_tags_intersection(app) -> None:
     assert cells[0]["tags"] == ["tag-1"]
 
 
-@pytest.mark.asyncio
 async def test_read_include_metadata_false_omits_metadata(app) -> None:
     scratch_id, _ = await _create_populated_pad()
 
@@ -105,7 +101,6 @@ async def test_read_include_metadata_false_omits_metadata(app) -> None:
     assert all(cell["tags"] == [f"tag-{idx}"] for idx, cell in enumerate(resp["scratchpad"]["cells"]))
 
 
-@pytest.mark.asyncio
 async def test_read_with_invalid_cell_id_returns_error(app) -> None:
     scratch_id, _ = await _create_populated_pad()
 
@@ -115,7 +110,6 @@ async def test_read_with_invalid_cell_id_returns_error(app) -> None:
     assert resp["error"]["code"] == "NOT_FOUND"
 
 
-@pytest.mark.asyncio
 async def test_read_namespace_filter_blocks_mismatch(app) -> None:
     scratch_id, _ = await _create_populated_pad()
 
@@ -125,7 +119,6 @@ async def test_read_namespace_filter_blocks_mismatch(app) -> None:
     assert resp["error"]["code"] == "UNAUTHORIZED"
 
 
-@pytest.mark.asyncio
 async def test_read_namespace_filter_allows_match(app) -> None:
     scratch_id, _ = await _create_populated_pad()
 
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import math
 import uuid
 
+import pyarrow as pa
 import pytest
 
 from scratch_notebook import load_config, models
-from scratch_notebook.search import SearchService
+from scratch_notebook.search import SearchService, _unit_vector
 from scratch_notebook.storage import Storage
+from scratch_notebook.storage_lancedb import _search_metric
 
 
 @pytest.fixture()
@@ -23,7 +26,6 @@ def search_dependencies(tmp_path) -> tuple[SearchService, Storage]:
     return service, storage
 
 
-@pytest.mark.asyncio
 async def test_reindex_and_search_returns_hits(search_dependencies: tuple[SearchService, Storage]) -> None:
     search_service, storage = search_dependencies
     pad = models.Scratchpad(
@@ -71,7 +73,6 @@ async def test_reindex_and_search_returns_hits(search_dependencies: tuple[Search
     assert filtered["hits"] and filtered["hits"][0]["cell_id"] == pad.cells[0].cell_id
 
 
-@pytest.mark.asyncio
 async def test_delete_pad_embeddings_removes_entries(search_dependencies: tuple[SearchService, Storage]) -> None:
     search_service, storage = search_dependencies
     pad = models.Scratchpad(
@@ -105,8 +106,10 @@ def test_search_embeddings_prefilter_applies_before_limit(monkeypatch, tmp_path)
             self.prefilter_flag = False
             self.where_clause: str | None = None
             self.limit_value: int | None = None
+            self.metric_name: str | None = None
 
-        def metric(self, _metric: str):
+        def metric(self, metric: str):
+            self.metric_name = metric
             return self
 
         def where(self, clause: str, prefilter: bool = False):
@@ -118,13 +121,14 @@ def test_search_embeddings_prefilter_applies_before_limit(monkeypatch, tmp_path)
             self.limit_value = value
             return self
 
-        def to_list(self):
+        def to_arrow(self):
             if self.prefilter_flag and self.where_clause and "team-b" in self.where_clause:
-                return [{"scratch_id": "pad-b", "namespace": "team-b", "tags": []}]
-            return [{"scratch_id": "pad-a", "namespace": "team-a", "tags": []}]
+                return pa.Table.from_pylist([{"scratch_id": "pad-b", "namespace": "team-b", "tags": []}])
+            return pa.Table.from_pylist([{"scratch_id": "pad-a", "namespace": "team-a", "tags": []}])
 
     class _FakeEmbeddingTable:
         def __init__(self) -> None:
+            self.schema = pa.schema([pa.field("embedding", pa.list_(pa.float32()))])
             self.last_query: _FakeQuery | None = None
 
         def search(self, *_args, **_kwargs):
@@ -146,3 +150,205 @@ def test_search_embeddings_prefilter_applies_before_limit(monkeypatch, tmp_path)
     assert fake_table.last_query.prefilter_flag is True
     assert fake_table.last_query.limit_value == 1
     assert fake_table.last_query.where_clause and "team-b" in fake_table.last_query.where_clause
+    # A schema without the normalised-embeddings marker is searched as an older, unnormalised table.
+    assert fake_table.last_query.metric_name == "cosine"
+
+
+async def test_stored_embeddings_are_unit_length_and_searched_by_dot_product(
+    search_dependencies: tuple[SearchService, Storage],
+) -> None:
+    search_service, storage = search_dependencies
+    pad = _cached_search_pad(storage)
+    await search_service.reindex_pad(pad)
+
+    table = storage._embeddings_table
+    assert _search_metric(table) == "dot"
+    for vector in table.to_arrow()["embedding"].to_pylist():
+        assert math.isclose(math.hypot(*vector), 1.0, rel_tol=1e-5)
+
+
+async def test_search_reuses_cached_response_until_embeddings_change(
+    search_dependencies: tuple[SearchService, Storage],
+) -> None:
+    search_service, storage = search_dependencies
+    pad = models.Scratchpad(
+        scratch_id=str(uuid.uuid4()),
+        metadata={"title": "Cache", "namespace": "examples"},
+        cells=[
+            models.ScratchCell.from_dict(
+                {"cell_id": str(uuid.uuid4()), "index": 0, "language": "md", "content": "Hello cache"}
+            )
+        ],
+    )
+    storage.create_scratchpad(pad)
+    await search_service.reindex_pad(pad)
+
+    backend = await search_service._get_backend()
+    embed_calls: list[list[str]] = []
+    original_embed = backend.embed
+
+    def _counting_embed(texts, **kwargs):  # noqa: ANN001
+        embed_calls.append(list(texts))
+        return original_embed(texts, **kwargs)
+
+    backend.embed = _counting_embed  # type: ignore[method-assign]
+
+    first = await search_service.search("hello", namespaces=["examples"], limit=5)
+    second = await search_service.search("hello", namespaces=["examples"], limit=5)
+    assert second == first
+    assert len(embed_calls) == 1
+
+    await search_service.search("hello", namespaces=["other"], limit=5)
+    assert len(embed_calls) == 2
+
+    await search_service.delete_pad_embeddings(pad.scratch_id)
+    refreshed = await search_service.search("hello", namespaces=["examples"], limit=5)
+    assert refreshed["hits"] == []
+    assert len(embed_calls) == 3
+
+
+def _cached_search_pad(storage: Storage) -> models.Scratchpad:
+    pad = models.Scratchpad(
+        scratch_id=str(uuid.uuid4()),
+        metadata={"title": "Cache", "namespace": "examples"},
+        cells=[
+            models.ScratchCell.from_dict(
+                {"cell_id": str(uuid.uuid4()), "index": 0, "language": "md", "content": "Hello cache"}
+            )
+        ],
+    )
+    storage.create_scratchpad(pad)
+    return pad
+
+
+def test_embeddings_generation_is_shared_by_storages_on_one_root(
+    search_dependencies: tuple[SearchService, Storage],
+) -> None:
+    search_service, storage = search_dependencies
+    pad = _cached_search_pad(storage)
+    before = storage.embeddings_generation()
+
+    Storage(search_service._config).delete_scratchpad(pad.scratch_id)
+
+    assert storage.embeddings_generation() != before
+
+
+async def test_search_cache_ignores_entries_from_before_a_write_during_embedding(
+    search_dependencies: tuple[SearchService, Storage],
+) -> None:
+    search_service, storage = search_dependencies
+    pad = _cached_search_pad(storage)
+    await search_service.reindex_pad(pad)
+    backend = await search_service._get_backend()
+    [vector] = backend.embed(["hello"], batch_size=1)
+    writes = []
+
+    def _embed_same_vector(texts, **_kwargs):  # noqa: ANN001
+        # Every query is "similar"; the second one deletes the pad while it is being embedded.
+        if texts == ["hi"]:
+            writes.append(storage.delete_scratchpad(pad.scratch_id))
+        return [list(vector) for _ in texts]
+
+    backend.embed = _embed_same_vector  # type: ignore[method-assign]
+    assert (await search_service.search("hello", limit=5))["hits"]
+
+    response = await search_service.search("hi", limit=5)
+
+    assert writes == [True]
+    assert response["hits"] == []
+
+
+async def test_cell_updates_only_embed_changed_documents(search_dependencies: tuple[SearchService, Storage]) -> None:
+    search_service, storage = search_dependencies
+    cells = [
+        models.ScratchCell.from_dict(
+            {"cell_id": str(uuid.uuid4()), "index": idx, "language": "md", "content": f"Cell {idx}"}
+        )
+        for idx in range(3)
+    ]
+    pad = models.Scratchpad(scratch_id=str(uuid.uuid4()), metadata={"namespace": "delta"}, cells=cells)
+    storage.create_scratchpad(pad)
+    await search_service.reindex_pad(pad)
+
+    backend = await search_service._get_backend()
+    embedded: list[list[str]] = []
+    original_embed = backend.embed
+
+    def _recording_embed(texts, **kwargs):  # noqa: ANN001
+        embedded.append(list(texts))
+        return original_embed(texts, **kwargs)
+
+    backend.embed = _recording_embed  # type: ignore[method-assign]
+
+    appended = models.ScratchCell.from_dict(
+        {"cell_id": str(uuid.uuid4()), "index": 0, "language": "md", "content": "Appended cell"}
+    )
+    updated = storage.append_cell(pad.scratch_id, appended)
+    await search_service.upsert_cell(updated, appended)
+    assert len(embedded) == 1 and len(embedded[0]) == 2
+    assert "Appended cell" in embedded[0]
+
+    rows = storage.list_pad_embeddings(pad.scratch_id)
+    assert len(rows) == len(updated.cells) + 1
+
+    original = updated.cells[0]
+    retagged = models.ScratchCell.from_dict({**original.to_dict(), "metadata": {"tags": ["moved"]}})
+    updated = storage.replace_cell(pad.scratch_id, original.cell_id, retagged, new_index=2)
+    await search_service.replace_cell(updated, original, retagged)
+    # The move reorders the pad document's text, so only that document is embedded again.
+    pad_text = "\n".join(cell.content for cell in updated.cells)
+    assert embedded[1:] == [[pad_text]]
+
+    rows = storage.list_pad_embeddings(pad.scratch_id)
+    moved = next(row for row in rows if row["cell_id"] == original.cell_id)
+    assert moved["cell_index"] == 2
+    assert "moved" in moved["tags"]
+    pad_row = next(row for row in rows if row["cell_id"] is None)
+    expected = _unit_vector((await search_service.embed_batch([pad_text]))[0])
+    assert pad_row["embedding"] == pytest.approx(expected, abs=1e-6)
+
+
+async def test_search_without_hits_returns_independent_empty_responses(
+    search_dependencies: tuple[SearchService, Storage],
+) -> None:
+    search_service, _ = search_dependencies
+
+    first = await search_service.search("nothing indexed yet")
+    second = await search_service.search("still nothing")
+
+    assert first == {"ok": True, "hits": [], "embedder": first["embedder"]}
+    assert second == first
+    first["embedder"] = "mutated"
+    first["hits"].append({"scratch_id": "mutated"})
+    assert second["embedder"] != "mutated"
+    assert second["hits"] == []
+
+
+async def test_unsearchable_cells_are_not_embedded(search_dependencies: tuple[SearchService, Storage]) -> None:
+    search_service, storage = search_dependencies
+    visible = models.ScratchCell.from_dict(
+        {"cell_id": str(uuid.uuid4()), "index": 0, "language": "md", "content": "Public plan"}
+    )
+    hidden = models.ScratchCell.from_dict(
+        {
+            "cell_id": str(uuid.uuid4()),
+            "index": 1,
+            "language": "txt",
+            "content": "api-token-123",
+            "metadata": {"searchable": False},
+        }
+    )
+    pad = models.Scratchpad(scratch_id=str(uuid.uuid4()), metadata={"namespace": "hidden"}, cells=[visible, hidden])
+    storage.create_scratchpad(pad)
+    await search_service.reindex_pad(pad)
+
+    rows = storage.list_pad_embeddings(pad.scratch_id)
+    assert {row["cell_id"] for row in rows} == {None, visible.cell_id}
+    assert all("api-token-123" not in (row.get("snippet") or "") for row in rows)
+
+    hidden_visible = models.ScratchCell.from_dict({**visible.to_dict(), "metadata": {"searchable": False}})
+    updated = storage.replace_cell(pad.scratch_id, visible.cell_id, hidden_visible)
+    await search_service.replace_cell(updated, visible, hidden_visible)
+
+    rows = storage.list_pad_embeddings(pad.scratch_id)
+    assert [row["cell_id"] for row in rows] == [None]
@@ -6,7 +6,7 @@ from pathlib import Path
 
 import pytest
 
-from scratch_notebook import load_config
+from scratch_notebook import load_config, models, server, storage_lancedb
 from scratch_notebook.errors import CONFIG_ERROR
 from scratch_notebook.server import (
     _SHUTDOWN_MANAGER,
@@ -16,7 +16,6 @@ from scratch_notebook.server import (
 )
 
 
-@pytest.mark.asyncio
 async def test_requests_rejected_once_shutdown_starts(tmp_path: Path) -> None:
     config = load_config(argv=["--storage-dir", str(tmp_path / "storage")])
     initialize_app(config)
@@ -56,3 +55,27 @@ def test_shutdown_waits_for_inflight_requests(tmp_path: Path) -> None:
         if not released:
             release()
         thread.join(timeout=1)
+
+
+def test_shutdown_waits_for_running_compaction(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(storage_lancedb, "_COMPACT_AFTER_DELETES", 1)
+    config = load_config(argv=["--storage-dir", str(tmp_path / "storage")])
+    initialize_app(config)
+    storage = server.APP_STATE.storage
+    finish = threading.Event()
+    monkeypatch.setattr(storage._table, "optimize", lambda: finish.wait(timeout=5), raising=False)
+    pad = models.Scratchpad(scratch_id="compacted", cells=[], metadata={})
+    storage.create_scratchpad(pad)
+    storage.delete_scratchpad(pad.scratch_id)
+
+    thread = threading.Thread(target=shutdown_app)
+    thread.start()
+    try:
+        time.sleep(0.05)
+        assert thread.is_alive()
+        finish.set()
+        thread.join(timeout=1)
+        assert not thread.is_alive()
+    finally:
+        finish.set()
+        thread.join(timeout=1)
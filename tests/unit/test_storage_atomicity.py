@@ -88,3 +88,56 @@ def test_capacity_violation_does_not_create_new_pad(tmp_path) -> None:
     assert pads[0]["scratch_id"] == first.scratch_id
     # ensure second file does not exist
     assert storage.has_scratchpad(second.scratch_id) is False
+
+
+def test_apply_undo_reverts_single_cell_mutations(tmp_path) -> None:
+    cfg = _build_config(tmp_path)
+    storage = Storage(cfg)
+
+    pad = _make_pad(cell_count=2)
+    storage.create_scratchpad(pad)
+    original = storage.read_scratchpad(pad.scratch_id)
+
+    appended = _make_cell(content='{"new": true}')
+    append_undo = storage.capture_cell_undo(pad.scratch_id, "append", cell_id=appended.cell_id)
+    storage.append_cell(pad.scratch_id, appended)
+    storage.apply_undo(append_undo)
+    assert [cell.cell_id for cell in storage.read_scratchpad(pad.scratch_id).cells] == [
+        cell.cell_id for cell in original.cells
+    ]
+
+    existing = original.cells[0]
+    replace_undo = storage.capture_cell_undo(
+        pad.scratch_id,
+        "replace",
+        cell_id=existing.cell_id,
+        index=existing.index,
+        cell=existing,
+    )
+    storage.replace_cell(pad.scratch_id, existing.cell_id, _make_cell(content='{"changed": 1}'), new_index=1)
+    storage.apply_undo(replace_undo)
+
+    restored = storage.read_scratchpad(pad.scratch_id)
+    assert [cell.cell_id for cell in restored.cells] == [cell.cell_id for cell in original.cells]
+    assert restored.cells[0].content == existing.content
+    assert [cell.index for cell in restored.cells] == [0, 1]
+
+
+def test_apply_undo_keeps_the_pad_with_its_tenant(tmp_path) -> None:
+    cfg = _build_config(tmp_path)
+    storage = Storage(cfg, tenant_id="alice")
+
+    pad = _make_pad(cell_count=1)
+    storage.create_scratchpad(pad)
+    appended = _make_cell(content='{"new": true}')
+    undo = storage.capture_cell_undo(pad.scratch_id, "append", cell_id=appended.cell_id)
+    storage.append_cell(pad.scratch_id, appended)
+
+    storage.set_tenant("bob")
+    storage.apply_undo(undo)
+
+    assert storage.tenant_id() == "bob"
+    assert storage.list_scratchpads() == []
+    storage.set_tenant("alice")
+    assert [entry["scratch_id"] for entry in storage.list_scratchpads()] == [pad.scratch_id]
+    assert len(storage.read_scratchpad(pad.scratch_id).cells) == 1
@@ -85,3 +85,11 @@ def test_empty_storage_dir_in_config_file_raises(tmp_path: Path) -> None:
 
     with pytest.raises(ConfigError):
         load_config(argv=["--config-file", str(config_path)])
+
+
+def test_validation_max_concurrency_flag(tmp_path: Path) -> None:
+    cfg = load_config(argv=_base_args(tmp_path, "--validation-max-concurrency", "4"), environ={})
+    assert cfg.validation_max_concurrency == 4
+
+    with pytest.raises(ConfigError):
+        load_config(argv=_base_args(tmp_path, "--validation-max-concurrency", "0"), environ={})
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from dataclasses import FrozenInstanceError
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
 
 import pytest
@@ -28,6 +30,11 @@ def test_describe_routes_respects_toggles() -> None:
     assert routes["sse"] == "/sse"
     assert routes["metrics"] == "/metrics"
 
+    # The routes are derived once, so the fields they come from cannot change afterwards.
+    with pytest.raises(FrozenInstanceError):
+        config.enable_http = True  # type: ignore[misc]
+    assert describe_routes(config) == routes
+
 
 @pytest.mark.parametrize("socket_path", [None, Path("/tmp/mock.sock")])
 def test_run_http_invokes_uvicorn(monkeypatch: pytest.MonkeyPatch, socket_path: Path | None) -> None:
@@ -75,3 +82,34 @@ def test_run_http_invokes_uvicorn(monkeypatch: pytest.MonkeyPatch, socket_path:
     assert captured["served"] is True
     assert getattr(captured["app"].state, "fastmcp_server") is server
     assert captured["app"].state.path == "/http"
+
+
+@pytest.mark.parametrize("has_uvloop", [False, True])
+def test_run_http_passes_loop_factory_only_with_uvloop(monkeypatch: pytest.MonkeyPatch, has_uvloop: bool) -> None:
+    calls: list[dict[str, Any]] = []
+
+    def fake_run(coro, **kwargs):
+        coro.close()
+        calls.append(kwargs)
+
+    def new_event_loop():  # stands in for uvloop.new_event_loop
+        raise AssertionError("loop factory must not be called by the fake run")
+
+    fake_uvloop = SimpleNamespace(new_event_loop=new_event_loop) if has_uvloop else None
+    monkeypatch.setattr("scratch_notebook.transports.http.uvloop", fake_uvloop)
+    monkeypatch.setattr("scratch_notebook.transports.http.asyncio.run", fake_run)
+
+    config = HttpTransportConfig(
+        host="127.0.0.1",
+        port=0,
+        http_path="/http",
+        sse_path="/sse",
+        metrics_path="/metrics",
+        enable_metrics=False,
+        enable_http=True,
+        enable_sse=False,
+    )
+
+    run_http(FastMCP(name="test-http-loop"), config)
+
+    assert calls == ([{"loop_factory": new_event_loop}] if has_uvloop else [{}])
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import types
 import uuid
 
 import pytest
 
 from scratch_notebook import models
-from scratch_notebook.validation import JSON_SCHEMA_SKIPPED_MESSAGE, NOT_VALIDATED_MESSAGE, validate_cell
+from scratch_notebook import validation as validation_module
+from scratch_notebook.validation import JSON_SCHEMA_SKIPPED_MESSAGE, NOT_VALIDATED_MESSAGE, validate_cell, validate_cells
 
 
 def _cell(language: str, content: str, **kwargs) -> models.ScratchCell:
@@ -56,3 +58,98 @@ def test_plain_text_validation_includes_reason_detail() -> None:
     assert result.valid is True
     assert any(NOT_VALIDATED_MESSAGE in warning["message"] for warning in result.warnings)
     assert result.details.get("reason") == "Plain text does not require validation"
+
+
+async def test_validate_cells_parallel_preserves_order() -> None:
+    cells = [_cell("json", f"{{\"value\": {idx}}}") for idx in range(5)]
+    cells.append(_cell("json", "{broken"))
+
+    results = await validate_cells(cells, max_concurrency=3)
+
+    assert [result.cell_id for result in results] == [cell.cell_id for cell in cells]
+    assert [result.valid for result in results] == [True] * 5 + [False]
+
+
+async def test_validate_cells_normalizes_shared_schemas_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = 0
+    original = validation_module._normalize_schema_registry
+
+    def _counting(schemas):  # type: ignore[no-untyped-def]
+        nonlocal calls
+        calls += 1
+        return original(schemas)
+
+    monkeypatch.setattr(validation_module, "_normalize_schema_registry", _counting)
+    # A unique title keeps the prepared-schema cache from answering for an earlier test.
+    schemas = {"shared": {"type": "object", "title": uuid.uuid4().hex}}
+    cells = [_cell("json", "{}", json_schema={"$ref": "scratchpad://schemas/shared"}) for _ in range(4)]
+
+    results = await validate_cells(cells, schemas=schemas)
+
+    assert calls == 1
+    assert len(results) == 4
+
+
+def test_plain_cells_skip_shared_schema_preparation(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _unexpected(_schemas):  # type: ignore[no-untyped-def]
+        raise AssertionError("shared schemas should not be prepared for plain text")
+
+    monkeypatch.setattr(validation_module, "_prepare_schemas", _unexpected)
+
+    result = validate_cell(_cell("txt", "notes"), schemas={"shared": {"type": "object"}})
+
+    assert result.valid is True
+
+
+async def test_validate_cells_uses_one_worker_call_when_sequential(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = 0
+    original = validation_module.asyncio.to_thread
+
+    async def _counting_to_thread(func, *args, **kwargs):  # type: ignore[no-untyped-def]
+        nonlocal calls
+        calls += 1
+        return await original(func, *args, **kwargs)
+
+    monkeypatch.setattr(validation_module.asyncio, "to_thread", _counting_to_thread)
+    cells = [_cell("json", f"{{\"value\": {idx}}}") for idx in range(4)]
+
+    results = await validate_cells(cells)
+
+    assert calls == 1
+    assert [result.cell_id for result in results] == [cell.cell_id for cell in cells]
+
+
+async def test_validate_cells_batches_cheap_cells_under_concurrency(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = 0
+    original = validation_module.asyncio.to_thread
+
+    async def _counting_to_thread(func, *args, **kwargs):  # type: ignore[no-untyped-def]
+        nonlocal calls
+        calls += 1
+        return await original(func, *args, **kwargs)
+
+    monkeypatch.setattr(validation_module.asyncio, "to_thread", _counting_to_thread)
+    monkeypatch.setattr(validation_module, "_resolve_syntax_checker", lambda: lambda **_kwargs: {"valid": True})
+    cells = [_cell("json", "{}"), _cell("py", "x = 1"), _cell("md", "# notes"), _cell("py", "y = 2")]
+
+    results = await validate_cells(cells, max_concurrency=16)
+
+    # One call for the JSON and markdown batch, one per code cell.
+    assert calls == 3
+    assert [result.cell_id for result in results] == [cell.cell_id for cell in cells]
+
+
+async def test_validate_cells_parallel_path_stops_at_deadline(monkeypatch: pytest.MonkeyPatch) -> None:
+    checked: list[str] = []
+    clock = iter([0.0])
+    # The first reading sets the deadline; every later one is past it.
+    monkeypatch.setattr(validation_module, "time", types.SimpleNamespace(monotonic=lambda: next(clock, 60.0)))
+    monkeypatch.setattr(
+        validation_module, "_resolve_syntax_checker", lambda: lambda **kwargs: checked.append(kwargs["code"])
+    )
+    cells = [_cell("py", f"x = {idx}") for idx in range(4)]
+
+    with pytest.raises(TimeoutError):
+        await validate_cells(cells, timeout=30, max_concurrency=4)
+
+    assert checked == []
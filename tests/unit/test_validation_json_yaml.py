@@ -133,7 +133,7 @@ def test_json_schema_references_warn_when_registry_support_missing(monkeypatch:
 
     monkeypatch.setattr(validation_module, "Registry", None, raising=False)
     monkeypatch.setattr(validation_module, "Resource", None, raising=False)
-    monkeypatch.setattr(validation_module, "_referencing_missing_logged", False, raising=False)
+    validation_module._log_once.cache_clear()
 
     result = validate_cell(cell, schemas=schemas)
 
@@ -143,3 +143,68 @@ def test_json_schema_references_warn_when_registry_support_missing(monkeypatch:
         for message in warning_messages
     )
     assert result.errors == []
+
+
+def test_json_schema_compilation_is_cached_across_cells() -> None:
+    pytest.importorskip("jsonschema")
+    schema = {"type": "object", "properties": {"cached": {"type": "boolean"}}, "required": ["cached"]}
+    validation_module._compile_schema.cache_clear()
+
+    first = validate_cell(_make_cell("json", "{\"cached\": true}", json_schema=schema))
+    second = validate_cell(_make_cell("json", "{\"cached\": 1}", json_schema=dict(schema)))
+
+    assert first.valid is True
+    assert second.valid is False
+    info = validation_module._compile_schema.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
+def test_compiled_validator_instance_is_shared() -> None:
+    pytest.importorskip("jsonschema")
+    schema = {"type": "object", "properties": {"shared": {"type": "string"}}}
+
+    first = validation_module._compiled_validator(schema)
+    second = validation_module._compiled_validator({"properties": {"shared": {"type": "string"}}, "type": "object"})
+
+    assert first is second
+
+
+def test_json_validation_accepts_documents_outside_orjson_range() -> None:
+    cell = _make_cell("json", "{\"big\": 123456789012345678901234567890, \"nan\": NaN}")
+
+    result = validate_cell(cell)
+
+    assert result.valid is True
+
+
+def test_json_schema_sees_wide_integers_exactly() -> None:
+    schema = {"type": "object", "properties": {"big": {"type": "integer", "maximum": 18446744073709551616}}}
+    cell = _make_cell("json", "{\"big\": 18446744073709551617}", json_schema=schema)
+
+    result = validate_cell(cell)
+
+    assert result.valid is False
+
+
+def test_prepared_schemas_are_reused_for_equal_registries() -> None:
+    schemas = {"shared": {"type": "object", "properties": {"value": {"type": "integer"}}}}
+
+    first = validation_module._prepare_schemas(schemas)
+    second = validation_module._prepare_schemas({"shared": {"properties": {"value": {"type": "integer"}}, "type": "object"}})
+    schemas["shared"]["type"] = "array"
+
+    assert first is second
+    assert first.registry["shared"]["type"] == "object"
+
+
+def test_shared_reference_validator_is_bound_once_per_registry() -> None:
+    pytest.importorskip("jsonschema")
+    pytest.importorskip("referencing")
+    schemas = {"bound": {"type": "object", "required": ["value"]}}
+    prepared = validation_module._prepare_schemas(schemas)
+    validator = validation_module._compiled_validator({"$ref": "scratchpad://schemas/bound"})
+    registry = prepared.referencing_registry()
+
+    assert prepared.bind(validator, registry) is prepared.bind(validator, registry)
+    assert validate_cell(_make_cell("json", "{}", json_schema={"$ref": "scratchpad://schemas/bound"}), schemas=schemas).valid is False